@@ -1,54 +1,286 @@
 """Flask Web Application for Decision Making Toolkit"""
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import (Flask, Response, g, make_response, render_template, request, jsonify, redirect, url_for,
+                   stream_with_context)
 import json
-from frameworks import (
-    SevenSFramework, VPCFramework, StrategicInflectionFramework,
-    GameTheoryFramework, RiskRewardFramework, CynefinFramework
-)
+import os
+import time
+from frameworks.metrics import METRICS
+from frameworks.registry import FrameworkRegistry
+from frameworks.simulation import simulate
+from frameworks.portfolio import optimize_portfolio
+from frameworks.pareto import frontier_layers
+from frameworks.result_cache import ResultCache
 from cli.decision_manager import DecisionManager
+from cli.storage import VersionConflict, decision_version
+from cli.batch import BatchRunner, iter_json_lines
+from cli.profiling import RequestProfiler, format_stats
+from cli.http_cache import (ENCODINGS, FragmentCache, coded_etags, compress, last_modified, strip_coding,
+                            template_fingerprint)
 
 app = Flask(__name__)
-decision_manager = DecisionManager("data")
-
-# Available frameworks
-FRAMEWORKS = {
-    '7s': SevenSFramework(),
-    'vpc': VPCFramework(),
-    'strategic': StrategicInflectionFramework(),
-    'game': GameTheoryFramework(),
-    'risk': RiskRewardFramework(),
-    'cynefin': CynefinFramework()
-}
+# DECISION_WRITE_MODE=buffered coalesces framework runs and writes them in groups (see README)
+decision_manager = DecisionManager(
+    "data",
+    cache_size=int(os.environ.get('DECISION_CACHE_SIZE', 256)),
+    write_behind=os.environ.get('DECISION_WRITE_MODE', 'immediate') == 'buffered',
+    flush_interval=float(os.environ.get('DECISION_FLUSH_INTERVAL', 0.5)),
+    flush_size=int(os.environ.get('DECISION_FLUSH_SIZE', 100)),
+    fsync=os.environ['DECISION_FSYNC'] not in ('0', 'false', 'no') if 'DECISION_FSYNC' in os.environ else None
+)
+
+# Available frameworks, imported and instantiated on first use
+FRAMEWORKS = FrameworkRegistry()
+
+# Memoize framework results; set RESULT_CACHE_DIR to share a disk tier between workers
+RESULT_CACHE = ResultCache(
+    max_entries=int(os.environ.get('RESULT_CACHE_SIZE', 1024)),
+    ttl=float(os.environ.get('RESULT_CACHE_TTL', 3600)),
+    disk_dir=os.environ.get('RESULT_CACHE_DIR') or None,
+    max_disk_entries=int(os.environ.get('RESULT_CACHE_DISK_SIZE', 100000))
+)
+FRAMEWORKS.on_load(lambda framework: setattr(framework, 'cache', RESULT_CACHE))
+
+# Rendered pages keyed by decision version or listing stamp; FRAGMENT_CACHE_SIZE=0 disables
+FRAGMENT_CACHE = FragmentCache(max_entries=int(os.environ.get('FRAGMENT_CACHE_SIZE', 512)))
+# JSON and HTML bodies at least this large are compressed when the client accepts it
+COMPRESS_MIN_BYTES = int(os.environ.get('COMPRESS_MIN_BYTES', 1024))
+COMPRESS_MIMETYPES = ('application/json', 'text/html')
+
+MAX_SIMULATION_SAMPLES = 1000000
+DASHBOARD_PAGE_SIZE = 24
+MAX_LIST_LIMIT = 500
+MAX_BATCH_ROWS = int(os.environ.get('MAX_BATCH_ROWS', 100000))
+BATCH_CHUNK_SIZE = 500
+
+# Opt-in request profiling: PROFILE_REQUESTS is the sampled fraction of requests (0 profiles
+# only requests sent with an X-Profile header); unset disables profiling and /admin/profiles.
+# Profiles expose code paths and timings, so PROFILE_TOKEN is required to enable it.
+PROFILER = None
+if os.environ.get('PROFILE_REQUESTS') is not None:
+    if not os.environ.get('PROFILE_TOKEN'):
+        raise RuntimeError("PROFILE_REQUESTS requires PROFILE_TOKEN to be set")
+    PROFILER = RequestProfiler(
+        sample_rate=float(os.environ['PROFILE_REQUESTS']),
+        keep=int(os.environ.get('PROFILE_KEEP', 20)),
+        token=os.environ['PROFILE_TOKEN']
+    )
+
+REQUEST_SECONDS = METRICS.histogram('http_request_duration_seconds', 'Flask request latency',
+                                    ('method', 'route', 'status'))
+REQUEST_EXCEPTIONS = METRICS.counter('http_request_exceptions_total', 'Requests that raised an unhandled exception',
+                                     ('method', 'route'))
+
+def _route():
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+@app.before_request
+def _start_request_timer():
+    if PROFILER is not None and not request.path.startswith('/admin/') and PROFILER.wants(request.headers):
+        g.profiler = PROFILER.start()
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def _record_request(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        REQUEST_SECONDS.observe(elapsed, (request.method, _route(), str(response.status_code)))
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            info = {'method': request.method, 'path': request.full_path.rstrip('?'),
+                    'route': _route(), 'status': response.status_code}
+            profile_id = PROFILER.new_id()
+            response.headers['X-Profile-Id'] = str(profile_id)
+            if response.is_streamed:
+                # The body is produced after this hook, so keep profiling until it has been sent
+                response.call_on_close(lambda: PROFILER.finish(
+                    profiler, dict(info, duration_ms=round((time.perf_counter() - started) * 1000, 3)), profile_id))
+            else:
+                PROFILER.finish(profiler, dict(info, duration_ms=round(elapsed * 1000, 3)), profile_id)
+    return response
+
+@app.after_request
+def _compress_response(response):
+    """Compress large JSON and HTML bodies with the best coding the client accepts
+
+    Registered after _record_request, so it runs first and its time is included.
+    """
+    if response.mimetype not in COMPRESS_MIMETYPES or response.direct_passthrough or response.is_streamed:
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or 'Content-Encoding' in response.headers
+            or (response.content_length or 0) < COMPRESS_MIN_BYTES):
+        return response
+    encoding = request.accept_encodings.best_match(ENCODINGS)
+    if encoding is None:
+        return response
+    response.set_data(compress(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag is not None:
+        response.set_etag(f'{etag}-{encoding}', weak)
+    return response
+
+@app.teardown_request
+def _record_exception(error):
+    if error is not None:
+        REQUEST_EXCEPTIONS.inc((request.method, _route()))
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+
+def _cache_metrics():
+    """Cache sizes and hit ratios, read from the caches when /metrics is scraped"""
+    caches = [('result_cache', {}, RESULT_CACHE.stats()),
+              ('decision_cache', {'backend': decision_manager.backend}, decision_manager.cache_stats()),
+              ('fragment_cache', {}, FRAGMENT_CACHE.stats())]
+    for name, labels, stats in caches:
+        yield f'{name}_entries', 'gauge', 'Entries currently cached', [(f'{name}_entries', labels, stats['entries'])]
+        yield f'{name}_bytes', 'gauge', 'Approximate size of cached entries', [(f'{name}_bytes', labels, stats['bytes'])]
+        yield (f'{name}_hit_ratio', 'gauge', 'Hits over lookups since start-up',
+               [(f'{name}_hit_ratio', labels, stats['hit_rate'])])
+        yield (f'{name}_evictions_total', 'counter', 'Entries evicted to stay within limits',
+               [(f'{name}_evictions_total', labels, stats['evictions'])])
+
+METRICS.add_collector(_cache_metrics)
+
+def _expected_version():
+    """Decision version named by the request's If-Match header, or None if unconditional"""
+    if not request.if_match or request.if_match.star_tag:
+        return None
+    tags = {strip_coding(tag) for tag in request.if_match.as_set()}
+    if len(tags) != 1 or not next(iter(tags)).isdigit():
+        raise ValueError('If-Match must name a single decision ETag')
+    return int(next(iter(tags)))
+
+_template_tag = None
+
+def _page_tag():
+    """Fingerprint of the templates, part of page ETags so a deploy never answers 304 with an old page"""
+    global _template_tag
+    if _template_tag is None or app.debug:
+        loader = app.jinja_env.loader
+        _template_tag = template_fingerprint(loader.get_source(app.jinja_env, name)[0]
+                                             for name in sorted(loader.list_templates()))
+    return _template_tag
+
+def _set_validators(response, etag, modified=None):
+    response.set_etag(etag)
+    if modified is not None:
+        response.last_modified = modified
+    # Revalidate on every use rather than reuse heuristically based on Last-Modified
+    response.cache_control.no_cache = True
+    return response
+
+def _not_modified(etag, modified=None):
+    """A 304 response if the client's copy (in any content coding) is current, else None
+
+    If-None-Match takes precedence over If-Modified-Since, whose one-second resolution
+    can miss a quick second write.
+    """
+    if request.if_none_match:
+        matched = next((tag for tag in coded_etags(etag) if request.if_none_match.contains_weak(tag)), None)
+        if matched is None:
+            return None
+    elif modified is None or request.if_modified_since is None or modified > request.if_modified_since:
+        return None
+    else:
+        matched = etag
+    return _set_validators(Response(status=304), matched, modified)
+
+def _expand_framework(record):
+    """Stored framework entry with the visualizations its framework derives on read rebuilt"""
+    key = FRAMEWORKS.key_for(record['name'])
+    return FRAMEWORKS[key].expand_record(record) if key is not None else record
+
+def _listing_options(args, default_limit):
+    """Translate query-string parameters into DecisionManager listing options"""
+    framework = args.get('framework') or None
+    if framework in FRAMEWORKS:
+        framework = FRAMEWORKS.spec(framework).name
+    return {
+        'limit': min(args.get('limit', default_limit, type=int), MAX_LIST_LIMIT),
+        'offset': args.get('offset', 0, type=int),
+        'cursor': args.get('cursor') or None,
+        'sort': args.get('sort', 'created_at'),
+        'descending': args.get('order', 'desc') != 'asc',
+        'framework': framework,
+        'created_after': args.get('created_after') or None,
+        'created_before': args.get('created_before') or None,
+        'text_prefix': args.get('prefix') or None
+    }
 
 @app.route('/')
 def index():
     """Main dashboard"""
-    decisions = decision_manager.list_decisions()
-    return render_template('index.html', decisions=decisions, frameworks=FRAMEWORKS)
+    stamp = decision_manager.listing_stamp()
+    if stamp is None:
+        try:
+            return _render_index()
+        except ValueError:
+            return redirect(url_for('index'))
+    
+    etag = f'{stamp}-{_page_tag()}'
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    try:
+        html = FRAGMENT_CACHE.render(('index', stamp, request.full_path), _render_index)
+    except ValueError:
+        return redirect(url_for('index'))
+    return _set_validators(make_response(html), etag)
+
+def _render_index():
+    page = max(request.args.get('page', 1, type=int), 1)
+    options = _listing_options(request.args, DASHBOARD_PAGE_SIZE)
+    options.update(limit=DASHBOARD_PAGE_SIZE, offset=(page - 1) * DASHBOARD_PAGE_SIZE, cursor=None)
+    listing = decision_manager.query_decisions(**options)
+    
+    pages = max(1, -(-listing['total'] // DASHBOARD_PAGE_SIZE))
+    filters = {key: value for key, value in request.args.items() if key != 'page' and value}
+    return render_template('index.html', decisions=listing['decisions'], frameworks=FRAMEWORKS.specs(),
+                         total=listing['total'], page=page, pages=pages, filters=filters)
 
 @app.route('/create_decision', methods=['GET', 'POST'])
 def create_decision():
     """Create new decision"""
     if request.method == 'POST':
         decision_text = request.form['decision_text']
-        slug = decision_manager.create_decision_slug(decision_text)
-        decision_manager.save_decision(decision_text, [])
+        slug = decision_manager.save_decision(decision_text, [])
         return redirect(url_for('decision_detail', slug=slug))
     
     return render_template('create_decision.html')
 
 @app.route('/decision/<slug>')
 def decision_detail(slug):
-    """Decision detail page"""
-    try:
-        data = decision_manager.load_decision(slug)
-        return render_template('decision_detail.html', 
-                             decision=data, 
-                             frameworks=FRAMEWORKS,
+    """Decision detail page, answered from the revision and the rendered page cache while unchanged"""
+    revision = decision_manager.revision(slug)
+    html = None
+    if revision is not None:
+        version, modified = revision[0], last_modified(revision[1])
+        not_modified = _not_modified(f'{version}-{_page_tag()}', modified)
+        if not_modified is not None:
+            return not_modified
+        html = FRAGMENT_CACHE.get(('decision_detail', slug, version))
+    
+    if html is None:
+        try:
+            # Full results are fetched per framework from api_decision_framework when expanded
+            data = decision_manager.load_summary(slug)
+        except FileNotFoundError:
+            return "Decision not found", 404
+        frameworks = FRAMEWORKS.specs()
+        html = render_template('decision_detail.html',
+                             decision=data,
+                             frameworks=frameworks,
+                             framework_keys={spec.name: key for key, spec in frameworks.items()},
                              slug=slug)
-    except FileNotFoundError:
-        return "Decision not found", 404
+        version, modified = decision_version(data), last_modified(data['decision'].get('last_updated'))
+        # Only cached when the revision could be checked, i.e. the file was not edited behind the index
+        if revision is not None:
+            FRAGMENT_CACHE.put(('decision_detail', slug, version), html)
+    return _set_validators(make_response(html), f'{version}-{_page_tag()}', modified)
 
 @app.route('/decision/<slug>/framework/<framework_key>')
 def run_framework(slug, framework_key):
@@ -74,6 +306,11 @@ def api_run_framework(slug, framework_key):
     framework = FRAMEWORKS[framework_key]
     inputs = request.json
     
+    try:
+        expected_version = _expected_version()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
     try:
         # Convert string numbers to float for score fields
         for key, value in inputs.items():
@@ -94,34 +331,262 @@ def api_run_framework(slug, framework_key):
         # Remove empty string values
         inputs = {k: v for k, v in inputs.items() if v != ''}
         
-        framework.set_inputs(inputs)
-        result = framework.execute()
+        result = framework.evaluate(inputs)
         
         # Save results
-        framework_data = framework.to_dict()
-        decision_manager.update_decision(slug, framework_data)
+        framework_data = framework.build_record(inputs, result)
+        version = decision_manager.update_decision(slug, framework_data, expected_version)
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'result': result.__dict__
+            'result': result.__dict__,
+            'version': version
         })
+        # Buffered updates have no version until they are written
+        if version is not None:
+            response.set_etag(str(version))
+        return response
     
+    except VersionConflict as e:
+        response = jsonify({'success': False, 'error': str(e), 'version': e.current})
+        response.set_etag(str(e.current))
+        return response, 412
     except Exception as e:
-        print(f"Error in API: {e}")  # Debug print
-        print(f"Inputs received: {inputs}")  # Debug print
+        app.logger.warning("Running %s on %s failed: %s", framework_key, slug, e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
+@app.route('/api/simulate/<framework_key>', methods=['POST'])
+def api_simulate_framework(framework_key):
+    """API endpoint for Monte Carlo simulation over uncertain inputs"""
+    if framework_key not in FRAMEWORKS:
+        return jsonify({'error': 'Framework not found'}), 404
+    
+    body = request.json or {}
+    
+    try:
+        n_samples = min(int(body.get('n_samples', 10000)), MAX_SIMULATION_SAMPLES)
+        result = simulate(FRAMEWORKS[framework_key], body.get('inputs', {}),
+                          n_samples=n_samples, seed=body.get('seed'))
+        return jsonify({'success': True, 'result': result.to_dict()})
+    except (ValueError, KeyError, TypeError, NotImplementedError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/portfolio', methods=['POST'])
+def api_optimize_portfolio():
+    """API endpoint to select the best set of Risk-Reward options within a budget"""
+    body = request.json or {}
+    
+    try:
+        result = optimize_portfolio(
+            body['options'], float(body['budget']),
+            objective=body.get('objective', 'expected_value'),
+            max_risk_level=body.get('max_risk_level'),
+            max_total_risk=body.get('max_total_risk')
+        )
+        return jsonify({'success': True, 'result': result.to_dict()})
+    except (ValueError, KeyError, TypeError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/frontier', methods=['POST'])
+def api_frontier():
+    """API endpoint for Pareto frontier layers across Risk-Reward options"""
+    body = request.json or {}
+    
+    try:
+        result = frontier_layers(body['options'], criteria=body.get('criteria'),
+                                 max_layers=body.get('max_layers'))
+        return jsonify({'success': True, 'result': result})
+    except (ValueError, KeyError, TypeError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/batch/<framework_key>', methods=['POST'])
+def api_batch_framework(framework_key):
+    """API endpoint to evaluate many input sets, streaming NDJSON results as they are computed
+    
+    The body is either NDJSON (one input object per line), read incrementally, or a JSON
+    array. Each result line carries its row index; a final line reports completion.
+    Pass ?persist=true to save each successful row as a decision.
+    """
+    if framework_key not in FRAMEWORKS:
+        return jsonify({'error': 'Framework not found'}), 404
+    
+    max_rows = min(request.args.get('max_rows', MAX_BATCH_ROWS, type=int), MAX_BATCH_ROWS)
+    persist = request.args.get('persist', 'false').lower() in ('1', 'true', 'yes')
+    
+    if request.mimetype == 'application/json':
+        rows = request.get_json(silent=True)
+        if not isinstance(rows, list):
+            return jsonify({'success': False, 'error': 'Expected a JSON array or NDJSON body'}), 400
+        if len(rows) > max_rows:
+            return jsonify({'success': False, 'error': f'Batch exceeds {max_rows} rows'}), 413
+    else:
+        rows = iter_json_lines(_read_lines(request.stream))
+    
+    runner = BatchRunner(FRAMEWORKS, [framework_key], chunk_size=BATCH_CHUNK_SIZE,
+                         decision_manager=decision_manager if persist else None)
+    
+    def generate():
+        stats = {}
+        limited = _limit_rows(rows, max_rows, stats)
+        try:
+            for text in runner.stream(limited, 'jsonl', f'{framework_key} batch', stats):
+                yield text
+        except ValueError as e:
+            yield json.dumps({'done': False, 'error': str(e), **stats}) + '\n'
+            return
+        if stats.pop('truncated', False):
+            yield json.dumps({'done': False, 'error': f'Batch exceeds {max_rows} rows', **stats}) + '\n'
+        else:
+            yield json.dumps({'done': True, **stats}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def _read_lines(stream, block_size=65536):
+    """Split a request body stream into lines, reading whole blocks instead of byte by byte"""
+    pending = b''
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        lines = (pending + block).split(b'\n')
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+def _limit_rows(rows, max_rows, stats):
+    """Yield at most max_rows rows, flagging stats['truncated'] rather than stopping silently"""
+    for index, row in enumerate(rows):
+        if index == max_rows:
+            stats['truncated'] = True
+            return
+        yield row
+
+@app.route('/api/cache/stats')
+def api_cache_stats():
+    """API endpoint for framework result, decision and rendered page cache counters"""
+    return jsonify({
+        'results': RESULT_CACHE.stats(),
+        'decisions': decision_manager.cache_stats(),
+        'fragments': FRAGMENT_CACHE.stats()
+    })
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus text-format metrics for this process"""
+    return Response(METRICS.render(), mimetype='text/plain; version=0.0.4')
+
+def _profiles_allowed():
+    if PROFILER is None:
+        return False
+    return request.headers.get('X-Profile-Token', request.args.get('token')) == PROFILER.token
+
+@app.route('/admin/profiles')
+def admin_list_profiles():
+    """Recently profiled requests, newest first"""
+    if not _profiles_allowed():
+        return jsonify({'error': 'Not found'}), 404
+    return jsonify(PROFILER.list())
+
+@app.route('/admin/profiles/<int:profile_id>')
+def admin_profile_report(profile_id):
+    """Text report of one profiled request, sorted by cumulative time unless ?sort= says otherwise"""
+    stats = PROFILER.stats(profile_id) if _profiles_allowed() else None
+    if stats is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    try:
+        report = format_stats(stats, sort=request.args.get('sort', 'cumulative'),
+                              limit=min(request.args.get('limit', 60, type=int), 1000))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return Response(report, mimetype='text/plain')
+
+@app.route('/admin/profiles/<int:profile_id>.prof')
+def admin_download_profile(profile_id):
+    """Raw pstats data for ``python -m pstats`` or snakeviz"""
+    data = PROFILER.raw(profile_id) if _profiles_allowed() else None
+    if data is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    return Response(data, mimetype='application/octet-stream',
+                    headers={'Content-Disposition': f'attachment; filename=request-{profile_id}.prof'})
+
+@app.route('/api/frameworks')
+def api_list_frameworks():
+    """API endpoint for framework metadata: key, name, inputs and batch fields"""
+    return jsonify([spec.to_dict() for spec in FRAMEWORKS.specs().values()])
+
+@app.route('/api/decisions')
+def api_list_decisions():
+    """API endpoint for paginated, sorted and filtered decision summaries"""
+    stamp = decision_manager.listing_stamp()
+    if stamp is not None:
+        not_modified = _not_modified(stamp)
+        if not_modified is not None:
+            return not_modified
+    try:
+        response = jsonify(decision_manager.query_decisions(**_listing_options(request.args, 50)))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return _set_validators(response, stamp) if stamp is not None else response
+
+@app.route('/api/search')
+def api_search_decisions():
+    """API endpoint for ranked full-text search over decisions, notes and recommendations"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': "Missing search query 'q'"}), 400
+    try:
+        return jsonify(decision_manager.search_decisions(
+            query,
+            limit=min(request.args.get('limit', 20, type=int), MAX_LIST_LIMIT),
+            offset=request.args.get('offset', 0, type=int)
+        ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
 @app.route('/api/decision/<slug>')
 def api_decision_detail(slug):
-    """API endpoint for decision data"""
+    """API endpoint for decision data; ?view=summary leaves out framework inputs and results"""
+    revision = decision_manager.revision(slug)
+    if revision is not None:
+        not_modified = _not_modified(str(revision[0]), last_modified(revision[1]))
+        if not_modified is not None:
+            return not_modified
+    try:
+        if request.args.get('view') == 'summary':
+            data = decision_manager.load_summary(slug)
+        else:
+            data = decision_manager.load_decision(slug)
+            data = dict(data, frameworks=[_expand_framework(framework) for framework in data['frameworks']])
+    except FileNotFoundError:
+        return jsonify({'error': 'Decision not found'}), 404
+    # The ETag doubles as If-Match when running a framework, to avoid overwriting a newer result
+    return _set_validators(jsonify(data), str(decision_version(data)),
+                           last_modified(data['decision'].get('last_updated')))
+
+@app.route('/api/decision/<slug>/framework/<name>')
+def api_decision_framework(slug, name):
+    """API endpoint for one framework run of a decision, by framework key or name"""
+    framework_name = FRAMEWORKS.spec(name).name if name in FRAMEWORKS else name
+    revision = decision_manager.revision(slug)
+    if revision is not None:
+        not_modified = _not_modified(str(revision[0]), last_modified(revision[1]))
+        if not_modified is not None:
+            return not_modified
     try:
-        data = decision_manager.load_decision(slug)
-        return jsonify(data)
+        record = decision_manager.load_framework(slug, framework_name)
     except FileNotFoundError:
         return jsonify({'error': 'Decision not found'}), 404
+    except KeyError:
+        return jsonify({'error': 'Framework has not been run on this decision'}), 404
+    response = jsonify(_expand_framework(record))
+    # Validated by the decision version read beforehand: a write in between only makes the tag older
+    if revision is not None:
+        _set_validators(response, str(revision[0]), last_modified(revision[1]))
+    return response
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    app.run(debug=True, port=5000, threaded=True)
\ No newline at end of file
@@ -0,0 +1,234 @@
+"""Benchmark cases for benchmarks/run.py, and the synthetic decision stores they run against"""
+
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from frameworks.game_theory_framework import GameTheoryFramework
+from frameworks.registry import FrameworkRegistry
+from frameworks.result_cache import ResultCache
+from cli.decision_manager import DecisionManager
+from cli.storage import create_store
+from storage_formats import build_decision
+
+# Valid inputs for a single calculate() call of each built-in framework
+SAMPLE_INPUTS = {
+    '7s': {'strategy': 7.0, 'structure': 6.0, 'systems': 5.0, 'shared_values': 8.0, 'style': 6.0,
+           'staff': 7.0, 'skills': 8.0},
+    'vpc': {'cost': 40.0, 'price': 70.0, 'value': 100.0},
+    'strategic': {'market_signals': 7.0, 'competitive_shifts': 6.0, 'technology_impact': 8.0,
+                  'business_model_threat': 5.0, 'internal_performance': 6.0, 'frontline_feedback': 7.0,
+                  'signal_description': 'Competitors shipping automation features'},
+    'game': {'our_action_1': 'Cut price', 'our_action_2': 'Hold price', 'competitor_action_1': 'Cut price',
+             'competitor_action_2': 'Hold price', 'payoff_11': 2.0, 'payoff_12': 6.0, 'payoff_21': 1.0,
+             'payoff_22': 4.0, 'competitor_payoff_11': 2.0, 'competitor_payoff_12': 1.0,
+             'competitor_payoff_21': 6.0, 'competitor_payoff_22': 4.0},
+    'risk': {'risk_level': 4.0, 'reward_potential': 7.0, 'resource_requirements': 5.0,
+             'success_probability': 65.0, 'roi_projection': 30.0, 'time_horizon': 12.0,
+             'option_description': 'Expand into the European market'},
+    'cynefin': {'clarity_level': 6.0, 'cause_effect_visibility': 5.0, 'stakeholder_alignment': 7.0,
+                'time_pressure': 4.0, 'failure_impact': 6.0}
+}
+
+# Side length of the large bimatrix game timed alongside the 2x2 one
+LARGE_GAME_ACTIONS = 1000
+
+WORDS = ('launch', 'hire', 'expand', 'market', 'pricing', 'product', 'european', 'platform', 'partner',
+         'acquire', 'retire', 'migrate', 'cloud', 'office', 'budget', 'supplier', 'brand', 'mobile')
+
+
+class Case:
+    """A named operation to time; ``ops`` is how many logical operations one call performs"""
+
+    def __init__(self, group: str, name: str, fn: Callable[[], Any], ops: int = 1):
+        self.group = group
+        self.name = name
+        self.fn = fn
+        self.ops = ops
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+def framework_cases(batch_rows: int) -> List[Case]:
+    """Scalar calculate() for every framework, plus evaluate_batch() where supported"""
+    registry = FrameworkRegistry()
+    rng = np.random.default_rng(0)
+    cases = []
+    for key, inputs in SAMPLE_INPUTS.items():
+        framework = registry[key]
+        cases.append(Case('frameworks', f'{key}.calculate', lambda f=framework, i=inputs: f.calculate(i)))
+        if framework.batch_fields:
+            columns = {field: rng.uniform(1, 10, batch_rows) for field in framework.batch_fields}
+            cases.append(Case('frameworks', f'{key}.evaluate_batch[{batch_rows}]',
+                              lambda f=framework, c=columns: f.evaluate_batch(c), ops=batch_rows))
+    return cases + large_game_cases(rng)
+
+
+def large_game_cases(rng: np.random.Generator) -> List[Case]:
+    """A large game given as nested lists, computed and served from the result cache"""
+    n = LARGE_GAME_ACTIONS
+    ours, theirs = rng.uniform(0, 10, (n, n)), rng.uniform(0, 10, (n, n))
+    # One pure equilibrium, so the timing covers detection rather than the mixed solver's budget
+    ours[0, 0] = theirs[0, 0] = 100.0
+    inputs = {'payoff_matrix': ours.tolist(), 'competitor_payoff_matrix': theirs.tolist()}
+    framework = GameTheoryFramework()
+    cached = GameTheoryFramework()
+    cached.cache = ResultCache()
+    cached.evaluate(inputs)
+    tag = f'[{n}x{n}]'
+    return [
+        Case('frameworks', f'game.calculate{tag}', lambda: framework.calculate(inputs)),
+        Case('frameworks', f'game.evaluate cached{tag}', lambda: cached.evaluate(inputs))
+    ]
+
+
+def persistence_cases(root: str, backend: str, run_counts: List[int]) -> List[Case]:
+    """save/load/update of decisions holding each number of framework runs"""
+    directory = os.path.join(root, f'persistence-{backend}')
+    uncached = DecisionManager(directory, backend=backend, cache_size=0)
+    cached = DecisionManager(directory, backend=backend)
+    risk = FrameworkRegistry()['risk']
+    cases = []
+    for runs in run_counts:
+        records = build_decision(runs)['frameworks']
+        text = f'Benchmark decision with {runs} framework runs'
+        slug = uncached.create_decision_slug(text)
+        uncached.save_decision(text, records)
+        update = risk.build_record(SAMPLE_INPUTS['risk'], risk.evaluate(SAMPLE_INPUTS['risk']))
+        cases.extend([
+            Case('persistence', f'{backend}.save_decision[{runs} runs]',
+                 lambda t=text, r=records: uncached.save_decision(t, r)),
+            Case('persistence', f'{backend}.load_decision[{runs} runs]', lambda s=slug: uncached.load_decision(s)),
+            Case('persistence', f'{backend}.load_decision cached[{runs} runs]', lambda s=slug: cached.load_decision(s)),
+            Case('persistence', f'{backend}.update_decision[{runs} runs]',
+                 lambda s=slug, u=update: uncached.update_decision(s, u))
+        ])
+    return cases
+
+
+def synthetic_decision(index: int, rng: random.Random, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """A small decision document with varied text, dates, frameworks and scores"""
+    created = datetime(2023, 1, 1) + timedelta(minutes=rng.randrange(60 * 24 * 700))
+    frameworks = rng.sample(records, rng.randint(0, 3))
+    text = f"Decision {index}: should we {' '.join(rng.choices(WORDS, k=6))}?"
+    return {
+        'decision': {'text': text, 'slug': f'decision-{index}', 'created_at': created.isoformat(),
+                     'last_updated': (created + timedelta(days=rng.randint(0, 30))).isoformat()},
+        'frameworks': frameworks,
+        'metadata': {'total_frameworks': len(frameworks), 'completed_frameworks': len(frameworks)}
+    }
+
+
+def synthetic_store(root: str, backend: str, size: int) -> str:
+    """Directory holding ``size`` synthetic decisions, generated once and reused across runs"""
+    directory = os.path.join(root, f'store-{backend}-{size}')
+    marker = os.path.join(directory, '.complete')
+    if os.path.exists(marker):
+        return directory
+
+    registry = FrameworkRegistry()
+    records = []
+    for key, inputs in SAMPLE_INPUTS.items():
+        framework = registry[key]
+        for variant in range(3):
+            varied = {field: value + variant if isinstance(value, float) else value
+                      for field, value in inputs.items()}
+            if framework.validate_inputs(varied):
+                records.append(framework.build_record(varied, framework.calculate(varied)))
+
+    rng = random.Random(size)
+    store = create_store(backend, directory)
+    try:
+        for index in range(size):
+            store.save(f'decision-{index}', synthetic_decision(index, rng, records))
+    finally:
+        store.close()
+    with open(marker, 'w') as f:
+        f.write(str(size))
+    return directory
+
+
+def listing_cases(root: str, backend: str, sizes: List[int]) -> List[Case]:
+    """Opening, listing, paging, filtering and searching stores of each size"""
+    cases = []
+    for size in sizes:
+        directory = synthetic_store(root, backend, size)
+        manager = DecisionManager(directory, backend=backend)
+        tag = f'[{size}]'
+        cases.extend([
+            Case('listing', f'{backend}.open{tag}', lambda d=directory: DecisionManager(d, backend=backend).store.close()),
+            Case('listing', f'{backend}.list_decisions{tag}', lambda m=manager: m.list_decisions()),
+            Case('listing', f'{backend}.first_page{tag}', lambda m=manager: m.query_decisions(limit=50)),
+            Case('listing', f'{backend}.top_by_score{tag}',
+                 lambda m=manager: m.query_decisions(limit=50, sort='overall_score')),
+            Case('listing', f'{backend}.framework_filter{tag}',
+                 lambda m=manager: m.query_decisions(limit=50, framework='Risk-Reward Framework')),
+            Case('listing', f'{backend}.search{tag}', lambda m=manager: m.search_decisions('europ market'))
+        ])
+    return cases
+
+
+def web_cases(root: str, backend: str, size: int, batch_rows: int = 10000) -> List[Case]:
+    """Flask routes through the test client against a synthetic store"""
+    import json
+    import app as web
+
+    directory = synthetic_store(root, backend, size)
+    web.decision_manager = DecisionManager(directory, backend=backend)
+    client = web.app.test_client()
+    slug = 'decision-0'
+    inputs = SAMPLE_INPUTS['risk']
+    uncertain = {field: value for field, value in inputs.items() if field in web.FRAMEWORKS['risk'].batch_fields}
+    uncertain['risk_level'] = {'dist': 'triangular', 'low': 2, 'mode': 5, 'high': 9}
+    rows = '\n'.join(json.dumps(inputs) for _ in range(batch_rows))
+
+    def request(method: str, url: str, **kwargs) -> Callable[[], Any]:
+        def call():
+            response = client.open(url, method=method, **kwargs)
+            response.get_data()
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {url} returned {response.status_code}")
+        return call
+
+    def revalidate(url: str) -> Callable[[], Any]:
+        """Conditional GET with the ETag of the previous response, as a polling client sends"""
+        etag = {}
+
+        def call():
+            response = client.get(url, headers={'If-None-Match': etag['value']} if etag else {})
+            response.get_data()
+            if response.status_code not in (200, 304):
+                raise RuntimeError(f"GET {url} returned {response.status_code}")
+            etag['value'] = response.headers['ETag']
+        return call
+
+    tag = f'[{size}]'
+    return [
+        Case('web', f'GET /{tag}', request('GET', '/')),
+        Case('web', f'GET /api/decisions{tag}', request('GET', '/api/decisions?limit=50')),
+        Case('web', f'GET /api/decisions?sort=overall_score{tag}',
+             request('GET', '/api/decisions?limit=50&sort=overall_score')),
+        Case('web', f'GET /api/search{tag}', request('GET', '/api/search?q=europ')),
+        Case('web', f'GET /decision/<slug>{tag}', request('GET', f'/decision/{slug}')),
+        Case('web', f'GET /api/decision/<slug>{tag}', request('GET', f'/api/decision/{slug}')),
+        Case('web', f'GET / If-None-Match{tag}', revalidate('/')),
+        Case('web', f'GET /decision/<slug> If-None-Match{tag}', revalidate(f'/decision/{slug}')),
+        Case('web', f'GET /api/decision/<slug> If-None-Match{tag}', revalidate(f'/api/decision/{slug}')),
+        Case('web', 'GET /api/frameworks', request('GET', '/api/frameworks')),
+        Case('web', 'GET /decision/<slug>/framework/risk', request('GET', f'/decision/{slug}/framework/risk')),
+        Case('web', f'POST /api/framework/<slug>/risk{tag}',
+             request('POST', f'/api/framework/{slug}/risk', json=inputs)),
+        # After the POST above, so the decision has a risk run to fetch
+        Case('web', f'GET /api/decision/<slug>/framework/risk{tag}',
+             request('GET', f'/api/decision/{slug}/framework/risk')),
+        Case('web', 'POST /api/simulate/risk[10000 samples]',
+             request('POST', '/api/simulate/risk', json={'inputs': uncertain, 'n_samples': 10000, 'seed': 1})),
+        Case('web', f'POST /api/batch/risk[{batch_rows} rows]',
+             request('POST', '/api/batch/risk', data=rows, content_type='application/x-ndjson'),
+             ops=batch_rows)
+    ]
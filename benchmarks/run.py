@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark suite runner with baseline comparison
+
+Times framework calculations, decision persistence, listings over synthetic stores of
+100, 10k and 100k decisions, and the Flask routes via the test client. Each case is
+called repeatedly for at least --min-time seconds; p50/p99 latency and throughput are
+reported and compared with benchmarks/baseline.json.
+
+    python benchmarks/run.py                       # run everything, compare with the baseline
+    python benchmarks/run.py --groups frameworks   # one group
+    python benchmarks/run.py --filter search       # cases whose name contains 'search'
+    python benchmarks/run.py --check               # exit 1 on regressions
+    python benchmarks/run.py --save-baseline       # record this machine's numbers
+
+Synthetic stores are generated once under --store-dir and reused. Baselines are only
+comparable on the same machine, so record one before the change being measured.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cases import Case, framework_cases, persistence_cases, listing_cases, web_cases
+
+GROUPS = ('frameworks', 'persistence', 'listing', 'web')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# Differences smaller than this (timer and scheduling jitter) are never flagged
+NOISE_FLOOR_MS = 0.005
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure(case: Case, min_time: float, min_iterations: int = 5, max_iterations: int = 100000) -> Dict[str, Any]:
+    """Call the case until both ``min_time`` seconds and ``min_iterations`` calls have elapsed"""
+    case.fn()  # warm-up: imports, caches, first-touch allocations
+    timings = []
+    gc.collect()
+    started = time.perf_counter()
+    while len(timings) < max_iterations:
+        start = time.perf_counter()
+        case.fn()
+        timings.append(time.perf_counter() - start)
+        if len(timings) >= min_iterations and time.perf_counter() - started >= min_time:
+            break
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        'iterations': len(timings),
+        'ops': case.ops,
+        'p50_ms': percentile(timings, 0.50) * 1000,
+        'p99_ms': percentile(timings, 0.99) * 1000,
+        'mean_ms': total / len(timings) * 1000,
+        'ops_per_sec': case.ops * len(timings) / total if total else float('inf')
+    }
+
+
+def compare(result: Dict[str, Any], baseline: Optional[Dict[str, Any]], tolerance: float) -> str:
+    """'regression', 'faster', 'same' or 'new' for a result against its baseline entry"""
+    if baseline is None:
+        return 'new'
+    if abs(result['p50_ms'] - baseline['p50_ms']) < NOISE_FLOOR_MS:
+        return 'same'
+    # A regression must also be slower than nearly every baseline sample, not just its median
+    if result['p50_ms'] > baseline['p50_ms'] * (1 + tolerance) and result['p50_ms'] > baseline['p99_ms']:
+        return 'regression'
+    if result['p50_ms'] < baseline['p50_ms'] / (1 + tolerance):
+        return 'faster'
+    return 'same'
+
+
+def build_cases(args) -> List[Case]:
+    cases = []
+    if 'frameworks' in args.groups:
+        cases.extend(framework_cases(args.batch_rows))
+    if 'persistence' in args.groups:
+        cases.extend(persistence_cases(args.store_dir, args.backend, args.runs))
+    if 'listing' in args.groups:
+        cases.extend(listing_cases(args.store_dir, args.backend, args.sizes))
+    if 'web' in args.groups:
+        cases.extend(web_cases(args.store_dir, args.backend, args.web_size))
+    if args.filter:
+        cases = [case for case in cases if args.filter in case.key]
+    return cases
+
+
+def int_list(text: str) -> List[int]:
+    return [int(value) for value in text.split(',') if value]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite and compare with a baseline')
+    parser.add_argument('--groups', type=lambda text: text.split(','), default=list(GROUPS),
+                        help=f"Comma-separated groups to run (default: {','.join(GROUPS)})")
+    parser.add_argument('--filter', type=str, help='Only run cases whose group/name contains this text')
+    parser.add_argument('--backend', type=str, default='yaml', help='Storage backend for persistence and listings')
+    parser.add_argument('--sizes', type=int_list, default=[100, 10000, 100000],
+                        help='Decisions per synthetic store for listings (default: 100,10000,100000)')
+    parser.add_argument('--runs', type=int_list, default=[1, 10, 100],
+                        help='Framework runs per decision for persistence (default: 1,10,100)')
+    parser.add_argument('--web-size', type=int, default=10000, help='Decisions in the store behind the web routes')
+    parser.add_argument('--batch-rows', type=int, default=100000, help='Rows per evaluate_batch case')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Minimum seconds to spend timing each case')
+    parser.add_argument('--store-dir', type=str,
+                        default=os.path.join(tempfile.gettempdir(), 'decision-toolkit-benchmarks'),
+                        help='Where synthetic stores are generated and kept between runs')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='Baseline JSON to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results to --baseline')
+    parser.add_argument('--output', type=str, help='Also write the results as JSON to this file')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='Relative p50 slowdown counted as a regression (default: 0.3)')
+    parser.add_argument('--confirm', type=int, default=2,
+                        help='Extra measurements of a regressed case before it is reported (default: 2)')
+    parser.add_argument('--check', action='store_true', help='Exit with status 1 if any case regressed')
+    args = parser.parse_args()
+
+    unknown = [group for group in args.groups if group not in GROUPS]
+    if unknown:
+        parser.error(f"Unknown groups: {', '.join(unknown)}. Available: {', '.join(GROUPS)}")
+    os.makedirs(args.store_dir, exist_ok=True)
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    print('Preparing cases (synthetic stores are generated on first use)...', file=sys.stderr)
+    cases = build_cases(args)
+
+    results = {}
+    regressions = []
+    print(f"\n{'case':<58} {'p50 ms':>10} {'p99 ms':>10} {'ops/s':>12} {'base p50':>10}  status")
+    for case in cases:
+        result = measure(case, args.min_time)
+        previous = baseline.get(case.key)
+        status = compare(result, previous, args.tolerance)
+        # Re-measure apparent regressions so a single noisy run is not reported
+        for _ in range(args.confirm):
+            if status != 'regression':
+                break
+            retry = measure(case, args.min_time)
+            if retry['p50_ms'] < result['p50_ms']:
+                result = retry
+            status = compare(result, previous, args.tolerance)
+        result['status'] = status
+        results[case.key] = result
+        if status == 'regression':
+            regressions.append(case.key)
+        base = f"{previous['p50_ms']:>10.3f}" if previous else f"{'-':>10}"
+        print(f"{case.key:<58} {result['p50_ms']:>10.3f} {result['p99_ms']:>10.3f} "
+              f"{result['ops_per_sec']:>12,.0f} {base}  {status}")
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': args.backend,
+            'min_time': args.min_time
+        },
+        'results': results
+    }
+    for path in filter(None, [args.output, args.baseline if args.save_baseline else None]):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nResults written to {path}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%} of baseline p50:")
+        for key in regressions:
+            print(f"  {key}: {baseline[key]['p50_ms']:.3f} -> {results[key]['p50_ms']:.3f} ms")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
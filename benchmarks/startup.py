@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""CLI start-up time and import budget
+
+Runs ``cli.py --list-frameworks`` (the command shell scripts call most) under
+``python -X importtime`` and reports the import time it adds on top of a bare
+interpreter, the slowest modules and the best wall-clock time over several runs.
+With ``--check`` it exits non-zero when
+the command imports a module that must stay lazy, when imports exceed the budget, or
+when the registry metadata in frameworks.registry no longer matches an implementation.
+
+    python benchmarks/startup.py [--repeat N] [--budget-ms MS] [--check]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from frameworks.registry import BUILTIN_FRAMEWORKS
+
+COMMAND = ['cli.py', '--list-frameworks']
+# Heavy modules that --list-frameworks must never load
+FORBIDDEN_MODULES = ('numpy', 'yaml', 'frameworks.framework_base', 'cli.storage', 'cli.decision_manager')
+
+
+def import_times(command):
+    """Per-module (self, cumulative) import times in microseconds for one run of the command"""
+    completed = subprocess.run([sys.executable, '-X', 'importtime'] + command, cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def wall_time(command, repeat):
+    """Best wall-clock seconds over ``repeat`` runs, and of a bare interpreter for reference"""
+    def best(args):
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable] + args, cwd=ROOT, capture_output=True, check=True)
+            runs.append(time.perf_counter() - start)
+        return min(runs)
+    return best(command), best(['-c', 'pass'])
+
+
+def check_registry():
+    """Compare the declared metadata of built-in frameworks with their implementations"""
+    problems = []
+    for spec in BUILTIN_FRAMEWORKS:
+        framework = spec.load()()
+        if framework.name != spec.name:
+            problems.append(f"{spec.key}: name {spec.name!r} != {framework.name!r}")
+        if framework.get_required_inputs() != spec.inputs:
+            problems.append(f"{spec.key}: inputs differ from get_required_inputs()")
+        if tuple(framework.batch_fields) != spec.batch_fields:
+            problems.append(f"{spec.key}: batch_fields differ")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure CLI start-up time and imports')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs (best is reported)')
+    parser.add_argument('--budget-ms', type=float, default=40.0,
+                        help='Maximum total import time for --list-frameworks with --check')
+    parser.add_argument('--top', type=int, default=10, help='Slowest modules to list')
+    parser.add_argument('--check', action='store_true', help='Exit non-zero if the budget is exceeded')
+    args = parser.parse_args()
+
+    # Modules the bare interpreter imports anyway are not charged to the command
+    baseline = import_times(['-c', 'pass'])
+    times = {name: value for name, value in import_times(COMMAND).items() if name not in baseline}
+    total_ms = sum(self_us for self_us, _ in times.values()) / 1000
+    command_s, interpreter_s = wall_time(COMMAND, args.repeat)
+
+    print(f"python {' '.join(COMMAND)}")
+    print(f"  wall time:   {command_s * 1000:8.1f} ms (bare interpreter {interpreter_s * 1000:.1f} ms)")
+    print(f"  import time: {total_ms:8.1f} ms over {len(times)} modules beyond the interpreter's own "
+          f"(budget {args.budget_ms:.0f} ms)")
+    print(f"\n{'module':<40} {'self ms':>9} {'cumulative ms':>14}")
+    for name, (self_us, cumulative_us) in sorted(times.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{name:<40} {self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}")
+
+    if not args.check:
+        return
+
+    failures = [f"imports {name}" for name in FORBIDDEN_MODULES if name in times]
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+    failures.extend(check_registry())
+    if failures:
+        print('\nFAILED:\n  ' + '\n  '.join(failures))
+        sys.exit(1)
+    print('\nOK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Load and save times per decision storage format
+
+Builds decisions holding 1, 10 and 100 framework runs and times a full write and read
+of each through the file formats in cli.formats, plus the pure-Python YAML path the
+app used before libyaml for comparison.
+
+    python benchmarks/storage_formats.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frameworks import RiskRewardFramework, SevenSFramework
+from cli.formats import DOCUMENT_FORMATS, DocumentFormat, read_document, write_document
+
+RUN_COUNTS = (1, 10, 100)
+
+PURE_YAML = DocumentFormat(
+    'yaml (pure Python)', '.yaml',
+    lambda data: yaml.dump(data, Dumper=yaml.SafeDumper, default_flow_style=False, indent=2).encode('utf-8'),
+    lambda raw: yaml.load(raw, Loader=yaml.SafeLoader)
+)
+
+
+def build_decision(runs: int) -> dict:
+    """A decision document with ``runs`` framework results of realistic shape"""
+    risk = RiskRewardFramework()
+    seven_s = SevenSFramework()
+    frameworks = []
+    for i in range(runs):
+        if i % 2:
+            inputs = {field: float(1 + (i + j) % 10) for j, field in enumerate(seven_s.batch_fields)}
+            framework = seven_s
+        else:
+            inputs = {'risk_level': float(1 + i % 10), 'reward_potential': float(1 + (i * 3) % 10),
+                      'resource_requirements': 5.0, 'success_probability': 60.0, 'roi_projection': 35.0,
+                      'time_horizon': 12.0, 'option_description': f'Option {i}'}
+            framework = risk
+        record = framework.build_record(inputs, framework.evaluate(inputs))
+        record['name'] = f"{record['name']} #{i}"
+        frameworks.append(record)
+
+    return {
+        'decision': {'text': f'Benchmark decision with {runs} runs', 'slug': f'benchmark-{runs}',
+                     'created_at': '2024-01-01T00:00:00', 'last_updated': '2024-01-01T00:00:00'},
+        'frameworks': frameworks,
+        'metadata': {'total_frameworks': runs, 'completed_frameworks': runs}
+    }
+
+
+def time_format(fmt: DocumentFormat, data: dict, directory: str, repeat: int):
+    """Best-of-``repeat`` save and load times in milliseconds, and the file size"""
+    path = os.path.join(directory, f"bench{fmt.extension}")
+    save_times, load_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if fmt is PURE_YAML:
+            with open(path, 'wb') as f:
+                f.write(fmt.dumps(data))
+        else:
+            write_document(path, data, fmt)
+        save_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        if fmt is PURE_YAML:
+            with open(path, 'rb') as f:
+                loaded = fmt.loads(f.read())
+        else:
+            loaded = read_document(path)
+        load_times.append(time.perf_counter() - start)
+    assert loaded['metadata'] == data['metadata']
+    return min(save_times) * 1000, min(load_times) * 1000, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark decision storage formats')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed repetitions per case (best is reported)')
+    args = parser.parse_args()
+
+    formats = [PURE_YAML] + [fmt for fmt in DOCUMENT_FORMATS.values() if fmt.available]
+    skipped = [fmt.name for fmt in DOCUMENT_FORMATS.values() if not fmt.available]
+
+    print(f"{'format':<20} {'runs':>5} {'save ms':>10} {'load ms':>10} {'size KB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for runs in RUN_COUNTS:
+            data = build_decision(runs)
+            for fmt in formats:
+                save_ms, load_ms, size = time_format(fmt, data, directory, args.repeat)
+                print(f"{fmt.name:<20} {runs:>5} {save_ms:>10.3f} {load_ms:>10.3f} {size / 1024:>10.1f}")
+    if skipped:
+        print(f"\nSkipped (package not installed): {', '.join(skipped)}")
+
+
+if __name__ == '__main__':
+    main()
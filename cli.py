@@ -2,6 +2,7 @@
 """Command Line Interface for Decision Making Toolkit"""
 
 import argparse
+import json
 import sys
 import os
 from typing import Dict, Any, List
@@ -9,38 +10,45 @@ from typing import Dict, Any, List
 # Add the tools directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from frameworks import (
-    SevenSFramework, VPCFramework, StrategicInflectionFramework,
-    GameTheoryFramework, RiskRewardFramework, CynefinFramework
-)
-from cli.decision_manager import DecisionManager
+# Only light modules are imported up front; NumPy, YAML and the storage layer are loaded
+# by the commands that need them (see benchmarks/startup.py)
+from frameworks.registry import FrameworkRegistry
 
 
 class DecisionCLI:
     """Command Line Interface for Decision Making Frameworks"""
     
-    def __init__(self):
-        self.decision_manager = DecisionManager()
-        self.frameworks = {
-            '7s': SevenSFramework(),
-            'vpc': VPCFramework(),
-            'strategic': StrategicInflectionFramework(),
-            'game': GameTheoryFramework(),
-            'risk': RiskRewardFramework(),
-            'cynefin': CynefinFramework()
-        }
+    def __init__(self, storage: str = None):
+        self.storage = storage
+        self._decision_manager = None
+        self.frameworks = FrameworkRegistry()
+    
+    @property
+    def decision_manager(self):
+        """Opened on first use so commands that never touch storage skip it"""
+        if self._decision_manager is None:
+            from cli.decision_manager import DecisionManager
+            self._decision_manager = DecisionManager(backend=self.storage)
+        return self._decision_manager
     
     def list_frameworks(self):
         """List available frameworks"""
         print("\nAvailable Decision-Making Frameworks:")
         print("=====================================")
-        for key, framework in self.frameworks.items():
-            print(f"  {key}: {framework.name}")
+        for key, spec in self.frameworks.specs().items():
+            print(f"  {key}: {spec.name}")
         print()
     
-    def list_decisions(self):
-        """List saved decisions"""
-        decisions = self.decision_manager.list_decisions()
+    def list_decisions(self, **options):
+        """List saved decisions, optionally paginated, sorted and filtered
+        
+        Options are those of DecisionManager.list_decisions; ``framework`` may be a
+        framework key such as 'risk'.
+        """
+        if options.get('framework') in self.frameworks:
+            options['framework'] = self.frameworks.spec(options['framework']).name
+        listing = self.decision_manager.query_decisions(**options)
+        decisions = listing['decisions']
         
         if not decisions:
             print("No saved decisions found.")
@@ -53,18 +61,41 @@ class DecisionCLI:
             print(f"    Text: {decision['text']}")
             print(f"    Created: {decision['created_at']}")
             print(f"    Frameworks: {decision['frameworks_count']}")
+            if decision.get('overall_score') is not None:
+                print(f"    Overall Score: {decision['overall_score']:.2f}")
             print()
+        
+        offset = options.get('offset', 0)
+        print(f"Showing {offset + 1}-{offset + len(decisions)} of {listing['total']}")
+        if listing['next_cursor']:
+            print(f"Next page: --cursor {listing['next_cursor']}")
+    
+    def search_decisions(self, query: str, limit: int = 20, offset: int = 0):
+        """Show decisions ranked by how well they match the query"""
+        found = self.decision_manager.search_decisions(query, limit=limit, offset=offset)
+        results = found['results']
+        
+        if not results:
+            print(f"No decisions match '{query}'.")
+            return
+        
+        print(f"\nSearch Results for '{query}':")
+        print("=" * (len(query) + 22))
+        for decision in results:
+            print(f"  {decision['slug']}")
+            print(f"    Text: {decision['text']}")
+            print(f"    Match: {decision['snippet']}")
+            print()
+        
+        print(f"Showing {offset + 1}-{offset + len(results)} of {found['total']}")
     
     def create_decision(self, decision_text: str):
         """Create a new decision"""
-        slug = self.decision_manager.create_decision_slug(decision_text)
+        print(f"\nDecision text: {decision_text}")
         
-        print(f"\nCreating decision: {slug}")
-        print(f"Decision text: {decision_text}")
-        
-        # Save initial decision with empty frameworks
-        filepath = self.decision_manager.save_decision(decision_text, [])
-        print(f"Decision saved to: {filepath}")
+        # Save initial decision with empty frameworks; the slug gets a suffix if already taken
+        slug = self.decision_manager.save_decision(decision_text, [])
+        print(f"Decision saved as: {slug}")
         
         return slug
     
@@ -108,14 +139,13 @@ class DecisionCLI:
         
         # Execute framework
         try:
-            framework.set_inputs(inputs)
-            result = framework.execute()
+            result = framework.evaluate(inputs)
             
             # Display results
             self._display_results(result)
             
             # Save results
-            framework_data = framework.to_dict()
+            framework_data = framework.build_record(inputs, result)
             self.decision_manager.update_decision(decision_slug, framework_data)
             
             print(f"\nResults saved for decision: {decision_slug}")
@@ -177,6 +207,125 @@ class DecisionCLI:
             else:
                 print("Invalid choice. Please enter 1-4.")
     
+    def optimize_portfolio(self, options_path: str, budget: float, objective: str = 'expected_value',
+                           max_risk_level: float = None, max_total_risk: float = None,
+                           output_path: str = None):
+        """Select the best set of Risk-Reward options within a resource budget"""
+        from frameworks.portfolio import load_options, optimize_portfolio
+        options = load_options(options_path)
+        result = optimize_portfolio(options, budget, objective=objective,
+                                    max_risk_level=max_risk_level, max_total_risk=max_total_risk)
+        
+        print(f"\nPortfolio optimization ({result.method}, {'optimal' if result.optimal else 'approximate'})")
+        print("=" * 60)
+        print(f"Options considered: {result.candidates} of {len(options)}")
+        print(f"Selected: {len(result.selected)}")
+        print(f"Total {objective.replace('_', ' ')}: {result.total_value:.2f} (upper bound {result.upper_bound:.2f})")
+        print(f"Resources used: {result.total_resources:.2f} of {budget:.2f}")
+        print(f"Total risk: {result.total_risk:.2f}")
+        print(f"Shadow price per resource unit: {result.shadow_price:.4f}")
+        print(f"Runtime: {result.runtime_seconds:.3f}s")
+        
+        top = sorted(result.marginal_values.items(), key=lambda item: -item[1])[:10]
+        if top:
+            print("\nTop selections by marginal value:")
+            for index, marginal in top:
+                label = options[index].get('option_description', f"Option {index}")
+                print(f"  {index}: {label} (marginal value {marginal:.2f})")
+        
+        if output_path:
+            with open(output_path, 'w') as f:
+                json.dump(result.to_dict(), f, indent=2)
+            print(f"\nFull result written to: {output_path}")
+    
+    def show_frontier(self, options_path: str, criteria: List[str] = None, max_layers: int = None,
+                      output_path: str = None):
+        """Print the Pareto frontier layers of Risk-Reward options"""
+        from frameworks.pareto import frontier_layers
+        from frameworks.portfolio import load_options
+        options = load_options(options_path)
+        result = frontier_layers(options, criteria=criteria, max_layers=max_layers)
+        
+        print(f"\nPareto frontier ({', '.join(result['criteria'])})")
+        print("=" * 60)
+        print(f"Options: {len(options)} ({len(result['invalid_options'])} invalid)")
+        print(f"Layers: {result['layer_count']}")
+        
+        for layer in result['layers'][:5]:
+            print(f"\nLayer {layer['rank']}: {len(layer['indices'])} options")
+            for index, point in list(zip(layer['indices'], layer['points']))[:10]:
+                label = options[index].get('option_description', f"Option {index}")
+                values = ', '.join(f"{axis}={value:.2f}" for axis, value in zip(result['axes'], point))
+                print(f"  {index}: {label} ({values})")
+        
+        if output_path:
+            with open(output_path, 'w') as f:
+                json.dump(result, f, indent=2)
+            print(f"\nFull result written to: {output_path}")
+    
+    def run_batch(self, input_path: str, framework_keys: List[str], output_path: str = None,
+                  output_format: str = None, workers: int = 1, chunk_size: int = 1000, save: bool = False):
+        """Evaluate frameworks for every row of a CSV/JSONL file without prompting"""
+        from cli.batch import BatchRunner, read_rows, output_format_for
+        runner = BatchRunner(self.frameworks, framework_keys, workers=workers, chunk_size=chunk_size,
+                             decision_manager=self.decision_manager if save else None)
+        output_format = output_format or output_format_for(output_path)
+        source_name = os.path.splitext(os.path.basename(input_path))[0]
+        
+        if output_path:
+            with open(output_path, 'w', newline='') as output:
+                stats = runner.run(read_rows(input_path), output, output_format, source_name)
+        else:
+            stats = runner.run(read_rows(input_path), sys.stdout, output_format, source_name)
+        
+        # Results may be on stdout, so the summary goes to stderr
+        print(f"Processed {stats['rows']} rows: {stats['succeeded']} succeeded, {stats['failed']} failed"
+              + (f", {stats['saved']} decisions saved" if save else ''), file=sys.stderr)
+    
+    def convert_files(self, paths: List[str], target_format: str):
+        """Rewrite decision files in another serialization format"""
+        from cli.formats import convert_document
+        for path in paths:
+            try:
+                output_path = convert_document(path, target_format)
+            except (OSError, ValueError, ImportError) as e:
+                print(f"Could not convert {path}: {e}")
+                continue
+            print(f"Converted {path} -> {output_path}")
+    
+    def migrate_layout(self):
+        """Move flat <slug>.yaml files into the sharded layout; safe while the app is serving"""
+        from cli.storage import ShardedDecisionStore
+        store = ShardedDecisionStore(self.decision_manager.data_dir)
+        try:
+            stats = store.migrate_flat_layout(progress=lambda moved: print(f"  {moved} decisions moved..."))
+        finally:
+            store.close()
+        print(f"\nMoved {stats['moved']} decisions into {store.data_dir}/decisions/; removed {stats['removed']} "
+              f"leftover flat files, registered {stats['registered']} unlisted sharded files, "
+              f"{stats['failed']} unreadable files left in place.")
+        print("Serve the data directory with --storage sharded (DECISION_STORAGE=sharded).")
+    
+    def migrate_storage(self, source_backend: str, target_backend: str):
+        """Copy all decisions from one storage backend to another"""
+        if source_backend == target_backend:
+            print("Source and target storage backends must differ.")
+            return
+        
+        from cli.storage import create_store, migrate_store
+        data_dir = self.decision_manager.data_dir
+        source = create_store(source_backend, data_dir)
+        target = create_store(target_backend, data_dir)
+        try:
+            count, failed = migrate_store(source, target)
+        finally:
+            source.close()
+            target.close()
+        
+        print(f"Migrated {count} decisions from {source_backend} to {target_backend} storage.")
+        if failed:
+            print(f"{len(failed)} unreadable decisions were not migrated: {', '.join(failed)}")
+    
     def view_decision_results(self, decision_slug: str):
         """View results for a decision"""
         try:
@@ -206,19 +355,130 @@ def main():
     parser = argparse.ArgumentParser(description='Decision Making Toolkit CLI')
     parser.add_argument('--list-frameworks', action='store_true', help='List available frameworks')
     parser.add_argument('--list-decisions', action='store_true', help='List saved decisions')
+    parser.add_argument('--search', type=str, metavar='QUERY',
+                        help='Full-text search of decisions, notes and recommendations (words match as prefixes)')
+    parser.add_argument('--limit', type=int, help='Maximum decisions to list (--list-decisions, --search)')
+    parser.add_argument('--offset', type=int, default=0, help='Decisions to skip (--list-decisions, --search)')
+    parser.add_argument('--cursor', type=str, help='Continue a --list-decisions listing from a previous page')
+    parser.add_argument('--sort', type=str, default='created_at',
+                        help='Sort key for --list-decisions: created_at (default), last_updated, '
+                             'frameworks_count or overall_score')
+    parser.add_argument('--order', type=str, default='desc', choices=['asc', 'desc'],
+                        help='Sort order for --list-decisions (default: desc)')
+    parser.add_argument('--created-after', type=str, metavar='DATE', help='Only decisions created on or after DATE')
+    parser.add_argument('--created-before', type=str, metavar='DATE', help='Only decisions created before DATE')
+    parser.add_argument('--prefix', type=str, help='Only decisions whose text starts with this prefix')
     parser.add_argument('--create', type=str, help='Create new decision with given text')
     parser.add_argument('--decision', type=str, help='Decision slug to work with')
-    parser.add_argument('--framework', type=str, help='Framework to run (use with --decision)')
+    parser.add_argument('--framework', type=str,
+                        help='Framework to run (use with --decision or --batch), or to filter --list-decisions by')
     parser.add_argument('--interactive', action='store_true', help='Interactive mode (use with --decision)')
     parser.add_argument('--view', action='store_true', help='View decision results (use with --decision)')
+    parser.add_argument('--storage', type=str,
+                        help='Storage backend to use: yaml, json, msgpack, sharded or sqlite '
+                             '(default: $DECISION_STORAGE or yaml)')
+    parser.add_argument('--migrate-storage', nargs=2, metavar=('SOURCE', 'TARGET'),
+                        help='Copy all decisions between storage backends')
+    parser.add_argument('--migrate-layout', action='store_true',
+                        help='Move flat <slug>.yaml decisions into the hash-sharded layout (--storage sharded)')
+    parser.add_argument('--convert', type=str, nargs='+', metavar='FILE',
+                        help='Convert decision files to the format given by --to (format detected on load)')
+    parser.add_argument('--to', type=str, help='Target format for --convert: yaml, json or msgpack')
+    parser.add_argument('--portfolio', type=str, metavar='FILE',
+                        help='Optimize a portfolio of Risk-Reward options from a CSV/JSON/JSONL file')
+    parser.add_argument('--budget', type=float, help='Resource budget for --portfolio')
+    parser.add_argument('--objective', type=str, default='expected_value',
+                        help='Score to maximize with --portfolio (default: expected_value)')
+    parser.add_argument('--max-risk-level', type=float, help='Exclude options above this risk level (--portfolio)')
+    parser.add_argument('--max-total-risk', type=float, help='Cap on the summed risk level of the portfolio')
+    parser.add_argument('--frontier', type=str, metavar='FILE',
+                        help='Show Pareto frontier layers of Risk-Reward options from a CSV/JSON/JSONL file')
+    parser.add_argument('--criteria', type=str, nargs='+',
+                        help='2-4 scores for --frontier; prefix with - to minimize (default: -risk_level reward_potential)')
+    parser.add_argument('--max-layers', type=int, help='Limit the number of layers returned by --frontier')
+    parser.add_argument('--batch', type=str, metavar='FILE',
+                        help='Evaluate --framework (or --all-frameworks) for every row of a CSV/JSONL file')
+    parser.add_argument('--all-frameworks', action='store_true', help='Run every framework on each --batch row')
+    parser.add_argument('--format', type=str,
+                        help='Output format for --batch: jsonl or csv (default: from --output extension, else jsonl)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Rows per worker task for --batch')
+    parser.add_argument('--save', action='store_true',
+                        help='Persist each --batch row as a decision (text from its "decision" column)')
+    parser.add_argument('--output', type=str,
+                        help='Write the full --portfolio or --frontier result as JSON, or --batch results, to this file')
+    parser.add_argument('--profile', type=str, nargs='?', const='decision-toolkit.prof', metavar='FILE',
+                        help='Profile the command: write pstats data to FILE (default: decision-toolkit.prof) '
+                             'and a cumulative-time and allocation report to FILE.txt')
     
     args = parser.parse_args()
-    cli = DecisionCLI()
+    # Names backed by the storage layer are checked here rather than with argparse choices,
+    # which would import it (and YAML) on every invocation
+    if args.storage or args.migrate_storage:
+        from cli.storage import STORAGE_BACKENDS
+        for backend in [args.storage, *(args.migrate_storage or [])]:
+            if backend and backend not in STORAGE_BACKENDS:
+                parser.error(f"unknown storage backend '{backend}' (choose from {', '.join(sorted(STORAGE_BACKENDS))})")
+    if args.to:
+        from cli.formats import DOCUMENT_FORMATS
+        if args.to not in DOCUMENT_FORMATS:
+            parser.error(f"unknown format '{args.to}' (choose from {', '.join(sorted(DOCUMENT_FORMATS))})")
+    
+    cli = DecisionCLI(storage=args.storage)
     
+    if args.profile:
+        from cli.profiling import profile_run
+        with profile_run(args.profile):
+            run_command(cli, args, parser)
+    else:
+        run_command(cli, args, parser)
+
+
+def run_command(cli: DecisionCLI, args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """Dispatch the parsed command line to the matching DecisionCLI method"""
     if args.list_frameworks:
         cli.list_frameworks()
     elif args.list_decisions:
-        cli.list_decisions()
+        try:
+            cli.list_decisions(limit=args.limit, offset=args.offset, cursor=args.cursor, sort=args.sort,
+                               descending=args.order == 'desc', framework=args.framework,
+                               created_after=args.created_after, created_before=args.created_before,
+                               text_prefix=args.prefix)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.search:
+        try:
+            cli.search_decisions(args.search, limit=args.limit or 20, offset=args.offset)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.portfolio:
+        if args.budget is None:
+            parser.error('--portfolio requires --budget')
+        cli.optimize_portfolio(args.portfolio, args.budget, args.objective,
+                               args.max_risk_level, args.max_total_risk, args.output)
+    elif args.batch:
+        if args.all_frameworks:
+            framework_keys = list(cli.frameworks)
+        elif args.framework:
+            framework_keys = [args.framework]
+        else:
+            parser.error('--batch requires --framework or --all-frameworks')
+        try:
+            cli.run_batch(args.batch, framework_keys, args.output, args.format,
+                          args.workers, args.chunk_size, args.save)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.frontier:
+        cli.show_frontier(args.frontier, args.criteria, args.max_layers, args.output)
+    elif args.convert:
+        if not args.to:
+            parser.error('--convert requires --to')
+        cli.convert_files(args.convert, args.to)
+    elif args.migrate_storage:
+        cli.migrate_storage(*args.migrate_storage)
+    elif args.migrate_layout:
+        cli.migrate_layout()
     elif args.create:
         slug = cli.create_decision(args.create)
         print(f"\nTo work with this decision, use: --decision {slug}")
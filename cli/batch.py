@@ -0,0 +1,213 @@
+"""Non-interactive batch evaluation of frameworks over CSV or JSON Lines files"""
+
+import csv
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Any, List, Iterator, Iterable, Optional, TextIO, Tuple
+
+from frameworks.framework_base import Framework
+
+# Column holding the decision text when rows are persisted; never passed to frameworks
+DECISION_COLUMN = 'decision'
+CSV_COLUMNS = ['row', 'framework', 'success', 'error', 'overall_score', 'scores', 'recommendations']
+
+# Frameworks for the current worker process, set once by the pool initializer
+_worker_frameworks: Dict[str, Framework] = {}
+
+
+def read_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream input rows from a CSV or JSON Lines file without loading it whole"""
+    with open(path, 'r', newline='') as f:
+        if path.endswith('.csv'):
+            for row in csv.DictReader(f):
+                yield {key: _coerce(value) for key, value in row.items() if value not in (None, '')}
+        else:
+            yield from iter_json_lines(f)
+
+
+def iter_json_lines(lines: Iterable[Any]) -> Iterator[Any]:
+    """Parse JSON Lines lazily from an iterable of str or bytes lines"""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON on line {number}: {e}") from e
+
+
+def _coerce(value: str) -> Any:
+    """CSV cells are text; numeric-looking cells become floats like interactive score inputs"""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _init_worker(frameworks: Dict[str, Framework]) -> None:
+    global _worker_frameworks
+    _worker_frameworks = frameworks
+
+
+def _evaluate_in_worker(framework_keys: List[str], start: int, rows: List[Dict[str, Any]],
+                        output_format: str, keep_records: bool) -> Dict[str, Any]:
+    return evaluate_chunk(_worker_frameworks, framework_keys, start, rows, output_format, keep_records)
+
+
+def evaluate_chunk(frameworks: Dict[str, Framework], framework_keys: List[str], start: int,
+                   rows: List[Dict[str, Any]], output_format: str, keep_records: bool) -> Dict[str, Any]:
+    """Evaluate a chunk of rows against each framework and serialize the output
+
+    Returns the formatted output text, success/failure counts and, when rows are to be
+    persisted, the successful framework records keyed by row index.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if output_format == 'csv' else None
+    chunk = {'succeeded': 0, 'failed': 0, 'records': {} if keep_records else None}
+    for offset, row in enumerate(rows):
+        row_index = start + offset
+        if isinstance(row, dict):
+            inputs = {key: value for key, value in row.items() if key != DECISION_COLUMN}
+        else:
+            inputs = None
+        for key in framework_keys:
+            framework = frameworks[key]
+            try:
+                if inputs is None:
+                    raise ValueError("Row is not an object of inputs")
+                record, error = framework.build_record(inputs, framework.evaluate(inputs)), None
+            except Exception as e:
+                record, error = framework.build_record(inputs, None), str(e)
+
+            chunk['failed' if error else 'succeeded'] += 1
+            if writer:
+                writer.writerow(_csv_row(row_index, key, record, error))
+            else:
+                buffer.write(json.dumps(_json_record(row_index, key, record, error), default=str) + '\n')
+            if keep_records and not error:
+                chunk['records'].setdefault(row_index, []).append(record)
+
+    chunk['text'] = buffer.getvalue()
+    return chunk
+
+
+def _json_record(row_index: int, key: str, record: Dict[str, Any], error: Optional[str]) -> Dict[str, Any]:
+    return {'row': row_index, 'framework': key, 'success': error is None, 'error': error, **record}
+
+
+def _csv_row(row_index: int, key: str, record: Dict[str, Any], error: Optional[str]) -> List[Any]:
+    result = record['result'] or {}
+    return [
+        row_index, key, error is None, error or '',
+        result.get('overall_score', ''),
+        json.dumps(result.get('scores', {}), default=str),
+        json.dumps(result.get('recommendations', []), default=str)
+    ]
+
+
+class BatchRunner:
+    """Evaluates streamed rows in chunks across a process pool and streams the results out
+
+    At most ``workers * 2`` chunks are in flight, so memory stays bounded by the chunk
+    size no matter how many rows the input has. Workers also serialize their output,
+    and results are written in input order.
+    """
+
+    FORMATS = ('jsonl', 'csv')
+
+    def __init__(self, frameworks: Dict[str, Framework], framework_keys: List[str],
+                 workers: int = 1, chunk_size: int = 1000, decision_manager=None):
+        missing = [key for key in framework_keys if key not in frameworks]
+        if missing:
+            raise ValueError(f"Unknown frameworks: {', '.join(missing)}")
+        self.frameworks = {key: frameworks[key] for key in framework_keys}
+        self.framework_keys = list(framework_keys)
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self.decision_manager = decision_manager
+
+    def run(self, rows: Iterable[Dict[str, Any]], output: TextIO, output_format: str = 'jsonl',
+            source_name: str = 'batch') -> Dict[str, int]:
+        """Evaluate every row and write one output record per row and framework"""
+        stats = {}
+        for text in self.stream(rows, output_format, source_name, stats):
+            output.write(text)
+        return stats
+
+    def stream(self, rows: Iterable[Dict[str, Any]], output_format: str = 'jsonl',
+               source_name: str = 'batch', stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
+        """Yield formatted output one chunk at a time, updating ``stats`` as chunks complete
+
+        Rows are only pulled from ``rows`` as output is consumed, so a slow reader
+        throttles evaluation instead of letting results pile up.
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'. Available: {', '.join(self.FORMATS)}")
+        if output_format == 'csv':
+            header = io.StringIO()
+            csv.writer(header).writerow(CSV_COLUMNS)
+            yield header.getvalue()
+
+        stats = stats if stats is not None else {}
+        stats.update({'rows': 0, 'succeeded': 0, 'failed': 0, 'saved': 0})
+        for start, chunk_rows, chunk in self._evaluate(rows, output_format):
+            stats['rows'] += len(chunk_rows)
+            stats['succeeded'] += chunk['succeeded']
+            stats['failed'] += chunk['failed']
+
+            # Storage backends are not shared across processes, so rows are persisted here
+            if self.decision_manager is not None:
+                for row_index, records in chunk['records'].items():
+                    row = chunk_rows[row_index - start]
+                    # Saving the same text replaces the stored decision, so every row is named by its index
+                    if row.get(DECISION_COLUMN):
+                        text = f"{row[DECISION_COLUMN]} (row {row_index})"
+                    else:
+                        text = f"{source_name} row {row_index}"
+                    self.decision_manager.save_decision(text, records)
+                    stats['saved'] += 1
+            yield chunk['text']
+
+    def _evaluate(self, rows: Iterable[Dict[str, Any]],
+                  output_format: str) -> Iterator[Tuple[int, List[Dict[str, Any]], Dict[str, Any]]]:
+        """Yield (first row index, rows, evaluated chunk) in input order"""
+        args = (output_format, self.decision_manager is not None)
+        chunks = self._chunks(rows)
+        if self.workers == 1:
+            for start, chunk_rows in chunks:
+                yield start, chunk_rows, evaluate_chunk(self.frameworks, self.framework_keys, start, chunk_rows, *args)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.frameworks,)) as executor:
+            pending = deque()
+            for start, chunk_rows in chunks:
+                future = executor.submit(_evaluate_in_worker, self.framework_keys, start, chunk_rows, *args)
+                pending.append((start, chunk_rows, future))
+                if len(pending) >= self.workers * 2:
+                    start, chunk_rows, future = pending.popleft()
+                    yield start, chunk_rows, future.result()
+            while pending:
+                start, chunk_rows, future = pending.popleft()
+                yield start, chunk_rows, future.result()
+
+    def _chunks(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        iterator = iter(rows)
+        start = 0
+        while True:
+            chunk_rows = list(islice(iterator, self.chunk_size))
+            if not chunk_rows:
+                return
+            yield start, chunk_rows
+            start += len(chunk_rows)
+
+
+def output_format_for(path: Optional[str], default: str = 'jsonl') -> str:
+    """Infer the output format from a file extension"""
+    if path and os.path.splitext(path)[1].lower() == '.csv':
+        return 'csv'
+    return default
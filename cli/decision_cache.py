@@ -0,0 +1,110 @@
+"""Bounded in-process cache of loaded decision documents"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Hashable
+
+
+class DecisionCache:
+    """LRU of parsed decisions, validated by a storage stamp and a write sequence number
+
+    Every write through DecisionManager advances a global sequence and records it for
+    the slug, and an entry is only stored if the slug was not written after the load
+    started, so a concurrent write can never be overwritten by stale data. Edits made
+    outside the manager are caught by comparing the backend's stamp (e.g. file mtime
+    and size). Memory is capped by entry count and by the approximate serialized size
+    of the cached documents.
+
+    Write sequence numbers are kept for the ``max_writes`` most recently written slugs
+    only. A slug that was forgotten counts as written when the last forgotten one was,
+    so an older load of it is not cached: a spurious miss, never stale data.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024, max_writes: int = 4096):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_writes = max_writes
+        self._entries = OrderedDict()  # slug -> (stamp, size, data)
+        self._writes = OrderedDict()  # slug -> sequence number of its last write, oldest first
+        self._sequence = 0
+        self._forgotten = 0  # latest sequence number dropped from _writes
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0, 'invalidations': 0}
+
+    def version(self, slug: str) -> int:
+        """Token to pass to ``put`` for a load of ``slug`` starting now"""
+        with self._lock:
+            return self._sequence
+
+    def get(self, slug: str, stamp: Optional[Hashable]) -> Optional[Dict[str, Any]]:
+        """Return the cached document if its stamp still matches, else None"""
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+            if entry[0] != stamp:
+                self._discard(slug)
+                self._counters['stale'] += 1
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end(slug)
+            self._counters['hits'] += 1
+            return entry[2]
+
+    def put(self, slug: str, data: Dict[str, Any], stamp: Optional[Hashable], version: int) -> None:
+        """Cache a freshly loaded document unless a write happened since ``version`` was read"""
+        size = len(json.dumps(data, default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if self._writes.get(slug, self._forgotten) > version:
+                return
+            self._discard(slug)
+            self._entries[slug] = (stamp, size, data)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._counters['evictions'] += 1
+
+    def invalidate(self, slug: str) -> None:
+        """Drop a slug and record a write of it; called on every write"""
+        with self._lock:
+            self._sequence += 1
+            self._writes.pop(slug, None)
+            self._writes[slug] = self._sequence
+            while len(self._writes) > self.max_writes:
+                _, self._forgotten = self._writes.popitem(last=False)
+            if self._discard(slug):
+                self._counters['invalidations'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            # Loads in flight must not repopulate the cache either
+            self._sequence += 1
+            self._forgotten = self._sequence
+            self._writes.clear()
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': self._counters['hits'] / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+
+    def _discard(self, slug: str) -> bool:
+        entry = self._entries.pop(slug, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
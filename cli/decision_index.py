@@ -0,0 +1,417 @@
+"""Persistent index of decision summaries backed by SQLite"""
+
+import base64
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from numbers import Number
+from typing import Dict, Any, Iterable, Iterator, List, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ('created_at', 'last_updated', 'frameworks_count', 'overall_score')
+# Free-text framework inputs included in full-text search
+SEARCH_INPUT_FIELDS = ('additional_notes', 'signal_description', 'option_description')
+# bm25 weights for the decision text, notes and recommendations columns
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+# NULL scores sort below every real score in either direction
+MISSING_SCORE = -1e308
+
+
+def decision_overall_score(frameworks: List[Dict[str, Any]]) -> Optional[float]:
+    """Mean overall score of the completed framework runs, or None if none has one"""
+    scores = [
+        f['result']['overall_score'] for f in frameworks or []
+        if isinstance(f.get('result'), dict) and isinstance(f['result'].get('overall_score'), Number)
+        and not isinstance(f['result']['overall_score'], bool)
+    ]
+    return sum(scores) / len(scores) if scores else None
+
+
+def summarize_decision(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the summary record shown in decision listings"""
+    text = data['decision']['text']
+    return {
+        'slug': data['decision']['slug'],
+        'text': text[:100] + '...' if len(text) > 100 else text,
+        'created_at': data['decision']['created_at'],
+        'last_updated': data['decision'].get('last_updated', data['decision']['created_at']),
+        'frameworks_count': data['metadata']['total_frameworks'],
+        'overall_score': decision_overall_score(data.get('frameworks'))
+    }
+
+
+def search_fields(data: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Decision text, free-text inputs and generated recommendations as searchable strings"""
+    notes, recommendations = [], []
+    for framework in data.get('frameworks') or []:
+        inputs = framework.get('inputs') or {}
+        notes.extend(str(inputs[field]) for field in SEARCH_INPUT_FIELDS if inputs.get(field))
+        result = framework.get('result')
+        if isinstance(result, dict):
+            recommendations.extend(str(item) for item in result.get('recommendations') or [])
+    return data['decision']['text'], '\n'.join(notes), '\n'.join(recommendations)
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query that requires every word, each matched as a prefix"""
+    words = re.findall(r'\w+', text)
+    if not words:
+        raise ValueError("Search query has no searchable words")
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def create_search_table(conn: sqlite3.Connection) -> bool:
+    """Create the FTS5 table keyed by decisions.rowid, returning True if it is new"""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'decision_search'"
+    ).fetchone()
+    conn.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS decision_search USING fts5("
+        "text, notes, recommendations, prefix = '2 3', tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    return exists is None
+
+
+def create_listing_state(conn: sqlite3.Connection, table: str) -> None:
+    """Keep a generation counter that every insert, update or delete on ``table`` advances
+
+    The counter lives next to a random epoch chosen when it is created, so a rebuilt
+    database never repeats an earlier stamp. Triggers keep it right for every writer,
+    including other processes.
+    """
+    conn.execute('CREATE TABLE IF NOT EXISTS listing_state (epoch TEXT NOT NULL, generation INTEGER NOT NULL)')
+    conn.execute('INSERT INTO listing_state (epoch, generation) SELECT lower(hex(randomblob(8))), 0 '
+                 'WHERE NOT EXISTS (SELECT 1 FROM listing_state)')
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        conn.execute(f'CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_listing AFTER {event} ON {table} '
+                     f'BEGIN UPDATE listing_state SET generation = generation + 1; END')
+
+
+def listing_stamp(conn: sqlite3.Connection) -> str:
+    """Token that changes whenever any decision summary changes"""
+    epoch, generation = conn.execute('SELECT epoch, generation FROM listing_state').fetchone()
+    return f'{epoch}-{generation}'
+
+
+def delete_search_rows(conn: sqlite3.Connection, slugs: List[str]) -> None:
+    """Remove search entries; must run before the decisions rows are replaced or deleted"""
+    conn.executemany(
+        'DELETE FROM decision_search WHERE rowid IN (SELECT rowid FROM decisions WHERE slug = ?)',
+        [(slug,) for slug in slugs]
+    )
+
+
+def insert_search_rows(conn: sqlite3.Connection, rows: List[Tuple[str, str, str, str]]) -> None:
+    """Add (slug, text, notes, recommendations) entries for decisions already written"""
+    conn.executemany(
+        'INSERT INTO decision_search (rowid, text, notes, recommendations) '
+        'SELECT rowid, ?, ?, ? FROM decisions WHERE slug = ?',
+        [(text, notes, recommendations, slug) for slug, text, notes, recommendations in rows]
+    )
+
+
+def search_summaries(conn: sqlite3.Connection, text: str, columns: Dict[str, str],
+                     limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+    """Ranked full-text search returning summaries with a highlighted snippet"""
+    match = fts_query(text)
+    weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+    select = ', '.join(f'{expr} AS {name}' for name, expr in columns.items())
+    rows = conn.execute(
+        f"SELECT {select}, snippet(decision_search, -1, '[', ']', '...', 12), "
+        f"bm25(decision_search, {weights}) AS rank "
+        f"FROM decision_search JOIN decisions d ON d.rowid = decision_search.rowid "
+        f"WHERE decision_search MATCH ? ORDER BY rank LIMIT ? OFFSET ?",
+        (match, limit, offset)
+    ).fetchall()
+    total = conn.execute('SELECT COUNT(*) FROM decision_search WHERE decision_search MATCH ?', (match,)).fetchone()[0]
+
+    names = list(columns)
+    results = []
+    for row in rows:
+        summary = dict(zip(names, row[:len(names)]))
+        summary['snippet'] = row[len(names)]
+        summary['rank'] = -row[len(names) + 1]
+        results.append(summary)
+    return {'query': text, 'results': results, 'total': total}
+
+
+@dataclass
+class DecisionQuery:
+    """Sorting, filtering and pagination options for decision listings
+
+    ``created_after`` is inclusive and ``created_before`` exclusive; both compare against
+    ISO timestamps, so plain dates work. ``cursor`` continues from the ``next_cursor`` of
+    a previous page and stays stable while decisions are added.
+    """
+    limit: Optional[int] = None
+    offset: int = 0
+    sort: str = 'created_at'
+    descending: bool = True
+    framework: Optional[str] = None
+    created_after: Optional[str] = None
+    created_before: Optional[str] = None
+    text_prefix: Optional[str] = None
+    cursor: Optional[str] = None
+
+    def __post_init__(self):
+        if self.sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{self.sort}'. Available: {', '.join(SORT_KEYS)}")
+        if (self.limit is not None and self.limit < 0) or self.offset < 0:
+            raise ValueError("limit and offset must not be negative")
+
+
+def encode_cursor(sort_value: Any, slug: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, slug]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    try:
+        sort_value, slug = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return sort_value, slug
+
+
+def query_summaries(conn: sqlite3.Connection, query: DecisionQuery, columns: Dict[str, str],
+                    frameworks_table: str, count: bool = True) -> Dict[str, Any]:
+    """Run a DecisionQuery against a ``decisions`` table and a (slug, name) frameworks table
+
+    ``columns`` maps each summary field to its SQL expression in the decisions table,
+    so the same query serves the file index and the SQLite backend.
+    """
+    sort_expr = columns[query.sort]
+    if query.sort == 'overall_score':
+        sort_expr = f'COALESCE({sort_expr}, {MISSING_SCORE})'
+
+    where, params = [], []
+    if query.framework:
+        where.append(f'EXISTS (SELECT 1 FROM {frameworks_table} f WHERE f.slug = d.slug AND f.name = ?)')
+        params.append(query.framework)
+    if query.created_after:
+        where.append(f"{columns['created_at']} >= ?")
+        params.append(query.created_after)
+    if query.created_before:
+        where.append(f"{columns['created_at']} < ?")
+        params.append(query.created_before)
+    if query.text_prefix:
+        escaped = query.text_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        where.append(f"{columns['text']} LIKE ? ESCAPE '\\'")
+        params.append(escaped + '%')
+
+    filter_sql = f" WHERE {' AND '.join(where)}" if where else ''
+    page_where, page_params = list(where), list(params)
+    if query.cursor:
+        sort_value, slug = decode_cursor(query.cursor)
+        op = '<' if query.descending else '>'
+        page_where.append(f'({sort_expr} {op} ? OR ({sort_expr} = ? AND d.slug {op} ?))')
+        page_params.extend([sort_value, sort_value, slug])
+
+    direction = 'DESC' if query.descending else 'ASC'
+    select = ', '.join(f'{expr} AS {name}' for name, expr in columns.items())
+    sql = (f"SELECT {select}, {sort_expr} FROM decisions d"
+           f"{' WHERE ' + ' AND '.join(page_where) if page_where else ''}"
+           f" ORDER BY {sort_expr} {direction}, d.slug {direction}"
+           f" LIMIT ? OFFSET ?")
+    # One row past the page tells whether another page follows
+    page_params.extend([query.limit + 1 if query.limit is not None else -1, query.offset])
+
+    rows = conn.execute(sql, page_params).fetchall()
+    total = conn.execute(f'SELECT COUNT(*) FROM decisions d{filter_sql}', params).fetchone()[0] if count else None
+
+    more = query.limit is not None and len(rows) > query.limit
+    rows = rows[:query.limit] if more else rows
+    names = list(columns)
+    decisions = [dict(zip(names, row[:-1])) for row in rows]
+    next_cursor = None
+    if more and rows:
+        next_cursor = encode_cursor(rows[-1][-1], decisions[-1]['slug'])
+    return {'decisions': decisions, 'total': total, 'next_cursor': next_cursor}
+
+
+class DecisionIndex:
+    """Keeps one summary row per decision file so listings never parse YAML"""
+
+    FILENAME = '.decision_index.sqlite3'
+    SCHEMA_VERSION = 5
+    SUMMARY_COLUMNS = ['slug', 'text', 'created_at', 'last_updated', 'frameworks_count', 'overall_score']
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self.path = os.path.join(data_dir, self.FILENAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create the index table, discarding it if the schema is outdated"""
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            # The index is derived data, so an outdated one is simply rebuilt
+            self._conn.execute('DROP TABLE IF EXISTS decisions')
+            self._conn.execute('DROP TABLE IF EXISTS decision_frameworks')
+            self._conn.execute('DROP TABLE IF EXISTS decision_search')
+            self._conn.execute('DROP TABLE IF EXISTS listing_state')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS decisions (
+                slug TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                last_updated TEXT NOT NULL,
+                frameworks_count INTEGER NOT NULL,
+                overall_score REAL,
+                version INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS decision_frameworks (
+                slug TEXT NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (slug, name)
+            )
+        """)
+        for column in ('created_at', 'last_updated', 'frameworks_count', 'overall_score'):
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_decisions_{column} ON decisions ({column}, slug)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_decision_frameworks_name ON decision_frameworks (name)')
+        create_search_table(self._conn)
+        create_listing_state(self._conn, 'decisions')
+        self._conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+    def upsert(self, data: Dict[str, Any], filepath: str) -> None:
+        """Record the summary of a decision together with its file stamp"""
+        stat = os.stat(filepath)
+        self._upsert_rows([self._row(data, summarize_decision(data), stat.st_mtime_ns, stat.st_size)])
+
+    def version(self, slug: str) -> int:
+        """Version of the indexed decision, 0 if it is not indexed"""
+        with self._lock:
+            row = self._conn.execute('SELECT version FROM decisions WHERE slug = ?', (slug,)).fetchone()
+        return row[0] if row else 0
+
+    def revision(self, slug: str) -> Optional[Tuple[int, str, int, int]]:
+        """(version, last_updated, mtime_ns, size) of the indexed decision, or None if it is not indexed"""
+        with self._lock:
+            return self._conn.execute('SELECT version, last_updated, mtime_ns, size FROM decisions WHERE slug = ?',
+                                      (slug,)).fetchone()
+
+    def listing_stamp(self) -> str:
+        with self._lock:
+            return listing_stamp(self._conn)
+
+    def remove(self, slug: str) -> None:
+        """Drop a decision from the index"""
+        with self._lock:
+            delete_search_rows(self._conn, [slug])
+            self._conn.execute('DELETE FROM decisions WHERE slug = ?', (slug,))
+            self._conn.execute('DELETE FROM decision_frameworks WHERE slug = ?', (slug,))
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Return decision summaries, newest first"""
+        return self.query(DecisionQuery(), count=False)['decisions']
+
+    def query(self, query: DecisionQuery, count: bool = True) -> Dict[str, Any]:
+        """Return one page of summaries with the total matching count and a cursor for the next page"""
+        columns = {name: f'd.{name}' for name in self.SUMMARY_COLUMNS}
+        with self._lock:
+            return query_summaries(self._conn, query, columns, 'decision_frameworks', count)
+
+    def search(self, text: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Ranked full-text search over decision text, notes and recommendations"""
+        columns = {name: f'd.{name}' for name in self.SUMMARY_COLUMNS}
+        with self._lock:
+            return search_summaries(self._conn, text, columns, limit, offset)
+
+    def sync(self, loader: Callable[[str], Dict[str, Any]], extension: str = '.yaml',
+             files: Optional[Iterable[Tuple[str, str, os.stat_result]]] = None,
+             on_removed: Optional[Callable[[str], None]] = None) -> int:
+        """Reconcile the index with files changed outside the app, using mtime and size
+
+        ``files`` yields (slug, path, stat) for every stored decision and defaults to the
+        ``*<extension>`` files directly in the data directory. Only files whose stamp
+        differs from the indexed one are parsed again; ``on_removed`` is called with the
+        slug of each decision whose file is gone. Returns the number of rows that were
+        refreshed or removed.
+        """
+        with self._lock:
+            indexed = {slug: (mtime_ns, size) for slug, mtime_ns, size in
+                       self._conn.execute('SELECT slug, mtime_ns, size FROM decisions')}
+
+        rows = []
+        seen = set()
+        for slug, path, stat in (files if files is not None else self.flat_files(extension)):
+            seen.add(slug)
+            if indexed.get(slug) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                data = loader(path)
+                summary = summarize_decision(data)
+            except Exception as e:
+                logger.warning("Skipping unreadable decision file %s: %s", path, e)
+                continue
+            # The slug the file is stored under is authoritative for lookups
+            summary['slug'] = slug
+            rows.append(self._row(data, summary, stat.st_mtime_ns, stat.st_size))
+
+        stale = [(slug,) for slug in indexed if slug not in seen]
+        self._upsert_rows(rows)
+        if stale:
+            with self._lock:
+                delete_search_rows(self._conn, [slug for slug, in stale])
+                self._conn.executemany('DELETE FROM decisions WHERE slug = ?', stale)
+                self._conn.executemany('DELETE FROM decision_frameworks WHERE slug = ?', stale)
+            if on_removed is not None:
+                for slug, in stale:
+                    on_removed(slug)
+        return len(rows) + len(stale)
+
+    def flat_files(self, extension: str) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """(slug, path, stat) of each ``<slug><extension>`` file directly in the data directory"""
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(extension) and entry.is_file():
+                    yield entry.name[:-len(extension)], entry.path, entry.stat()
+
+    def _row(self, data: Dict[str, Any], summary: Dict[str, Any], mtime_ns: int, size: int) -> Tuple:
+        """Summary columns, version and file stamp, the names of the frameworks applied and the search text"""
+        names = {f['name'] for f in data.get('frameworks') or [] if f.get('name')}
+        row = tuple(summary[column] for column in self.SUMMARY_COLUMNS) + (
+            data['decision'].get('version', 0), mtime_ns, size)
+        return row, names, search_fields(data)
+
+    def _upsert_rows(self, rows: List[Tuple]) -> None:
+        if not rows:
+            return
+        slugs = [row[0] for row, _, _ in rows]
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                delete_search_rows(self._conn, slugs)
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO decisions '
+                    '(slug, text, created_at, last_updated, frameworks_count, overall_score, version, mtime_ns, size) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [row for row, _, _ in rows]
+                )
+                self._conn.executemany('DELETE FROM decision_frameworks WHERE slug = ?', [(slug,) for slug in slugs])
+                self._conn.executemany(
+                    'INSERT INTO decision_frameworks (slug, name) VALUES (?, ?)',
+                    [(row[0], name) for row, names, _ in rows for name in names]
+                )
+                insert_search_rows(self._conn, [(row[0],) + fields for row, _, fields in rows])
+                self._conn.execute('COMMIT')
+            except Exception:
+                # Leave the shared connection usable for the next transaction
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
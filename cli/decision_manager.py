@@ -1,18 +1,69 @@
 """Decision Manager for handling decision data and persistence"""
 
-import yaml
+import functools
+import itertools
 import os
+import time
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import re
 
+from frameworks.metrics import METRICS
+from .storage import create_store, decision_summary, find_framework
+from .decision_index import DecisionQuery
+from .decision_cache import DecisionCache
+from .write_buffer import WriteBehindBuffer
+
+OPERATION_SECONDS = METRICS.histogram('decision_store_operation_seconds',
+                                      'Latency of DecisionManager operations', ('operation', 'backend'))
+OPERATION_ERRORS = METRICS.counter('decision_store_errors_total',
+                                   'DecisionManager operations that raised', ('operation', 'backend'))
+CACHE_LOOKUPS = METRICS.counter('decision_cache_lookups_total',
+                                'Decision cache lookups by outcome', ('backend', 'result'))
+
+
+def _instrumented(operation: str):
+    """Record the latency and errors of a DecisionManager method, labelled by backend"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            labels = (operation, self.backend)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            except Exception:
+                OPERATION_ERRORS.inc(labels)
+                raise
+            finally:
+                OPERATION_SECONDS.observe(time.perf_counter() - start, labels)
+        return wrapper
+    return decorator
+
 
 class DecisionManager:
-    """Manages decision data and persistence"""
+    """Manages decision data and persistence
+    
+    With ``write_behind``, framework updates are buffered and written in groups at most
+    ``flush_interval`` seconds later (or once ``flush_size`` are pending); loading or
+    saving a decision writes its pending updates first, so reads always see them, while
+    listings and search catch up at the next flush. ``fsync`` (None keeps the backend's
+    default) chooses whether writes wait until they are on disk.
+    """
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", backend: str = None,
+                 cache_size: int = 256, cache_bytes: int = 32 * 1024 * 1024,
+                 write_behind: bool = False, flush_interval: float = 0.5, flush_size: int = 100,
+                 fsync: Optional[bool] = None):
         self.data_dir = data_dir
         os.makedirs(data_dir, exist_ok=True)
+        self.backend = backend or os.environ.get('DECISION_STORAGE', 'yaml')
+        self.store = create_store(self.backend, data_dir)
+        if fsync is not None:
+            self.store.set_fsync(fsync)
+        self.cache = DecisionCache(cache_size, cache_bytes)
+        self.buffer = None
+        if write_behind:
+            self.buffer = WriteBehindBuffer(self.store, flush_interval, flush_size, on_flush=self.cache.invalidate)
     
     def create_decision_slug(self, decision_text: str) -> str:
         """Create a slug from decision text (first 10 words, spaces replaced with -)"""
@@ -22,10 +73,148 @@ class DecisionManager:
         slug = re.sub(r'[^\w\-]', '', slug).lower()
         return slug
     
+    @_instrumented('save')
     def save_decision(self, decision_text: str, framework_results: List[Dict[str, Any]]) -> str:
-        """Save decision and framework results to YAML file"""
-        slug = self.create_decision_slug(decision_text)
+        """Save decision and framework results to the storage backend and return its slug
         
+        Slugs keep only the first ten words, so a different decision that already holds
+        the slug is never replaced: the new one gets the first free ``<slug>-2``,
+        ``<slug>-3``... Saving the same text again replaces the stored decision.
+        """
+        base = self.create_decision_slug(decision_text)
+        for attempt in itertools.count(1):
+            slug = base if attempt == 1 else f"{base}-{attempt}"
+            try:
+                self._save(slug, decision_text, framework_results, exclusive=True)
+                return slug
+            except FileExistsError:
+                if self._stored_text(slug) == decision_text:
+                    self._save(slug, decision_text, framework_results)
+                    return slug
+    
+    @_instrumented('load')
+    def load_decision(self, slug: str) -> Dict[str, Any]:
+        """Load decision data, served from the cache while the stored copy is unchanged
+        
+        The returned document is shared with other callers and must not be modified;
+        deep-copy it first if changes are needed.
+        """
+        self._flush_pending(slug)
+        stamp = self.store.stamp(slug)
+        data = self.cache.get(slug, stamp)
+        CACHE_LOOKUPS.inc((self.backend, 'miss' if data is None else 'hit'))
+        if data is None:
+            version = self.cache.version(slug)
+            data = self.store.load(slug)
+            self.cache.put(slug, data, stamp, version)
+        return data
+    
+    @_instrumented('load_summary')
+    def load_summary(self, slug: str) -> Dict[str, Any]:
+        """Load a decision with a short summary of each framework run instead of its inputs and result
+        
+        Backends that store framework runs separately read only the summary; the others
+        summarize the (cached) full document.
+        """
+        if not self.store.partial_reads:
+            return decision_summary(self.load_decision(slug))
+        self._flush_pending(slug)
+        return self.store.load_summary(slug)
+    
+    @_instrumented('load_framework')
+    def load_framework(self, slug: str, framework_name: str) -> Dict[str, Any]:
+        """Load the stored entry of one framework run, raising KeyError if it was never run
+        
+        Like load_decision, the entry may be shared and must not be modified.
+        """
+        if not self.store.partial_reads:
+            return find_framework(self.load_decision(slug), slug, framework_name)
+        self._flush_pending(slug)
+        return self.store.load_framework(slug, framework_name)
+    
+    @_instrumented('revision')
+    def revision(self, slug: str) -> Optional[Tuple[int, str]]:
+        """Version and last_updated of a stored decision without loading it, or None if not cheaply known"""
+        self._flush_pending(slug)
+        return self.store.revision(slug)
+    
+    @_instrumented('listing_stamp')
+    def listing_stamp(self) -> Optional[str]:
+        """Token that changes whenever a decision listing may change, or None if the backend has none"""
+        return self.store.listing_stamp()
+    
+    @_instrumented('list')
+    def list_decisions(self, **options) -> List[Dict[str, Any]]:
+        """List saved decisions, answered from the index
+        
+        Accepts the DecisionQuery options: limit, offset, cursor, sort ('created_at',
+        'last_updated', 'frameworks_count', 'overall_score'), descending, framework
+        (framework name), created_after, created_before and text_prefix.
+        """
+        return self.store.list_summaries(DecisionQuery(**options))
+    
+    @_instrumented('query')
+    def query_decisions(self, **options) -> Dict[str, Any]:
+        """Like list_decisions, but also return the total match count and the next page cursor"""
+        return self.store.query_summaries(DecisionQuery(**options))
+
+    @_instrumented('search')
+    def search_decisions(self, text: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Ranked full-text search with prefix matching over decision text, notes and recommendations"""
+        if limit < 1 or offset < 0:
+            raise ValueError("limit must be positive and offset non-negative")
+        return self.store.search(text, limit, offset)
+    
+    @_instrumented('update')
+    def update_decision(self, slug: str, framework_result: Dict[str, Any],
+                        expected_version: Optional[int] = None) -> Optional[int]:
+        """Update decision with new framework result and return its new version
+        
+        With ``expected_version`` (the ``decision.version`` a client last read) the update
+        is only applied if nobody wrote in between; otherwise VersionConflict is raised.
+        In write-behind mode unconditional updates are buffered and None is returned,
+        since the version is only known once they are written.
+        """
+        timestamp = datetime.now().isoformat()
+        if self.buffer is not None:
+            if expected_version is None:
+                if not self.buffer.has_pending(slug) and not self.store.exists(slug):
+                    raise FileNotFoundError(f"Decision not found: {slug}")
+                self.buffer.add(slug, framework_result, timestamp)
+                return None
+            self._flush_pending(slug)
+        self.cache.invalidate(slug)
+        try:
+            return self.store.upsert_framework(slug, framework_result, timestamp, expected_version)
+        finally:
+            self.cache.invalidate(slug)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the decision cache"""
+        return self.cache.stats()
+    
+    def flush(self) -> int:
+        """Write all buffered updates now; returns the number of decisions flushed"""
+        return self.buffer.flush() if self.buffer is not None else 0
+    
+    def close(self) -> None:
+        """Write buffered updates and release the storage backend"""
+        if self.buffer is not None:
+            self.buffer.close()
+        self.store.close()
+    
+    def _flush_pending(self, slug: str) -> None:
+        if self.buffer is not None and self.buffer.has_pending(slug):
+            self.buffer.flush([slug])
+    
+    def _stored_text(self, slug: str) -> Optional[str]:
+        try:
+            return self.load_decision(slug)['decision']['text']
+        except FileNotFoundError:
+            return None
+    
+    def _save(self, slug: str, decision_text: str, framework_results: List[Dict[str, Any]],
+              exclusive: bool = False) -> str:
         decision_data = {
             'decision': {
                 'text': decision_text,
@@ -40,70 +229,9 @@ class DecisionManager:
             }
         }
         
-        filename = f"{slug}.yaml"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        with open(filepath, 'w') as f:
-            yaml.dump(decision_data, f, default_flow_style=False, indent=2)
-        
-        return filepath
-    
-    def load_decision(self, slug: str) -> Dict[str, Any]:
-        """Load decision data from YAML file"""
-        filename = f"{slug}.yaml"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Decision file not found: {filename}")
-        
-        with open(filepath, 'r') as f:
-            return yaml.safe_load(f)
-    
-    def list_decisions(self) -> List[Dict[str, str]]:
-        """List all saved decisions"""
-        decisions = []
-        
-        for filename in os.listdir(self.data_dir):
-            if filename.endswith('.yaml'):
-                try:
-                    data = self.load_decision(filename[:-5])  # Remove .yaml extension
-                    decisions.append({
-                        'slug': data['decision']['slug'],
-                        'text': data['decision']['text'][:100] + '...' if len(data['decision']['text']) > 100 else data['decision']['text'],
-                        'created_at': data['decision']['created_at'],
-                        'frameworks_count': data['metadata']['total_frameworks']
-                    })
-                except Exception:
-                    continue
-        
-        return sorted(decisions, key=lambda x: x['created_at'], reverse=True)
-    
-    def update_decision(self, slug: str, framework_result: Dict[str, Any]) -> None:
-        """Update decision with new framework result"""
-        data = self.load_decision(slug)
-        
-        # Update or add framework result
-        framework_name = framework_result['name']
-        existing_index = None
-        
-        for i, framework in enumerate(data['frameworks']):
-            if framework['name'] == framework_name:
-                existing_index = i
-                break
-        
-        if existing_index is not None:
-            data['frameworks'][existing_index] = framework_result
-        else:
-            data['frameworks'].append(framework_result)
-        
-        # Update metadata
-        data['decision']['last_updated'] = datetime.now().isoformat()
-        data['metadata']['total_frameworks'] = len(data['frameworks'])
-        data['metadata']['completed_frameworks'] = len([f for f in data['frameworks'] if f.get('result')])
-        
-        # Save updated data
-        filename = f"{slug}.yaml"
-        filepath = os.path.join(self.data_dir, filename)
-        
-        with open(filepath, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
\ No newline at end of file
+        self._flush_pending(slug)
+        self.cache.invalidate(slug)
+        try:
+            return self.store.save(slug, decision_data, exclusive)
+        finally:
+            self.cache.invalidate(slug)
@@ -0,0 +1,175 @@
+"""On-disk serialization formats for decision documents"""
+
+import json
+import os
+import uuid
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import numpy as np
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# libyaml bindings are an order of magnitude faster than the pure-Python fallback
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumperBase = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def to_plain(value: Any) -> Any:
+    """Fallback for values the encoders do not know: tuples, NumPy scalars and arrays"""
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+
+class YamlDumper(_YamlDumperBase):
+    """Safe dumper that writes tuples and NumPy values as plain YAML rather than failing"""
+
+
+YamlDumper.add_representer(tuple, lambda dumper, value: dumper.represent_list(list(value)))
+YamlDumper.add_multi_representer(np.generic, lambda dumper, value: dumper.represent_data(value.item()))
+YamlDumper.add_representer(np.ndarray, lambda dumper, value: dumper.represent_list(value.tolist()))
+
+
+class DocumentFormat:
+    """A named serialization with its file extension and byte-level encode/decode"""
+
+    def __init__(self, name: str, extension: str, dumps: Callable[[Dict[str, Any]], bytes],
+                 loads: Callable[[bytes], Dict[str, Any]], requires: Optional[str] = None,
+                 available: bool = True):
+        self.name = name
+        self.extension = extension
+        self.dumps = dumps
+        self.loads = loads
+        self.requires = requires
+        self.available = available
+
+    def check_available(self) -> None:
+        if not self.available:
+            raise ImportError(f"The {self.name} format requires the '{self.requires}' package")
+
+
+def _yaml_dumps(data: Dict[str, Any]) -> bytes:
+    return yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, indent=2).encode('utf-8')
+
+
+def _yaml_loads(raw: bytes) -> Dict[str, Any]:
+    return yaml.load(raw, Loader=YamlLoader)
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=to_plain,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=to_plain).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Dict[str, Any]:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _msgpack_dumps(data: Dict[str, Any]) -> bytes:
+    return msgpack.packb(data, default=to_plain, use_bin_type=True)
+
+
+def _msgpack_loads(raw: bytes) -> Dict[str, Any]:
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
+YAML = DocumentFormat('yaml', '.yaml', _yaml_dumps, _yaml_loads)
+JSON = DocumentFormat('json', '.json', _json_dumps, _json_loads)
+MSGPACK = DocumentFormat('msgpack', '.msgpack', _msgpack_dumps, _msgpack_loads,
+                         requires='msgpack', available=msgpack is not None)
+
+DOCUMENT_FORMATS = {fmt.name: fmt for fmt in (YAML, JSON, MSGPACK)}
+_BY_EXTENSION = {fmt.extension: fmt for fmt in DOCUMENT_FORMATS.values()}
+_BY_EXTENSION['.yml'] = YAML
+
+
+def detect_format(path: str, head: bytes = b'') -> DocumentFormat:
+    """Pick a format from the file extension, falling back to the leading bytes"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in _BY_EXTENSION:
+        return _BY_EXTENSION[extension]
+
+    stripped = head.lstrip()
+    if stripped[:1] in (b'{', b'['):
+        return JSON
+    # MessagePack documents are maps: fixmap (0x80-0x8f), map16 (0xde) or map32 (0xdf)
+    if head[:1] and (0x80 <= head[0] <= 0x8f or head[0] in (0xde, 0xdf)):
+        return MSGPACK
+    return YAML
+
+
+def read_document(path: str) -> Dict[str, Any]:
+    """Load a decision document in whichever supported format it was written"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    fmt = detect_format(path, raw[:16])
+    fmt.check_available()
+    return fmt.loads(raw)
+
+
+# Suffix of in-flight temporary files; never a document extension, so scans skip them
+TEMP_SUFFIX = '.tmp'
+
+
+def write_document(path: str, data: Dict[str, Any], fmt: DocumentFormat, fsync: bool = True) -> int:
+    """Serialize and atomically replace a document, returning the number of bytes written
+
+    The payload is written (and with ``fsync``, flushed to disk) to a temporary file in
+    the same directory and then renamed over ``path``, so readers and crashes only ever
+    see the old or the new document, never a truncated one.
+    """
+    fmt.check_available()
+    payload = fmt.dumps(data)
+    temp_path, fd = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return len(payload)
+
+
+def _create_temp_file(path: str) -> Tuple[str, int]:
+    """Create a uniquely named temporary file next to ``path``
+
+    Created with mode 0o666 so the process umask applies, as it would to a file created
+    with ``open`` (``tempfile.mkstemp`` makes files readable by their owner only).
+    """
+    directory, name = os.path.split(path)
+    while True:
+        temp_path = os.path.join(directory, f'.{name}.{uuid.uuid4().hex[:12]}{TEMP_SUFFIX}')
+        try:
+            return temp_path, os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+
+
+def convert_document(path: str, target: str, output_path: Optional[str] = None) -> str:
+    """Rewrite a decision file in another format next to the original, returning the new path"""
+    if target not in DOCUMENT_FORMATS:
+        raise ValueError(f"Unknown format '{target}'. Available: {', '.join(DOCUMENT_FORMATS)}")
+    fmt = DOCUMENT_FORMATS[target]
+    output_path = output_path or os.path.splitext(path)[0] + fmt.extension
+    write_document(output_path, read_document(path), fmt)
+    return output_path
@@ -0,0 +1,129 @@
+"""Validators, response compression and rendered-template caching for the web app"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content codings offered to clients, most compact first
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+# Fast settings: payloads are compressed on every response that misses the HTTP cache
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content coding '{encoding}'")
+
+
+def coded_etags(etag: str) -> Tuple[str, ...]:
+    """An entity tag and its variants for each content coding, as sent by compressed responses
+
+    A compressed body is a different representation, so it gets its own strong tag:
+    ``<etag>-gzip`` or ``<etag>-br``.
+    """
+    return (etag,) + tuple(f'{etag}-{encoding}' for encoding in ENCODINGS)
+
+
+def strip_coding(etag: str) -> str:
+    """The entity tag a coded variant was derived from"""
+    for encoding in ENCODINGS:
+        if etag.endswith(f'-{encoding}'):
+            return etag[:-len(encoding) - 1]
+    return etag
+
+
+def last_modified(timestamp: Optional[str]) -> Optional[datetime]:
+    """HTTP Last-Modified value for a stored ISO timestamp (naive ones are local time)"""
+    if not timestamp:
+        return None
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    return moment.astimezone(timezone.utc).replace(microsecond=0)
+
+
+class FragmentCache:
+    """LRU of rendered template output, keyed by everything the output depends on
+
+    Keys carry the version of their data (a decision version, a listing stamp), so an
+    entry is never invalidated: a change produces a new key and the old entry ages out.
+    Memory is capped by entry count and by the approximate size (in characters) of the output.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> rendered text
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return text
+
+    def put(self, key: Hashable, text: str) -> None:
+        if self.max_entries < 1 or len(text) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = text
+            self._bytes += len(text)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._counters['evictions'] += 1
+
+    def render(self, key: Hashable, render: Callable[[], str]) -> str:
+        """Cached output for ``key``, calling ``render`` to produce it on a miss"""
+        text = self.get(key)
+        if text is None:
+            text = render()
+            self.put(key, text)
+        return text
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': self._counters['hits'] / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+
+
+def template_fingerprint(sources: Iterable[str]) -> str:
+    """Short hash of template sources, so cached pages change when the templates do"""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source.encode('utf-8'))
+    return digest.hexdigest()[:8]
@@ -0,0 +1,95 @@
+"""Per-decision locks shared by threads and worker processes"""
+
+import hashlib
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks only cover threads of this process
+    fcntl = None
+
+
+class DecisionLocks:
+    """One lock file per slug under ``<data_dir>/.locks/ab/cd/``, held with ``flock``
+
+    ``flock`` locks belong to an open file description, so they exclude other threads
+    as well as other processes. Different slugs use different files and never wait
+    for each other. Lock files are spread over directories by a hash of the slug, like
+    sharded documents, and ``discard`` removes the file of a decision that is gone. A
+    waiter that opened a file before it was removed notices once it holds the lock and
+    retries on the new file, so removal never lets two writers in at once.
+    """
+
+    DIRNAME = '.locks'
+
+    def __init__(self, data_dir: str):
+        self.directory = os.path.join(data_dir, self.DIRNAME)
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread_locks = {}
+        self._guard = threading.Lock()
+        self._remove_flat_files()
+
+    def path_for(self, slug: str) -> str:
+        digest = hashlib.sha1(slug.encode('utf-8')).hexdigest()
+        # Slugs are already file-name safe; anything else is replaced rather than trusted
+        return os.path.join(self.directory, digest[:2], digest[2:4], re.sub(r'[^\w\-.]', '_', slug) + '.lock')
+
+    @contextmanager
+    def lock(self, slug: str) -> Iterator[None]:
+        """Hold the exclusive lock for ``slug`` for the duration of the block"""
+        if fcntl is None:
+            with self._guard:
+                thread_lock = self._thread_locks.setdefault(slug, threading.Lock())
+            with thread_lock:
+                yield
+            return
+
+        fd = self._acquire(self.path_for(slug))
+        try:
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
+    def discard(self, slug: str) -> None:
+        """Remove the lock file of a decision that no longer exists"""
+        if fcntl is None:
+            return
+        path = self.path_for(slug)
+        if not os.path.exists(path):
+            return
+        fd = self._acquire(path)
+        try:
+            os.unlink(path)
+        finally:
+            os.close(fd)
+
+    def _acquire(self, path: str) -> int:
+        """Open and lock the file currently at ``path``, returning its descriptor"""
+        while True:
+            try:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                continue
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                current = None
+            if current is not None and current.st_ino == os.fstat(fd).st_ino:
+                return fd
+            os.close(fd)  # removed by discard while waiting; lock the new file instead
+
+    def _remove_flat_files(self) -> None:
+        """Drop ``.locks/<slug>.lock`` files left by releases that kept all lock files in one directory"""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.lock') and entry.is_file():
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
@@ -0,0 +1,153 @@
+"""cProfile and tracemalloc helpers for ``cli.py --profile`` and sampled web requests
+
+Profiles are kept in the pstats format, so they open with ``python -m pstats FILE`` or
+viewers such as snakeviz, and are summarized as text sorted by cumulative time.
+"""
+
+import cProfile
+import io
+import itertools
+import marshal
+import pstats
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+SORT_KEYS = ('cumulative', 'tottime', 'calls', 'ncalls', 'name')
+
+
+def format_stats(stats: pstats.Stats, sort: str = 'cumulative', limit: int = 40) -> str:
+    """Text listing of the ``limit`` most expensive functions"""
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key '{sort}'. Available: {', '.join(SORT_KEYS)}")
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def format_allocations(snapshot: tracemalloc.Snapshot, limit: int = 20) -> str:
+    """Source lines that allocated the most memory still alive at the end of the run"""
+    top = snapshot.statistics('lineno')
+    total = sum(stat.size for stat in top)
+    lines = [f"Allocations still held: {total / 1024:.1f} KiB in {sum(stat.count for stat in top)} blocks",
+             f"Top {min(limit, len(top))} source lines:"]
+    for stat in top[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}")
+    return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def profile_run(path: str, limit: int = 40, stream=sys.stderr) -> Iterator[None]:
+    """Profile the enclosed block with cProfile and tracemalloc
+
+    Writes the raw pstats data to ``path`` and a report (cumulative-time listing,
+    peak traced memory and the top allocation sites) to ``path + '.txt'``, and prints
+    the wall time and peak memory to ``stream``.
+    """
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - started
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>')
+        ])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        profiler.dump_stats(path)
+        summary = f"Wall time: {elapsed:.3f} s, peak traced memory: {peak / 1024 / 1024:.1f} MiB\n"
+        report = '\n'.join([summary, format_stats(pstats.Stats(profiler), limit=limit), format_allocations(snapshot)])
+        with open(path + '.txt', 'w') as f:
+            f.write(report)
+        print(f"\n{summary}Profile written to {path} (report: {path}.txt)", file=stream)
+
+
+class RequestProfiler:
+    """Profiles a sample of web requests and keeps the most recent ones in memory
+
+    A request is profiled when it carries ``header`` (with ``token`` as its value when a
+    token is configured) or, failing that, with probability ``sample_rate``.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, keep: int = 20, header: str = 'X-Profile',
+                 token: Optional[str] = None):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.sample_rate = sample_rate
+        self.header = header
+        self.token = token
+        self._profiles = deque(maxlen=keep)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def wants(self, headers) -> bool:
+        """Whether a request with these headers should be profiled"""
+        value = headers.get(self.header)
+        if value is not None and (self.token is None or value == self.token):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self) -> Optional[cProfile.Profile]:
+        """Enable a profiler for the current thread, or None if another profiler is active"""
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return None
+        return profiler
+
+    def new_id(self) -> int:
+        """Reserve the ID of a profile, e.g. to announce it before a streamed body is finished"""
+        return next(self._ids)
+
+    def finish(self, profiler: cProfile.Profile, info: Dict[str, Any],
+               profile_id: Optional[int] = None) -> Dict[str, Any]:
+        """Stop ``profiler`` and store its stats alongside ``info`` (method, route, status...)"""
+        profiler.disable()
+        profiler.create_stats()
+        entry = dict(info, id=profile_id if profile_id is not None else self.new_id(),
+                     recorded_at=datetime.now().isoformat(timespec='seconds'))
+        entry['_stats'] = marshal.dumps(profiler.stats)
+        with self._lock:
+            self._profiles.append(entry)
+        return entry
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Summaries of the kept profiles, newest first"""
+        with self._lock:
+            entries = list(self._profiles)
+        return [{key: value for key, value in entry.items() if not key.startswith('_')}
+                for entry in reversed(entries)]
+
+    def raw(self, profile_id: int) -> Optional[bytes]:
+        """Stats in the file format written by ``cProfile.Profile.dump_stats``"""
+        with self._lock:
+            entry = next((entry for entry in self._profiles if entry['id'] == profile_id), None)
+        return entry['_stats'] if entry else None
+
+    def stats(self, profile_id: int) -> Optional[pstats.Stats]:
+        data = self.raw(profile_id)
+        if data is None:
+            return None
+        stats = pstats.Stats()
+        stats.stats = marshal.loads(data)
+        stats.get_top_level_stats()
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
@@ -0,0 +1,79 @@
+"""Decision IDs, hash-prefixed shard paths and the slug to ID alias map"""
+
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Dict, Iterator, Optional, Tuple
+
+SHARD_DIRNAME = 'decisions'
+
+
+def new_decision_id() -> str:
+    """Random 128-bit ID as 32 hex characters; its prefix spreads files evenly over shards"""
+    return uuid.uuid4().hex
+
+
+def shard_path(data_dir: str, decision_id: str, extension: str) -> str:
+    """``<data_dir>/decisions/ab/cd/<id><extension>`` for an ID starting with 'abcd'"""
+    return os.path.join(data_dir, SHARD_DIRNAME, decision_id[:2], decision_id[2:4], decision_id + extension)
+
+
+class AliasMap:
+    """Persistent slug -> decision ID map in SQLite, shared by all worker processes
+
+    Assigned IDs never change, so successful lookups are also kept in memory; misses
+    always go to the database because another worker may have just added the slug.
+    """
+
+    FILENAME = '.aliases.sqlite3'
+    # Lookups remembered in memory before the remembered set is reset
+    MAX_KNOWN = 100000
+
+    def __init__(self, data_dir: str):
+        self.path = os.path.join(data_dir, self.FILENAME)
+        self._lock = threading.Lock()
+        self._known: Dict[str, str] = {}
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA busy_timeout=5000')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS aliases (slug TEXT PRIMARY KEY, id TEXT NOT NULL UNIQUE)')
+
+    def get(self, slug: str) -> Optional[str]:
+        decision_id = self._known.get(slug)
+        if decision_id is None:
+            with self._lock:
+                row = self._conn.execute('SELECT id FROM aliases WHERE slug = ?', (slug,)).fetchone()
+            if row is not None:
+                decision_id = row[0]
+                self._remember(slug, decision_id)
+        return decision_id
+
+    def set(self, slug: str, decision_id: str) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO aliases (slug, id) VALUES (?, ?)', (slug, decision_id))
+        self._remember(slug, decision_id)
+
+    def has_id(self, decision_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute('SELECT 1 FROM aliases WHERE id = ?', (decision_id,)).fetchone() is not None
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """All (slug, ID) pairs, read up front so callers may write while iterating"""
+        with self._lock:
+            rows = self._conn.execute('SELECT slug, id FROM aliases').fetchall()
+        return iter(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM aliases').fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, slug: str, decision_id: str) -> None:
+        if len(self._known) >= self.MAX_KNOWN:
+            self._known.clear()
+        self._known[slug] = decision_id
@@ -0,0 +1,894 @@
+"""Storage backends for decision data"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Callable, List, Iterator, Hashable, Optional, Set, Tuple
+
+from .decision_index import (DecisionIndex, DecisionQuery, decision_overall_score, query_summaries,
+                             create_listing_state, create_search_table, delete_search_rows, insert_search_rows,
+                             listing_stamp, search_fields, search_summaries)
+from .formats import DocumentFormat, YAML, JSON, MSGPACK, TEMP_SUFFIX, read_document, write_document, to_plain
+from .locking import DecisionLocks
+from .sharding import SHARD_DIRNAME, AliasMap, new_decision_id, shard_path
+from frameworks.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Leading recommendations kept for each framework in a decision summary
+SUMMARY_RECOMMENDATIONS = 2
+
+BYTES_WRITTEN = METRICS.counter('decision_store_bytes_written_total',
+                                'Serialized decision bytes written by storage backends', ('backend',))
+
+
+class VersionConflict(Exception):
+    """A conditional write named a version that is no longer the stored one"""
+
+    def __init__(self, slug: str, expected: int, current: int):
+        super().__init__(f"Decision '{slug}' is at version {current}, not {expected}")
+        self.slug = slug
+        self.expected = expected
+        self.current = current
+
+
+def decision_version(data: Dict[str, Any]) -> int:
+    """Write counter of a decision document; documents from before versioning count as 0"""
+    return data['decision'].get('version', 0)
+
+
+def record_hash(record: Optional[Dict[str, Any]]) -> str:
+    """Content hash of a framework entry, independent of key order and tuple/list or NumPy types"""
+    encoded = json.dumps(record, sort_keys=True, default=to_plain).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def apply_framework_result(data: Dict[str, Any], framework_result: Dict[str, Any], timestamp: str) -> None:
+    """Insert or replace a framework entry in a decision document and refresh its metadata"""
+    framework_name = framework_result['name']
+    for i, framework in enumerate(data['frameworks']):
+        if framework['name'] == framework_name:
+            data['frameworks'][i] = framework_result
+            break
+    else:
+        data['frameworks'].append(framework_result)
+
+    data['decision']['last_updated'] = timestamp
+    data['metadata']['total_frameworks'] = len(data['frameworks'])
+    data['metadata']['completed_frameworks'] = len([f for f in data['frameworks'] if f.get('result')])
+
+
+def framework_summary(framework: Dict[str, Any]) -> Dict[str, Any]:
+    """Name, completion, overall score and leading recommendations of a framework entry"""
+    result = framework.get('result') if isinstance(framework.get('result'), dict) else {}
+    return {
+        'name': framework['name'],
+        'completed': bool(framework.get('result')),
+        'overall_score': result.get('overall_score'),
+        'recommendations': list(result.get('recommendations') or [])[:SUMMARY_RECOMMENDATIONS]
+    }
+
+
+def decision_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """A decision document with each framework entry reduced to its framework_summary"""
+    return {
+        'decision': dict(data['decision']),
+        'frameworks': [framework_summary(framework) for framework in data['frameworks']],
+        'metadata': dict(data['metadata'])
+    }
+
+
+def find_framework(data: Dict[str, Any], slug: str, framework_name: str) -> Dict[str, Any]:
+    """The entry of a framework in a decision document, raising KeyError if it was never run"""
+    for framework in data['frameworks']:
+        if framework['name'] == framework_name:
+            return framework
+    raise KeyError(f"Framework '{framework_name}' has not been run on decision '{slug}'")
+
+
+class DecisionStore(ABC):
+    """Abstract storage backend used by DecisionManager"""
+
+    name = None
+    # Whether load_summary and load_framework read less than a full load
+    partial_reads = False
+
+    @abstractmethod
+    def exists(self, slug: str) -> bool:
+        """Return whether a decision is stored under this slug"""
+        pass
+
+    @abstractmethod
+    def load(self, slug: str) -> Dict[str, Any]:
+        """Load a full decision document, raising FileNotFoundError if missing"""
+        pass
+
+    def load_summary(self, slug: str) -> Dict[str, Any]:
+        """Load a decision with only the framework_summary of each framework entry"""
+        return decision_summary(self.load(slug))
+
+    def load_framework(self, slug: str, framework_name: str) -> Dict[str, Any]:
+        """Load one framework entry (name, inputs and result) of a decision
+
+        Raises FileNotFoundError if the decision is missing and KeyError if the framework
+        was never run on it.
+        """
+        return find_framework(self.load(slug), slug, framework_name)
+
+    @abstractmethod
+    def save(self, slug: str, data: Dict[str, Any], exclusive: bool = False) -> str:
+        """Store a full decision document and return its location
+
+        The stored version is one more than both the replaced decision's and ``data``'s,
+        so versions never repeat for a slug. With ``exclusive``, FileExistsError is raised
+        instead of replacing a decision already stored under the slug.
+        """
+        pass
+
+    def upsert_framework(self, slug: str, framework_result: Dict[str, Any], timestamp: str,
+                         expected_version: Optional[int] = None) -> int:
+        """Insert or replace a single framework entry of a decision and return its new version
+
+        Raises VersionConflict if ``expected_version`` is given and no longer current.
+        """
+        return self.upsert_frameworks(slug, [framework_result], timestamp, expected_version)
+
+    @abstractmethod
+    def upsert_frameworks(self, slug: str, framework_results: List[Dict[str, Any]], timestamp: str,
+                          expected_version: Optional[int] = None, skip_unchanged: bool = False) -> int:
+        """Insert or replace several framework entries in one write and return the new version
+
+        With ``skip_unchanged``, nothing is written and the version stays the same when
+        every entry already holds identical content.
+        """
+        pass
+
+    @abstractmethod
+    def query_summaries(self, query: DecisionQuery, count: bool = True) -> Dict[str, Any]:
+        """Return a page of decision summaries, the total match count and the next cursor"""
+        pass
+
+    def list_summaries(self, query: Optional[DecisionQuery] = None) -> List[Dict[str, Any]]:
+        """Return decision summaries, newest first unless the query says otherwise"""
+        return self.query_summaries(query or DecisionQuery(), count=False)['decisions']
+
+    @abstractmethod
+    def search(self, text: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Rank decisions by how well their text, notes and recommendations match ``text``"""
+        pass
+
+    @abstractmethod
+    def iter_slugs(self) -> Iterator[str]:
+        """Iterate over the slugs of all stored decisions"""
+        pass
+
+    def stamp(self, slug: str) -> Optional[Hashable]:
+        """Cheap token that changes whenever the stored decision changes, or None if unknown"""
+        return None
+
+    def revision(self, slug: str) -> Optional[Tuple[int, str]]:
+        """Version and last_updated of a decision without loading it
+
+        None means they cannot be told cheaply and up to date (or the decision is missing),
+        in which case callers load the decision instead.
+        """
+        return None
+
+    def listing_stamp(self) -> Optional[str]:
+        """Token that changes whenever any decision summary changes, or None if unknown"""
+        return None
+
+    def set_fsync(self, enabled: bool) -> None:
+        """Choose whether each write waits until it is on disk"""
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the backend"""
+        pass
+
+
+class FileDecisionStore(DecisionStore):
+    """One document per decision in a flat data directory, in the subclass's format
+
+    Writes hold the decision's lock (see DecisionLocks) and replace the file atomically,
+    so concurrent workers neither lose updates nor expose half-written documents.
+    """
+
+    name = None
+    format: DocumentFormat = None
+    # Temporary files older than this were left by a crashed writer
+    STALE_TEMP_SECONDS = 3600
+    # fsync each document before it replaces the old one; off trades durability on power loss for speed
+    fsync = True
+
+    def __init__(self, data_dir: str):
+        self.format.check_available()
+        self.extension = self.format.extension
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self.locks = DecisionLocks(data_dir)
+        self._remove_stale_temp_files()
+        self.index = DecisionIndex(data_dir)
+        # Pick up files added, edited or removed while the app was not running
+        self.index.sync(self._read_file, self.extension, self._stored_files(), on_removed=self.locks.discard)
+
+    def path_for(self, slug: str) -> str:
+        return os.path.join(self.data_dir, f"{slug}{self.extension}")
+
+    def set_fsync(self, enabled: bool) -> None:
+        self.fsync = enabled
+
+    def exists(self, slug: str) -> bool:
+        return os.path.exists(self.path_for(slug))
+
+    def stamp(self, slug: str) -> Optional[Hashable]:
+        try:
+            stat = os.stat(self.path_for(slug))
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def revision(self, slug: str) -> Optional[Tuple[int, str]]:
+        indexed = self.index.revision(slug)
+        if indexed is None:
+            return None
+        try:
+            stat = os.stat(self.path_for(slug))
+        except FileNotFoundError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != tuple(indexed[2:]):
+            return None  # edited outside the app since it was indexed
+        return indexed[0], indexed[1]
+
+    def listing_stamp(self) -> Optional[str]:
+        return self.index.listing_stamp()
+
+    def load(self, slug: str) -> Dict[str, Any]:
+        filepath = self.path_for(slug)
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Decision file not found: {os.path.basename(filepath)}")
+        return self._read_file(filepath)
+
+    def save(self, slug: str, data: Dict[str, Any], exclusive: bool = False) -> str:
+        with self.locks.lock(slug):
+            if exclusive and self.exists(slug):
+                raise FileExistsError(f"Decision already exists: {slug}")
+            # The index holds the version of every file written or synced, so no parse is needed
+            version = max(self.index.version(slug), decision_version(data)) + 1
+            return self._store(slug, dict(data, decision=dict(data['decision'], version=version)))
+
+    def upsert_frameworks(self, slug: str, framework_results: List[Dict[str, Any]], timestamp: str,
+                          expected_version: Optional[int] = None, skip_unchanged: bool = False) -> int:
+        with self.locks.lock(slug):
+            data = self.load(slug)
+            current = decision_version(data)
+            if expected_version is not None and expected_version != current:
+                raise VersionConflict(slug, expected_version, current)
+            if skip_unchanged:
+                stored = {framework['name']: framework for framework in data['frameworks']}
+                if all(record_hash(stored.get(result['name'])) == record_hash(result)
+                       for result in framework_results):
+                    return current
+            for framework_result in framework_results:
+                apply_framework_result(data, framework_result, timestamp)
+            data['decision']['version'] = current + 1
+            self._store(slug, data)
+        return current + 1
+
+    def query_summaries(self, query: DecisionQuery, count: bool = True) -> Dict[str, Any]:
+        return self.index.query(query, count)
+
+    def search(self, text: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        return self.index.search(text, limit, offset)
+
+    def iter_slugs(self) -> Iterator[str]:
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(self.extension) and entry.is_file():
+                    yield entry.name[:-len(self.extension)]
+
+    def _read_file(self, filepath: str) -> Dict[str, Any]:
+        return read_document(filepath)
+
+    def _stored_files(self) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """(slug, path, stat) of every stored decision, for reconciling the index"""
+        return self.index.flat_files(self.extension)
+
+    def _store(self, slug: str, data: Dict[str, Any]) -> str:
+        """Write a decision document and return its path; caller holds the decision's lock"""
+        filepath = self.path_for(slug)
+        self._write_file(filepath, data)
+        return filepath
+
+    def _write_file(self, filepath: str, data: Dict[str, Any], document: Optional[Dict[str, Any]] = None) -> None:
+        """Write decision data and keep the index in sync; caller holds the decision's lock
+
+        ``document`` is written instead of ``data`` when the file holds less than the full
+        decision, which the index is still built from.
+        """
+        BYTES_WRITTEN.inc((self.name,), write_document(filepath, document or data, self.format, self.fsync))
+        self.index.upsert(data, filepath)
+
+    def _remove_stale_temp_files(self) -> None:
+        cutoff = time.time() - self.STALE_TEMP_SECONDS
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') and entry.name.endswith(TEMP_SUFFIX) and entry.is_file():
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+    def close(self) -> None:
+        self.index.close()
+
+
+class YamlDecisionStore(FileDecisionStore):
+    """Human-editable YAML documents, read and written through libyaml when available"""
+
+    name = 'yaml'
+    format = YAML
+
+
+class JsonDecisionStore(FileDecisionStore):
+    """JSON documents, encoded with orjson when available"""
+
+    name = 'json'
+    format = JSON
+
+
+class MsgpackDecisionStore(FileDecisionStore):
+    """Compact binary MessagePack documents (requires the msgpack package)"""
+
+    name = 'msgpack'
+    format = MSGPACK
+
+
+class ShardedDecisionStore(FileDecisionStore):
+    """YAML documents named by a stable unique ID under hash-prefixed directories
+
+    A decision lives at ``decisions/ab/cd/<id>.yaml`` and its slug is resolved through an
+    AliasMap, so lookups never scan a directory and no directory grows past a few hundred
+    entries, even with millions of decisions. Flat ``<slug>.yaml`` files left by the
+    ``yaml`` backend are still served; each moves into the sharded layout the next time it
+    is written, or when migrate_flat_layout runs.
+
+    The decision file is a summary: each framework entry keeps its framework_summary and
+    the name of a file under ``decisions/ab/cd/<id>/`` holding the full entry. Entry
+    files are named by content hash and never rewritten, so a write only adds files for
+    changed entries, replaces the summary and then removes entries it no longer uses.
+    Readers that lose that race read the new summary again.
+    """
+
+    name = 'sharded'
+    format = YAML
+    partial_reads = True
+    # Flat files moved per directory scan by migrate_flat_layout
+    MIGRATION_BATCH = 10000
+    # Summary reads retried when a concurrent write removes an entry file in between
+    READ_ATTEMPTS = 5
+
+    def __init__(self, data_dir: str):
+        os.makedirs(data_dir, exist_ok=True)
+        # Needed by the index sync in FileDecisionStore.__init__
+        self.aliases = AliasMap(data_dir)
+        super().__init__(data_dir)
+
+    def path_for(self, slug: str) -> str:
+        decision_id = self.aliases.get(slug)
+        if decision_id is None:
+            return self.legacy_path(slug)
+        return shard_path(self.data_dir, decision_id, self.extension)
+
+    def legacy_path(self, slug: str) -> str:
+        """Where the flat layout keeps ``slug``"""
+        return super().path_for(slug)
+
+    def load_summary(self, slug: str) -> Dict[str, Any]:
+        document = read_document(self.path_for(slug))
+        document['frameworks'] = [
+            {key: value for key, value in entry.items() if key != 'file'} if 'file' in entry
+            else framework_summary(entry)
+            for entry in document['frameworks']
+        ]
+        return document
+
+    def load_framework(self, slug: str, framework_name: str) -> Dict[str, Any]:
+        filepath = self.path_for(slug)
+        return self._read_split(filepath, lambda document: self._read_framework(
+            filepath, find_framework(document, slug, framework_name)))
+
+    def iter_slugs(self) -> Iterator[str]:
+        for slug, _ in self.aliases.items():
+            yield slug
+        for slug, _, _ in self.index.flat_files(self.extension):
+            if self.aliases.get(slug) is None:
+                yield slug
+
+    def migrate_flat_layout(self, progress: Optional[Callable[[int], None]] = None) -> Dict[str, int]:
+        """Move flat ``<slug>.yaml`` files into shards while the store stays in use
+
+        Each decision is moved under its lock, so workers serving the same directory keep
+        running. A flat file newer than its sharded copy (written by a worker still on the
+        ``yaml`` backend) replaces that copy; an older one is a leftover and is removed.
+        Sharded files missing from the alias map are registered again. ``progress`` is
+        called with the running count of moved decisions after every batch.
+        """
+        stats = {'moved': 0, 'removed': 0, 'skipped': 0, 'failed': 0, 'registered': 0}
+        failed: Set[str] = set()
+        while True:
+            batch = []
+            for slug, _, _ in self.index.flat_files(self.extension):
+                if slug not in failed:
+                    batch.append(slug)
+                    if len(batch) >= self.MIGRATION_BATCH:
+                        break
+            if not batch:
+                break
+            for slug in batch:
+                outcome = self._migrate_flat_file(slug)
+                stats[outcome] += 1
+                if outcome == 'failed':
+                    failed.add(slug)
+            if progress is not None:
+                progress(stats['moved'])
+        stats['registered'] = self._register_orphans()
+        return stats
+
+    def _migrate_flat_file(self, slug: str) -> str:
+        with self.locks.lock(slug):
+            legacy = self.legacy_path(slug)
+            try:
+                legacy_mtime = os.stat(legacy).st_mtime_ns
+            except FileNotFoundError:
+                return 'skipped'  # moved by a concurrent write
+            decision_id = self.aliases.get(slug)
+            if decision_id is not None:
+                try:
+                    sharded_mtime = os.stat(shard_path(self.data_dir, decision_id, self.extension)).st_mtime_ns
+                except FileNotFoundError:
+                    sharded_mtime = -1
+                if sharded_mtime >= legacy_mtime:
+                    self._remove_legacy(slug)
+                    return 'removed'
+            try:
+                data = self._read_file(legacy)
+            except Exception as e:
+                logger.warning("Not migrating unreadable decision file %s: %s", legacy, e)
+                return 'failed'
+            self._store(slug, data)
+            return 'moved'
+
+    def _register_orphans(self) -> int:
+        """Add alias entries for sharded files that have none, using the slug stored inside"""
+        registered = 0
+        base = os.path.join(self.data_dir, SHARD_DIRNAME)
+        for root, directories, names in os.walk(base):
+            if os.path.relpath(root, base).count(os.sep) == 1:
+                directories[:] = []  # framework entry directories of the decisions listed here
+            for name in names:
+                decision_id = name[:-len(self.extension)]
+                if not name.endswith(self.extension) or self.aliases.has_id(decision_id):
+                    continue
+                try:
+                    slug = read_document(os.path.join(root, name))['decision']['slug']
+                except Exception as e:
+                    logger.warning("Skipping unreadable sharded file %s: %s", name, e)
+                    continue
+                if self.aliases.get(slug) is None:
+                    self.aliases.set(slug, decision_id)
+                    registered += 1
+        return registered
+
+    def _stored_files(self) -> Iterator[Tuple[str, str, os.stat_result]]:
+        for slug, decision_id in self.aliases.items():
+            path = shard_path(self.data_dir, decision_id, self.extension)
+            try:
+                yield slug, path, os.stat(path)
+            except FileNotFoundError:
+                continue
+        for slug, path, stat in self.index.flat_files(self.extension):
+            if self.aliases.get(slug) is None:
+                yield slug, path, stat
+
+    def _read_file(self, filepath: str) -> Dict[str, Any]:
+        return self._read_split(filepath, lambda document: dict(document, frameworks=[
+            self._read_framework(filepath, entry) for entry in document['frameworks']]))
+
+    def _read_split(self, filepath: str, read_entries: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Read the summary at ``filepath`` and pass it to ``read_entries``, retrying lost races"""
+        for attempt in itertools.count(1):
+            document = read_document(filepath)
+            try:
+                return read_entries(document)
+            except FileNotFoundError:
+                if attempt >= self.READ_ATTEMPTS:
+                    raise
+
+    def _read_framework(self, filepath: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        if 'file' not in entry:
+            return entry  # written inline, before entries were split out
+        return read_document(os.path.join(filepath[:-len(self.extension)], entry['file'] + self.extension))
+
+    def _store(self, slug: str, data: Dict[str, Any]) -> str:
+        decision_id = self.aliases.get(slug) or new_decision_id()
+        filepath = shard_path(self.data_dir, decision_id, self.extension)
+        directory = filepath[:-len(self.extension)]
+        os.makedirs(directory, exist_ok=True)
+        entries = []
+        for framework in data['frameworks']:
+            name = record_hash(framework)[:32]
+            path = os.path.join(directory, name + self.extension)
+            # Named by content, so an existing file already holds exactly this entry
+            if not os.path.exists(path):
+                BYTES_WRITTEN.inc((self.name,), write_document(path, framework, self.format, self.fsync))
+            entries.append(dict(framework_summary(framework), file=name))
+        data = dict(data, decision=dict(data['decision'], id=decision_id))
+        self._write_file(filepath, data, dict(data, frameworks=entries))
+        # Registered only once the file exists, so an alias never points at nothing
+        self.aliases.set(slug, decision_id)
+        self._remove_legacy(slug)
+        self._remove_unused_entries(directory, {entry['file'] for entry in entries})
+        return filepath
+
+    def _remove_unused_entries(self, directory: str, used: Set[str]) -> None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name[:-len(self.extension)]
+                if entry.name.endswith(self.extension) and not entry.name.startswith('.') and name not in used:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+    def _remove_legacy(self, slug: str) -> None:
+        try:
+            os.unlink(self.legacy_path(slug))
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        super().close()
+        self.aliases.close()
+
+
+class SqliteDecisionStore(DecisionStore):
+    """SQLite database in WAL mode with one row per decision and per framework run
+
+    Each write is a single IMMEDIATE transaction, which SQLite serializes across
+    processes, so no file locks are needed.
+    """
+
+    name = 'sqlite'
+    partial_reads = True
+    FILENAME = 'decisions.sqlite3'
+    # Mean overall score of a decision's framework runs, matching decision_overall_score
+    OVERALL_SCORE_SQL = (
+        "SELECT AVG(json_extract(f.result, '$.overall_score')) FROM frameworks f "
+        "WHERE f.slug = decisions.slug AND json_type(f.result, '$.overall_score') IN ('integer', 'real')"
+    )
+    SUMMARY_COLUMNS = {
+        'slug': 'd.slug',
+        'text': "CASE WHEN length(d.text) > 100 THEN substr(d.text, 1, 100) || '...' ELSE d.text END",
+        'created_at': 'd.created_at',
+        'last_updated': 'd.last_updated',
+        'frameworks_count': 'd.total_frameworks',
+        'overall_score': 'd.overall_score'
+    }
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self.path = os.path.join(data_dir, self.FILENAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA busy_timeout=5000')
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS decisions (
+                slug TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                last_updated TEXT NOT NULL,
+                total_frameworks INTEGER NOT NULL DEFAULT 0,
+                completed_frameworks INTEGER NOT NULL DEFAULT 0,
+                overall_score REAL,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS frameworks (
+                slug TEXT NOT NULL,
+                name TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                inputs TEXT,
+                result TEXT,
+                PRIMARY KEY (slug, name)
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(decisions)')}
+        if 'overall_score' not in columns:
+            # Databases created before scores were tracked are backfilled from the stored results
+            self._conn.execute('ALTER TABLE decisions ADD COLUMN overall_score REAL')
+            self._conn.execute(f'UPDATE decisions SET overall_score = ({self.OVERALL_SCORE_SQL})')
+        if 'version' not in columns:
+            self._conn.execute('ALTER TABLE decisions ADD COLUMN version INTEGER NOT NULL DEFAULT 0')
+        for column in ('created_at', 'last_updated', 'total_frameworks', 'overall_score'):
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_decisions_{column} ON decisions ({column}, slug)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_frameworks_name ON frameworks (name)')
+        create_listing_state(self._conn, 'decisions')
+        # Created in the backfill's transaction, so a failed backfill is retried on the next start
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            if create_search_table(self._conn):
+                # Index decisions stored before full-text search existed
+                slugs = [row[0] for row in self._conn.execute('SELECT slug FROM decisions')]
+                insert_search_rows(self._conn, [(slug,) + self._search_fields(slug) for slug in slugs])
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+
+    def exists(self, slug: str) -> bool:
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM decisions WHERE slug = ?', (slug,)).fetchone()
+        return row is not None
+
+    def set_fsync(self, enabled: bool) -> None:
+        # NORMAL (the default) survives application crashes but may lose the last commits on power loss
+        with self._lock:
+            self._conn.execute(f"PRAGMA synchronous={'FULL' if enabled else 'NORMAL'}")
+
+    def stamp(self, slug: str) -> Optional[Hashable]:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT version, last_updated, total_frameworks, completed_frameworks FROM decisions WHERE slug = ?',
+                (slug,)
+            ).fetchone()
+
+    def revision(self, slug: str) -> Optional[Tuple[int, str]]:
+        with self._lock:
+            return self._conn.execute('SELECT version, last_updated FROM decisions WHERE slug = ?', (slug,)).fetchone()
+
+    def listing_stamp(self) -> Optional[str]:
+        with self._lock:
+            return listing_stamp(self._conn)
+
+    def load(self, slug: str) -> Dict[str, Any]:
+        with self._lock:
+            decision = self._decision_row(slug)
+            frameworks = self._conn.execute(
+                'SELECT name, inputs, result FROM frameworks WHERE slug = ? ORDER BY position', (slug,)
+            ).fetchall()
+
+        return self._document(decision, [
+            {
+                'name': name,
+                'inputs': json.loads(inputs) if inputs is not None else {},
+                'result': json.loads(result) if result is not None else None
+            }
+            for name, inputs, result in frameworks
+        ])
+
+    def load_summary(self, slug: str) -> Dict[str, Any]:
+        with self._lock:
+            decision = self._decision_row(slug)
+            frameworks = self._conn.execute(
+                "SELECT name, result IS NOT NULL, "
+                "json_extract(result, '$.overall_score'), json_extract(result, '$.recommendations') "
+                "FROM frameworks WHERE slug = ? ORDER BY position", (slug,)
+            ).fetchall()
+
+        return self._document(decision, [
+            {
+                'name': name,
+                'completed': bool(completed),
+                'overall_score': overall_score,
+                'recommendations': json.loads(recommendations)[:SUMMARY_RECOMMENDATIONS] if recommendations else []
+            }
+            for name, completed, overall_score, recommendations in frameworks
+        ])
+
+    def load_framework(self, slug: str, framework_name: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute('SELECT inputs, result FROM frameworks WHERE slug = ? AND name = ?',
+                                     (slug, framework_name)).fetchone()
+            if row is None:
+                self._decision_row(slug)  # FileNotFoundError for a missing decision
+                raise KeyError(f"Framework '{framework_name}' has not been run on decision '{slug}'")
+        return {
+            'name': framework_name,
+            'inputs': json.loads(row[0]) if row[0] is not None else {},
+            'result': json.loads(row[1]) if row[1] is not None else None
+        }
+
+    def save(self, slug: str, data: Dict[str, Any], exclusive: bool = False) -> str:
+        decision = data['decision']
+        frameworks = data.get('frameworks') or []
+        rows = [
+            (slug, framework['name'], position,
+             self._encode(framework.get('inputs')), self._encode(framework.get('result')))
+            for position, framework in enumerate(frameworks)
+        ]
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                if exclusive and self._conn.execute('SELECT 1 FROM decisions WHERE slug = ?', (slug,)).fetchone():
+                    raise FileExistsError(f"Decision already exists: {slug}")
+                delete_search_rows(self._conn, [slug])
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO decisions '
+                    '(slug, text, created_at, last_updated, total_frameworks, completed_frameworks, overall_score, '
+                    'version) VALUES (?, ?, ?, ?, ?, ?, ?, '
+                    'MAX(COALESCE((SELECT version FROM decisions WHERE slug = ?), 0), ?) + 1)',
+                    (slug, decision['text'], decision['created_at'],
+                     decision.get('last_updated', decision['created_at']),
+                     len(frameworks), len([f for f in frameworks if f.get('result')]),
+                     decision_overall_score(frameworks), slug, decision_version(data))
+                )
+                self._conn.execute('DELETE FROM frameworks WHERE slug = ?', (slug,))
+                self._conn.executemany(
+                    'INSERT INTO frameworks (slug, name, position, inputs, result) VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+                insert_search_rows(self._conn, [(slug,) + search_fields(data)])
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        BYTES_WRITTEN.inc((self.name,), len(decision['text']) + sum(len(row[3] or '') + len(row[4] or '')
+                                                                  for row in rows))
+
+        return f"{self.path}#{slug}"
+
+    def upsert_frameworks(self, slug: str, framework_results: List[Dict[str, Any]], timestamp: str,
+                          expected_version: Optional[int] = None, skip_unchanged: bool = False) -> int:
+        rows = [(framework_result['name'], self._encode(framework_result.get('inputs')),
+                 self._encode(framework_result.get('result')))
+                for framework_result in framework_results]
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute('SELECT version FROM decisions WHERE slug = ?', (slug,)).fetchone()
+                if row is None:
+                    raise FileNotFoundError(f"Decision not found: {slug}")
+                if expected_version is not None and expected_version != row[0]:
+                    raise VersionConflict(slug, expected_version, row[0])
+                if skip_unchanged and all(
+                        self._conn.execute('SELECT inputs, result FROM frameworks WHERE slug = ? AND name = ?',
+                                           (slug, name)).fetchone() == (inputs, result)
+                        for name, inputs, result in rows):
+                    self._conn.execute('ROLLBACK')
+                    return row[0]
+                # Keep the original position when a framework is re-run
+                self._conn.executemany(
+                    'INSERT INTO frameworks (slug, name, position, inputs, result) '
+                    'VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM frameworks WHERE slug = ?), ?, ?) '
+                    'ON CONFLICT (slug, name) DO UPDATE SET inputs = excluded.inputs, result = excluded.result',
+                    [(slug, name, slug, inputs, result) for name, inputs, result in rows]
+                )
+                self._conn.execute(
+                    'UPDATE decisions SET last_updated = ?, version = version + 1, '
+                    'total_frameworks = (SELECT COUNT(*) FROM frameworks WHERE slug = ?), '
+                    'completed_frameworks = (SELECT COUNT(*) FROM frameworks WHERE slug = ? AND result IS NOT NULL), '
+                    f'overall_score = ({self.OVERALL_SCORE_SQL}) '
+                    'WHERE slug = ?',
+                    (timestamp, slug, slug, slug)
+                )
+                delete_search_rows(self._conn, [slug])
+                insert_search_rows(self._conn, [(slug,) + self._search_fields(slug)])
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        BYTES_WRITTEN.inc((self.name,), sum(len(inputs or '') + len(result or '') for _, inputs, result in rows))
+        return row[0] + 1
+
+    def query_summaries(self, query: DecisionQuery, count: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            return query_summaries(self._conn, query, self.SUMMARY_COLUMNS, 'frameworks', count)
+
+    def search(self, text: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        with self._lock:
+            return search_summaries(self._conn, text, self.SUMMARY_COLUMNS, limit, offset)
+
+    def iter_slugs(self) -> Iterator[str]:
+        with self._lock:
+            slugs = [row[0] for row in self._conn.execute('SELECT slug FROM decisions')]
+        return iter(slugs)
+
+    def _decision_row(self, slug: str) -> Tuple:
+        """The decisions row of ``slug``, raising FileNotFoundError if missing; caller holds the lock"""
+        decision = self._conn.execute(
+            'SELECT slug, text, created_at, last_updated, total_frameworks, completed_frameworks, version '
+            'FROM decisions WHERE slug = ?', (slug,)
+        ).fetchone()
+        if decision is None:
+            raise FileNotFoundError(f"Decision not found: {slug}")
+        return decision
+
+    def _document(self, decision: Tuple, frameworks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'decision': {
+                'text': decision[1],
+                'slug': decision[0],
+                'created_at': decision[2],
+                'last_updated': decision[3],
+                'version': decision[6]
+            },
+            'frameworks': frameworks,
+            'metadata': {
+                'total_frameworks': decision[4],
+                'completed_frameworks': decision[5]
+            }
+        }
+
+    def _search_fields(self, slug: str):
+        """Search document rebuilt from the stored rows; caller holds the lock"""
+        text = self._conn.execute('SELECT text FROM decisions WHERE slug = ?', (slug,)).fetchone()[0]
+        frameworks = [
+            {'inputs': json.loads(inputs) if inputs else {}, 'result': json.loads(result) if result else None}
+            for inputs, result in self._conn.execute(
+                'SELECT inputs, result FROM frameworks WHERE slug = ? ORDER BY position', (slug,)
+            )
+        ]
+        return search_fields({'decision': {'text': text}, 'frameworks': frameworks})
+
+    def _encode(self, value: Any) -> Any:
+        # Missing results stay NULL so completed_frameworks can be counted in SQL
+        if value is None:
+            return None
+        return json.dumps(value, default=to_plain)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+STORAGE_BACKENDS = {
+    YamlDecisionStore.name: YamlDecisionStore,
+    JsonDecisionStore.name: JsonDecisionStore,
+    MsgpackDecisionStore.name: MsgpackDecisionStore,
+    ShardedDecisionStore.name: ShardedDecisionStore,
+    SqliteDecisionStore.name: SqliteDecisionStore
+}
+
+
+def create_store(backend: str, data_dir: str) -> DecisionStore:
+    """Instantiate a storage backend by name"""
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend '{backend}'. Available: {', '.join(STORAGE_BACKENDS)}")
+    return STORAGE_BACKENDS[backend](data_dir)
+
+
+def migrate_store(source: DecisionStore, target: DecisionStore) -> Tuple[int, List[str]]:
+    """Copy every decision from one backend to another
+
+    Returns the number copied and the slugs of decisions that could not be read, which
+    are logged and left out of the target.
+    """
+    count = 0
+    failed = []
+    for slug in source.iter_slugs():
+        try:
+            data = source.load(slug)
+        except Exception as e:
+            logger.warning("Not migrating unreadable decision %s: %s", slug, e)
+            failed.append(slug)
+            continue
+        target.save(slug, data)
+        count += 1
+    return count, failed
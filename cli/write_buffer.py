@@ -0,0 +1,135 @@
+"""Write-behind buffering of framework updates with grouped flushes"""
+
+import atexit
+import logging
+import threading
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple
+
+from frameworks.metrics import METRICS
+from .storage import DecisionStore
+
+logger = logging.getLogger(__name__)
+
+FLUSHES = METRICS.counter('decision_write_behind_flushes_total',
+                          'Decisions flushed from the write-behind buffer by outcome', ('backend', 'result'))
+COALESCED = METRICS.counter('decision_write_behind_coalesced_total',
+                            'Buffered updates replaced by a newer update before being written', ('backend',))
+
+
+class WriteBehindBuffer:
+    """Coalesces framework updates per decision in memory and writes them in groups
+
+    Updates for the same decision and framework replace each other while pending, and
+    each decision's pending updates are written in one read-modify-write. A background
+    thread flushes everything ``max_delay`` seconds after the previous flush, or as
+    soon as ``max_pending`` updates are waiting. Flushes leave a decision untouched
+    when its content would not change. ``close`` (also run at interpreter exit) writes
+    whatever is still pending.
+    """
+
+    def __init__(self, store: DecisionStore, max_delay: float = 0.5, max_pending: int = 100,
+                 on_flush: Optional[Callable[[str], None]] = None):
+        if max_delay <= 0 or max_pending < 1:
+            raise ValueError("max_delay must be positive and max_pending at least 1")
+        self.store = store
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.on_flush = on_flush
+        self._pending: Dict[str, Tuple[Dict[str, Dict[str, Any]], str]] = {}  # slug -> (name -> record, timestamp)
+        self._count = 0
+        self._lock = threading.Lock()        # guards _pending; never held during I/O
+        self._flush_lock = threading.RLock()  # one flush at a time keeps writes of a slug in order
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='decision-write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def add(self, slug: str, framework_result: Dict[str, Any], timestamp: str) -> None:
+        """Queue a framework entry for ``slug``, replacing a pending one of the same framework"""
+        if self._closed:
+            raise RuntimeError("Write-behind buffer is closed")
+        with self._lock:
+            records, _ = self._pending.get(slug, ({}, None))
+            if framework_result['name'] in records:
+                COALESCED.inc((self.store.name,))
+            else:
+                self._count += 1
+            records[framework_result['name']] = framework_result
+            self._pending[slug] = (records, timestamp)
+            full = self._count >= self.max_pending
+        if full:
+            self._wakeup.set()
+
+    def has_pending(self, slug: str) -> bool:
+        """Whether updates for ``slug`` are not yet (completely) written"""
+        return slug in self._pending
+
+    def pending_count(self) -> int:
+        return self._count
+
+    def flush(self, slugs: Optional[Iterable[str]] = None) -> int:
+        """Write pending updates of ``slugs`` (default: all) and return how many decisions were flushed
+
+        A decision whose write fails keeps its updates pending for the next flush, unless
+        it no longer exists; the first error is re-raised after the other decisions are written.
+        """
+        written = 0
+        error = None
+        with self._flush_lock:
+            with self._lock:
+                targets = list(self._pending) if slugs is None else [slug for slug in slugs if slug in self._pending]
+                # Copies: records stay visible as pending until they are on disk
+                batches = [(slug, dict(self._pending[slug][0]), self._pending[slug][1]) for slug in targets]
+            for slug, records, timestamp in batches:
+                try:
+                    self.store.upsert_frameworks(slug, list(records.values()), timestamp, skip_unchanged=True)
+                except FileNotFoundError:
+                    logger.warning("Dropping %d buffered update(s) for missing decision %s", len(records), slug)
+                    FLUSHES.inc((self.store.name, 'dropped'))
+                except Exception as e:
+                    logger.error("Flushing buffered updates for %s failed: %s", slug, e)
+                    FLUSHES.inc((self.store.name, 'failed'))
+                    error = error or e
+                    continue
+                else:
+                    written += 1
+                    FLUSHES.inc((self.store.name, 'written'))
+                self._forget(slug, records)
+                if self.on_flush is not None:
+                    self.on_flush(slug)
+        if error is not None:
+            raise error
+        return written
+
+    def close(self) -> None:
+        """Stop the background thread and write everything still pending"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _forget(self, slug: str, records: Dict[str, Dict[str, Any]]) -> None:
+        """Drop the written records, keeping any that were replaced while the flush ran"""
+        with self._lock:
+            pending, _ = self._pending.get(slug, ({}, None))
+            for name, record in records.items():
+                if pending.get(name) is record:
+                    del pending[name]
+                    self._count -= 1
+            if not pending:
+                self._pending.pop(slug, None)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.max_delay)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            try:
+                self.flush()
+            except Exception:
+                pass  # already logged; the updates stay pending and are retried
@@ -1,19 +1,33 @@
-"""Decision Making Frameworks Package"""
-
-from .framework_base import Framework
-from .seven_s_framework import SevenSFramework
-from .vpc_framework import VPCFramework
-from .strategic_inflection_framework import StrategicInflectionFramework
-from .game_theory_framework import GameTheoryFramework
-from .risk_reward_framework import RiskRewardFramework
-from .cynefin_framework import CynefinFramework
-
-__all__ = [
-    'Framework',
-    'SevenSFramework',
-    'VPCFramework',
-    'StrategicInflectionFramework',
-    'GameTheoryFramework',
-    'RiskRewardFramework',
-    'CynefinFramework'
-]
+"""Decision Making Frameworks Package
+
+Framework classes are imported on first attribute access, so importing the package
+(e.g. for frameworks.registry) does not load NumPy or any implementation.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'Framework': 'framework_base',
+    'SevenSFramework': 'seven_s_framework',
+    'VPCFramework': 'vpc_framework',
+    'StrategicInflectionFramework': 'strategic_inflection_framework',
+    'GameTheoryFramework': 'game_theory_framework',
+    'RiskRewardFramework': 'risk_reward_framework',
+    'CynefinFramework': 'cynefin_framework',
+    'FrameworkRegistry': 'registry',
+    'FrameworkSpec': 'registry'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,12 +1,17 @@
 """Cynefin Framework Implementation"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+import numpy as np
 from .framework_base import Framework, FrameworkResult
 
 
 class CynefinFramework(Framework):
     """Cynefin Sense-Making Framework"""
 
+    batch_fields = ['clarity_level', 'cause_effect_visibility', 'stakeholder_alignment',
+                    'time_pressure', 'failure_impact']
+    derived_visualizations = ('position',)
+
     def __init__(self):
         super().__init__("Cynefin Framework")
 
@@ -65,14 +70,6 @@ class CynefinFramework(Framework):
             f'Recommended approach: {approach}'
         ]
 
-        visualizations = {
-            'position': {
-                'complexity': complexity,
-                'risk': risk,
-                'domain': domain
-            }
-        }
-
         additional_data = {
             'approach': approach,
             'notes': inputs.get('additional_notes', '')
@@ -82,10 +79,45 @@ class CynefinFramework(Framework):
             framework_name=self.name,
             scores=scores,
             recommendations=recommendations,
-            visualizations=visualizations,
+            visualizations=self.build_visualizations({'scores': scores}),
             overall_score=overall_score,
             additional_data=additional_data
         )
 
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        return self._in_range(columns, self.batch_fields, 1, 10)
+
+    def calculate_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        clarity = columns['clarity_level']
+        cause_effect = columns['cause_effect_visibility']
+        alignment = columns['stakeholder_alignment']
+
+        complexity = (10 - clarity + 10 - cause_effect + 10 - alignment) / 3
+        risk = (columns['time_pressure'] + columns['failure_impact']) / 2
+        overall_score = (complexity + risk) / 2
+
+        conditions = [(complexity < 3) & (risk < 3), complexity < 6, complexity < 8]
+        domain = np.select(conditions, ['Obvious', 'Complicated', 'Complex'], 'Chaotic')
+        approach = np.select(conditions, ['Sense – Categorize – Respond', 'Sense – Analyze – Respond',
+                                          'Probe – Sense – Respond'], 'Act – Sense – Respond')
+
+        return {
+            'complexity': complexity,
+            'risk': risk,
+            'overall_score': overall_score,
+            'domain': domain,
+            'approach': approach
+        }
+
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        scores = result['scores']
+        return {
+            'position': {
+                'complexity': scores['complexity'],
+                'risk': scores['risk'],
+                'domain': scores['domain']
+            }
+        }
+
     def get_visualization_data(self) -> Dict[str, Any]:
         return self.result.visualizations if self.result else {}
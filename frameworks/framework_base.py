@@ -1,9 +1,25 @@
 """Base Framework class for decision-making tools"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Mapping, Sequence, Tuple, Union
 from dataclasses import dataclass
+import hashlib
+import inspect
 import json
+import time
+
+import numpy as np
+
+from .metrics import METRICS
+from .result_cache import ResultCache, canonical_hash
+
+CALCULATE_SECONDS = METRICS.histogram('framework_calculate_seconds',
+                                      'Time spent in Framework.calculate (result cache misses only)', ('framework',))
+BATCH_SECONDS = METRICS.histogram('framework_batch_seconds', 'Time spent in Framework.evaluate_batch', ('framework',))
+EVALUATION_ERRORS = METRICS.counter('framework_errors_total',
+                                    'Evaluations that raised, including invalid inputs', ('framework',))
+RESULT_CACHE_LOOKUPS = METRICS.counter('framework_result_cache_lookups_total',
+                                       'Result cache lookups by outcome', ('framework', 'result'))
 
 
 @dataclass
@@ -17,9 +33,29 @@ class FrameworkResult:
     additional_data: Dict[str, Any] = None
 
 
+BatchInputs = Union[Mapping[str, Any], np.ndarray, Sequence[Mapping[str, Any]]]
+
+
 class Framework(ABC):
     """Abstract base class for decision-making frameworks"""
     
+    # Numeric input columns consumed by calculate_batch, in positional order
+    batch_fields: List[str] = []
+    
+    # Bump when calculation logic changes outside the framework's own module (e.g. in a
+    # helper module); cached results from other versions are never reused
+    version: str = '1'
+    
+    # Shared result cache used by evaluate(); None disables memoization
+    cache: Optional[ResultCache] = None
+    
+    # Registry key (e.g. 'risk'), set by FrameworkRegistry; labels this framework's metrics
+    key: Optional[str] = None
+    
+    # Visualization entries that build_visualizations derives from a result's scores and
+    # additional data; stored records leave them out and expand_record rebuilds them
+    derived_visualizations: Tuple[str, ...] = ()
+    
     def __init__(self, name: str):
         self.name = name
         self.inputs = {}
@@ -54,12 +90,123 @@ class Framework(ABC):
     
     def execute(self) -> FrameworkResult:
         """Execute the framework with current inputs"""
-        if not self.inputs:
-            raise ValueError("No inputs provided")
-        
-        self.result = self.calculate(self.inputs)
+        self.result = self.evaluate(self.inputs)
         return self.result
     
+    def evaluate(self, inputs: Dict[str, Any]) -> FrameworkResult:
+        """Validate inputs and calculate results without storing any state on the instance
+        
+        Safe to call concurrently on a shared framework instance.
+        """
+        labels = (self.key or self.name,)
+        try:
+            if not inputs:
+                raise ValueError("No inputs provided")
+            if not self.validate_inputs(inputs):
+                raise ValueError("Invalid inputs provided")
+            
+            if self.cache is None:
+                return self._timed_calculate(inputs, labels)
+            
+            key = self.cache_key(inputs)
+            result = self.cache.get(key)
+            if result is None:
+                RESULT_CACHE_LOOKUPS.inc(labels + ('miss',))
+                result = self._timed_calculate(inputs, labels)
+                self.cache.set(key, result)
+            else:
+                RESULT_CACHE_LOOKUPS.inc(labels + ('hit',))
+            return result
+        except Exception:
+            EVALUATION_ERRORS.inc(labels)
+            raise
+    
+    def _timed_calculate(self, inputs: Dict[str, Any], labels: tuple) -> FrameworkResult:
+        start = time.perf_counter()
+        try:
+            return self.calculate(inputs)
+        finally:
+            CALCULATE_SECONDS.observe(time.perf_counter() - start, labels)
+    
+    def cache_key(self, inputs: Dict[str, Any]) -> str:
+        """Cache key from the framework name, its logic version and the canonical input hash"""
+        return f"{self.name}:{self.logic_version()}:{canonical_hash(inputs)}"
+    
+    @classmethod
+    def logic_version(cls) -> str:
+        """Declared version plus a fingerprint of the module source, so edits invalidate the cache"""
+        if '_logic_version' not in cls.__dict__:
+            try:
+                source = inspect.getsource(inspect.getmodule(cls))
+            except (OSError, TypeError):
+                source = ''
+            fingerprint = hashlib.sha256(source.encode('utf-8')).hexdigest()[:12]
+            cls._logic_version = f"{cls.version}-{fingerprint}"
+        return cls._logic_version
+    
+    def evaluate_batch(self, inputs: BatchInputs) -> Dict[str, np.ndarray]:
+        """Validate and calculate many input rows at once
+        
+        Accepts a mapping of column name -> array, a NumPy structured array, a 2D
+        array whose columns follow ``batch_fields``, or a list of input dicts. Returns a mapping of output column
+        name -> array with one entry per row, matching ``calculate`` row for row.
+        """
+        labels = (self.key or self.name,)
+        start = time.perf_counter()
+        try:
+            columns = self._to_columns(inputs)
+            invalid = ~self.validate_batch(columns)
+            if invalid.any():
+                rows = np.flatnonzero(invalid)
+                raise ValueError(f"Invalid inputs in {len(rows)} rows (first at row {rows[0]})")
+            
+            return self.calculate_batch(columns)
+        except Exception:
+            EVALUATION_ERRORS.inc(labels)
+            raise
+        finally:
+            BATCH_SECONDS.observe(time.perf_counter() - start, labels)
+    
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Return a boolean mask of rows whose inputs are valid"""
+        raise NotImplementedError(f"{self.name} does not support batch evaluation")
+    
+    def calculate_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized counterpart of calculate over columnar inputs"""
+        raise NotImplementedError(f"{self.name} does not support batch evaluation")
+    
+    def _to_columns(self, inputs: BatchInputs) -> Dict[str, np.ndarray]:
+        """Normalize batch inputs to a mapping of float64 column arrays"""
+        if not self.batch_fields:
+            raise NotImplementedError(f"{self.name} does not support batch evaluation")
+        
+        if isinstance(inputs, (list, tuple)):
+            inputs = {field: [row.get(field, np.nan) for row in inputs] for field in self.batch_fields}
+        
+        if isinstance(inputs, np.ndarray) and inputs.dtype.names is None:
+            if inputs.ndim != 2 or inputs.shape[1] != len(self.batch_fields):
+                raise ValueError(f"Expected a 2D array with columns {', '.join(self.batch_fields)}")
+            return {field: np.ascontiguousarray(inputs[:, i], dtype=np.float64)
+                    for i, field in enumerate(self.batch_fields)}
+        
+        names = inputs.dtype.names if isinstance(inputs, np.ndarray) else inputs.keys()
+        missing = [field for field in self.batch_fields if field not in names]
+        if missing:
+            raise ValueError(f"Missing input columns: {', '.join(missing)}")
+        
+        columns = {field: np.asarray(inputs[field], dtype=np.float64).ravel() for field in self.batch_fields}
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("All input columns must have the same length")
+        return columns
+    
+    @staticmethod
+    def _in_range(columns: Dict[str, np.ndarray], fields: List[str], low: float, high: float) -> np.ndarray:
+        """Mask of rows where every given column lies within [low, high]"""
+        mask = np.ones(len(columns[fields[0]]), dtype=bool)
+        for field in fields:
+            mask &= (columns[field] >= low) & (columns[field] <= high)
+        return mask
+    
     def get_input_prompts(self) -> List[str]:
         """Get user-friendly prompts for collecting inputs"""
         required = self.get_required_inputs()
@@ -67,12 +214,40 @@ class Framework(ABC):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert framework state to dictionary"""
+        return self.build_record(self.inputs, self.result)
+    
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        """Return the ``derived_visualizations`` entries for a result (or its stored dict)"""
+        return {}
+    
+    def build_record(self, inputs: Dict[str, Any], result: Optional[FrameworkResult]) -> Dict[str, Any]:
+        """Build the stored representation of a framework run from explicit inputs and result
+        
+        Derived visualizations are left out; expand_record restores them.
+        """
+        stored = None
+        if result:
+            # Copied: results may be shared through the result cache
+            stored = dict(result.__dict__, visualizations={
+                name: value for name, value in (result.visualizations or {}).items()
+                if name not in self.derived_visualizations
+            })
         return {
             'name': self.name,
-            'inputs': self.inputs,
-            'result': self.result.__dict__ if self.result else None
+            'inputs': inputs,
+            'result': stored
         }
     
+    def expand_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a stored record with its derived visualizations rebuilt"""
+        result = record.get('result')
+        if not self.derived_visualizations or not isinstance(result, dict):
+            return record
+        visualizations = self.build_visualizations(result)
+        visualizations.update((name, value) for name, value in (result.get('visualizations') or {}).items()
+                              if name not in self.derived_visualizations)
+        return dict(record, result=dict(result, visualizations=visualizations))
+    
     def export_data(self) -> str:
         """Export framework data as JSON"""
         return json.dumps(self.to_dict(), indent=2, default=str)
\ No newline at end of file
@@ -0,0 +1,444 @@
+"""Vectorized solvers for two-player bimatrix games"""
+
+import csv
+import io
+import itertools
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+# Column block width used when filtering candidate dominators
+_DOMINANCE_BLOCK = 64
+
+
+def as_payoff_matrix(value: Any) -> np.ndarray:
+    """Convert a nested list, array or CSV string into a 2D float payoff matrix"""
+    if isinstance(value, str):
+        _, _, matrix = parse_payoff_csv(value)
+        return matrix
+    matrix = np.asarray(value, dtype=np.float64)
+    if matrix.ndim != 2 or 0 in matrix.shape:
+        raise ValueError("Payoff matrix must be a non-empty 2D table")
+    return matrix
+
+
+def parse_payoff_csv(text: str) -> Tuple[Optional[List[str]], Optional[List[str]], np.ndarray]:
+    """Parse a payoff table from CSV text
+
+    If the first row and first column are not numeric they are used as competitor and
+    our action labels respectively; otherwise the labels are returned as None.
+    """
+    rows = [row for row in csv.reader(io.StringIO(text.strip())) if row]
+    if not rows:
+        raise ValueError("Payoff CSV is empty")
+
+    def numeric(cells):
+        try:
+            [float(cell) for cell in cells]
+            return True
+        except ValueError:
+            return False
+
+    col_labels = None
+    if not numeric(rows[0][1:]):
+        col_labels = [cell.strip() for cell in rows[0]]
+        rows = rows[1:]
+
+    row_labels = None
+    if not numeric([row[0] for row in rows]):
+        row_labels = [row[0].strip() for row in rows]
+        rows = [row[1:] for row in rows]
+        if col_labels is not None and len(col_labels) == len(rows[0]) + 1:
+            col_labels = col_labels[1:]
+
+    if len({len(row) for row in rows}) != 1:
+        raise ValueError("Payoff CSV rows must all have the same number of columns")
+    matrix = np.array([[float(cell) for cell in row] for row in rows], dtype=np.float64)
+    return row_labels, col_labels, matrix
+
+
+def load_payoff_csv(path: str) -> Tuple[Optional[List[str]], Optional[List[str]], np.ndarray]:
+    """Read a payoff table from a CSV file"""
+    with open(path, 'r', newline='') as f:
+        return parse_payoff_csv(f.read())
+
+
+def best_response_masks(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Boolean masks of cells where each player is best-responding
+
+    Our best responses maximise each column; the competitor's maximise each row.
+    """
+    ours = our_payoffs == our_payoffs.max(axis=0, keepdims=True)
+    theirs = competitor_payoffs == competitor_payoffs.max(axis=1, keepdims=True)
+    return ours, theirs
+
+
+def pure_nash_equilibria(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray) -> np.ndarray:
+    """Return an (k, 2) array of (our action, competitor action) pure equilibria"""
+    ours, theirs = best_response_masks(our_payoffs, competitor_payoffs)
+    return np.argwhere(ours & theirs)
+
+
+def dominant_strategy(payoffs: np.ndarray) -> Optional[int]:
+    """Row that strictly beats every other row in every column, if any"""
+    if payoffs.shape[0] == 1:
+        return 0
+    best = payoffs.argmax(axis=0)
+    candidate = int(best[0])
+    if not (best == candidate).all():
+        return None
+    others = np.delete(payoffs, candidate, axis=0)
+    return candidate if (payoffs[candidate] > others.max(axis=0)).all() else None
+
+
+def strictly_dominated_rows(payoffs: np.ndarray) -> np.ndarray:
+    """Boolean mask of rows strictly dominated by another row
+
+    Rows are visited in decreasing order of their total, since only a row with a larger
+    total can dominate. Dominance is transitive, so only rows not yet found dominated are
+    kept as candidate dominators, and candidates are filtered one block of columns at a
+    time instead of comparing every pair of full rows.
+    """
+    n_rows, n_cols = payoffs.shape
+    dominated = np.zeros(n_rows, dtype=bool)
+    order = np.argsort(-payoffs.sum(axis=1), kind='stable')
+    ranked = payoffs[order]
+    undominated = np.empty(n_rows, dtype=np.intp)
+    count = 0
+    for position in range(n_rows):
+        row = ranked[position]
+        candidates = undominated[:count]
+        for start in range(0, n_cols, _DOMINANCE_BLOCK):
+            if not len(candidates):
+                break
+            stop = start + _DOMINANCE_BLOCK
+            candidates = candidates[(ranked[candidates, start:stop] > row[start:stop]).all(axis=1)]
+        if len(candidates):
+            dominated[order[position]] = True
+        else:
+            undominated[count] = position
+            count += 1
+    return dominated
+
+
+def iterated_elimination(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray) -> Dict[str, Any]:
+    """Iterated elimination of strictly dominated pure strategies
+
+    Returns the surviving row and column indices and the elimination rounds.
+    """
+    rows = np.arange(our_payoffs.shape[0])
+    cols = np.arange(our_payoffs.shape[1])
+    rounds = []
+
+    while True:
+        row_mask = strictly_dominated_rows(our_payoffs[np.ix_(rows, cols)])
+        removed_rows = rows[row_mask]
+        rows = rows[~row_mask]
+
+        col_mask = strictly_dominated_rows(competitor_payoffs[np.ix_(rows, cols)].T)
+        removed_cols = cols[col_mask]
+        cols = cols[~col_mask]
+
+        if not len(removed_rows) and not len(removed_cols):
+            break
+        rounds.append({'ours': removed_rows.tolist(), 'competitor': removed_cols.tolist()})
+
+    return {'rows': rows, 'cols': cols, 'rounds': rounds}
+
+
+def security_level(payoffs: np.ndarray) -> Tuple[int, float]:
+    """Maximin pure strategy and the payoff it guarantees"""
+    worst = payoffs.min(axis=1)
+    row = int(worst.argmax())
+    return row, float(worst[row])
+
+
+class SolverBudget:
+    """Wall-clock and iteration budget shared by the mixed-strategy solvers"""
+
+    def __init__(self, time_budget: float = 1.0, max_iterations: int = 100000):
+        self.deadline = time.perf_counter() + time_budget
+        self.max_iterations = max_iterations
+        self.iterations = 0
+
+    def tick(self) -> bool:
+        """Count one iteration and return whether the budget still allows more work"""
+        self.iterations += 1
+        return self.iterations <= self.max_iterations and time.perf_counter() < self.deadline
+
+    def exhausted(self) -> bool:
+        return self.iterations >= self.max_iterations or time.perf_counter() >= self.deadline
+
+
+def _equilibrium(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray,
+                 x: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """Sparse description of a mixed equilibrium with expected payoffs"""
+    x = np.where(np.abs(x) < 1e-12, 0.0, x)
+    y = np.where(np.abs(y) < 1e-12, 0.0, y)
+    our_support = np.flatnonzero(x)
+    competitor_support = np.flatnonzero(y)
+    return {
+        'our_support': our_support.tolist(),
+        'our_probabilities': x[our_support].tolist(),
+        'competitor_support': competitor_support.tolist(),
+        'competitor_probabilities': y[competitor_support].tolist(),
+        'our_payoff': _clean(float(x @ our_payoffs @ y)),
+        'competitor_payoff': _clean(float(x @ competitor_payoffs @ y))
+    }
+
+
+def _clean(value: float) -> float:
+    """Snap floating-point noise around zero to an exact zero"""
+    return 0.0 if abs(value) < 1e-12 else value
+
+
+def is_constant_sum(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray) -> bool:
+    """Whether the game is zero-sum up to a constant, and so solvable as a linear program"""
+    total = our_payoffs + competitor_payoffs
+    return bool(np.allclose(total, total.flat[0]))
+
+
+def solve_2x2(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray) -> Optional[Dict[str, Any]]:
+    """Closed-form fully mixed equilibrium of a 2x2 game from the indifference conditions"""
+    a, b = our_payoffs, competitor_payoffs
+    # Our mix makes the competitor indifferent between its columns, and vice versa
+    p_denominator = b[0, 0] - b[0, 1] - b[1, 0] + b[1, 1]
+    q_denominator = a[0, 0] - a[0, 1] - a[1, 0] + a[1, 1]
+    if p_denominator == 0 or q_denominator == 0:
+        return None
+    p = (b[1, 1] - b[1, 0]) / p_denominator
+    q = (a[1, 1] - a[0, 1]) / q_denominator
+    if not (0 < p < 1 and 0 < q < 1):
+        return None
+    return _equilibrium(a, b, np.array([p, 1 - p]), np.array([q, 1 - q]))
+
+
+def _pivot(tableau: np.ndarray, basis: np.ndarray, column: int) -> Optional[int]:
+    """Minimum-ratio pivot on a column, returning the label that leaves the basis"""
+    positive = tableau[:, column] > 1e-12
+    if not positive.any():
+        return None
+    ratios = np.full(len(tableau), np.inf)
+    ratios[positive] = tableau[positive, -1] / tableau[positive, column]
+    row = int(ratios.argmin())
+
+    tableau[row] /= tableau[row, column]
+    factors = tableau[:, column].copy()
+    factors[row] = 0
+    tableau -= np.outer(factors, tableau[row])
+
+    leaving = int(basis[row])
+    basis[row] = column
+    return leaving
+
+
+def lemke_howson(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray, budget: SolverBudget,
+                 initial_label: int = 0) -> Optional[Dict[str, Any]]:
+    """Find one equilibrium by complementary pivoting from the artificial equilibrium
+
+    Labels 0..m-1 are our actions and m..m+n-1 the competitor's. Returns None if the
+    budget runs out, or if the path hits a degenerate ray or revisits a basis (degenerate
+    games can make it cycle forever).
+    """
+    m, n = our_payoffs.shape
+    # Shift payoffs to be positive so both best-response polytopes are bounded
+    a = our_payoffs - our_payoffs.min() + 1
+    b = competitor_payoffs - competitor_payoffs.min() + 1
+
+    # Columns are ordered by label; the final column is the right-hand side
+    ours = np.hstack([b.T, np.eye(n), np.ones((n, 1))])        # B^T x + s = 1
+    theirs = np.hstack([np.eye(m), a, np.ones((m, 1))])        # r + A y = 1
+    our_basis = np.arange(m, m + n)
+    their_basis = np.arange(m)
+
+    entering = initial_label
+    in_ours = entering < m
+    visited = set()
+    while True:
+        if not budget.tick():
+            return None
+        tableau, basis = (ours, our_basis) if in_ours else (theirs, their_basis)
+        leaving = _pivot(tableau, basis, entering)
+        if leaving is None:
+            return None
+        if leaving == initial_label:
+            break
+        state = (frozenset(our_basis.tolist()), frozenset(their_basis.tolist()), leaving)
+        if state in visited:
+            return None
+        visited.add(state)
+        entering = leaving
+        in_ours = not in_ours
+
+    x = np.zeros(m)
+    for row, label in enumerate(our_basis):
+        if label < m:
+            x[label] = ours[row, -1]
+    y = np.zeros(n)
+    for row, label in enumerate(their_basis):
+        if label >= m:
+            y[label - m] = theirs[row, -1]
+    if x.sum() <= 0 or y.sum() <= 0:
+        return None
+    return _equilibrium(our_payoffs, competitor_payoffs, x / x.sum(), y / y.sum())
+
+
+def _indifferent_mix(payoffs: np.ndarray) -> Optional[np.ndarray]:
+    """Mix over the columns of a square payoff block that equalises every row"""
+    k = payoffs.shape[0]
+    system = np.zeros((k + 1, k + 1))
+    system[:k, :k] = payoffs
+    system[:k, k] = -1
+    system[k, :k] = 1
+    rhs = np.zeros(k + 1)
+    rhs[k] = 1
+    try:
+        solution = np.linalg.solve(system, rhs)
+    except np.linalg.LinAlgError:
+        return None
+    return solution[:k]
+
+
+def support_enumeration(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray,
+                        budget: SolverBudget) -> Tuple[List[Dict[str, Any]], bool]:
+    """Enumerate equilibria over equal-sized supports (complete for non-degenerate games)
+
+    Returns the equilibria found and whether the enumeration finished within budget.
+    """
+    m, n = our_payoffs.shape
+    tolerance = 1e-9
+    found = []
+    for size in range(1, min(m, n) + 1):
+        for rows in itertools.combinations(range(m), size):
+            for cols in itertools.combinations(range(n), size):
+                if not budget.tick():
+                    return found, False
+                y_support = _indifferent_mix(our_payoffs[np.ix_(rows, cols)])
+                if y_support is None or (y_support < -tolerance).any():
+                    continue
+                x_support = _indifferent_mix(competitor_payoffs[np.ix_(rows, cols)].T)
+                if x_support is None or (x_support < -tolerance).any():
+                    continue
+
+                x = np.zeros(m)
+                x[list(rows)] = np.clip(x_support, 0, None)
+                y = np.zeros(n)
+                y[list(cols)] = np.clip(y_support, 0, None)
+                # No pure deviation may do better than the equilibrium payoff
+                our_values = our_payoffs @ y
+                their_values = x @ competitor_payoffs
+                if (our_values.max() > our_values[list(rows)].max() + tolerance or
+                        their_values.max() > their_values[list(cols)].max() + tolerance):
+                    continue
+                found.append(_equilibrium(our_payoffs, competitor_payoffs, x, y))
+    return found, True
+
+
+def solve_zero_sum(our_payoffs: np.ndarray, budget: SolverBudget) -> Optional[Dict[str, Any]]:
+    """Optimal mixed strategies of a zero-sum game via the simplex method
+
+    Solves max sum(y) subject to M y <= 1, y >= 0 with M the payoffs shifted to be
+    positive; the game value is 1 / sum(y) and our strategy comes from the duals.
+    """
+    m, n = our_payoffs.shape
+    shift = 1 - our_payoffs.min()
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = our_payoffs + shift
+    tableau[:m, n:n + m] = np.eye(m)
+    tableau[:m, -1] = 1
+    tableau[m, :n] = -1
+    basis = np.arange(n, n + m)
+
+    degenerate = False
+    while True:
+        if not budget.tick():
+            return None
+        improving = np.flatnonzero(tableau[m, :-1] < -1e-12)
+        if not len(improving):
+            break
+        # Dantzig's rule normally, Bland's rule after a degenerate pivot to avoid cycling
+        if degenerate:
+            column = int(improving[0])
+        else:
+            column = int(improving[tableau[m, improving].argmin()])
+        column_values = tableau[:m, column]
+        positive = column_values > 1e-12
+        ratios = np.full(m, np.inf)
+        ratios[positive] = tableau[:m, -1][positive] / column_values[positive]
+        row = int(ratios.argmin())
+        degenerate = ratios[row] <= 1e-12
+
+        tableau[row] /= tableau[row, column]
+        factors = tableau[:, column].copy()
+        factors[row] = 0
+        tableau -= np.outer(factors, tableau[row])
+        basis[row] = column
+
+    total = tableau[m, -1]
+    y = np.zeros(n)
+    for row, variable in enumerate(basis):
+        if variable < n:
+            y[variable] = tableau[row, -1]
+    x = tableau[m, n:n + m].copy()
+    return _equilibrium(our_payoffs, -our_payoffs, x / total, y / total)
+
+
+def solve_mixed(our_payoffs: np.ndarray, competitor_payoffs: np.ndarray, enumerate_all: bool = False,
+                time_budget: float = 1.0, max_iterations: int = 100000) -> Dict[str, Any]:
+    """Pick a mixed-strategy solver suited to the game and run it within a budget
+
+    2x2 games use the closed form, constant-sum games linear programming, and other
+    games Lemke-Howson, or support enumeration when all equilibria are requested.
+    ``stopped`` tells why a search ended without a complete answer: ``'budget'`` when
+    it ran out of time or iterations, ``'degenerate'`` when Lemke-Howson failed on every
+    starting label because the game is degenerate.
+    """
+    budget = SolverBudget(time_budget, max_iterations)
+    m, n = our_payoffs.shape
+    complete = True
+    stopped = None
+    closed_form = solve_2x2(our_payoffs, competitor_payoffs) if (m, n) == (2, 2) else None
+
+    if enumerate_all:
+        method = 'support_enumeration'
+        equilibria, complete = support_enumeration(our_payoffs, competitor_payoffs, budget)
+    elif closed_form is not None:
+        method = 'closed_form'
+        equilibria = [closed_form]
+    elif is_constant_sum(our_payoffs, competitor_payoffs):
+        method = 'linear_programming'
+        equilibrium = solve_zero_sum(our_payoffs, budget)
+        if equilibrium is not None:
+            # Report the competitor's own payoff rather than the negated one used by the LP
+            x = np.zeros(m)
+            x[equilibrium['our_support']] = equilibrium['our_probabilities']
+            y = np.zeros(n)
+            y[equilibrium['competitor_support']] = equilibrium['competitor_probabilities']
+            equilibrium = _equilibrium(our_payoffs, competitor_payoffs, x, y)
+        equilibria = [equilibrium] if equilibrium else []
+    else:
+        method = 'lemke_howson'
+        equilibria = []
+        for label in range(m + n):
+            equilibrium = lemke_howson(our_payoffs, competitor_payoffs, budget, label)
+            if equilibrium is not None:
+                equilibria = [equilibrium]
+                break
+            if budget.exhausted():
+                break
+        else:
+            stopped = 'degenerate'
+
+    if not equilibria and not enumerate_all:
+        complete = False
+    if not complete and stopped is None:
+        stopped = 'budget'
+
+    return {
+        'method': method,
+        'equilibria': equilibria,
+        'complete': complete,
+        'stopped': stopped,
+        'iterations': budget.iterations
+    }
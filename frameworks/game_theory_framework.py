@@ -1,11 +1,31 @@
 """Game Theory Framework Implementation"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Tuple
+import numpy as np
 from .framework_base import Framework, FrameworkResult
+from . import game_solver
 
 
 class GameTheoryFramework(Framework):
-    """Game Theory Framework for competitive decision analysis"""
+    """Game Theory Framework for competitive decision analysis
+    
+    Besides the 2x2 form fields, arbitrary N x M bimatrix games can be given as
+    ``payoff_matrix`` and ``competitor_payoff_matrix`` (nested lists or CSV text, rows are
+    our actions) with optional ``our_actions``/``competitor_actions`` labels.
+    """
+    
+    # Games larger than this many cells keep their payoff tables out of the result
+    VISUALIZATION_CELL_LIMIT = 100
+    MAX_STORED_EQUILIBRIA = 1000
+    MAX_LISTED_EQUILIBRIA = 5
+    # The payoff tables stay stored: rebuilding them would mean parsing the inputs again
+    derived_visualizations = ('nash_equilibria',)
+    # Mixed-strategy solving stops after this many seconds unless the inputs override it
+    DEFAULT_SOLVER_TIME_BUDGET = 1.0
+    DEFAULT_SOLVER_ITERATIONS = 100000
+    # Inputs may lower the budget but never raise it past these, so a request cannot pin a worker
+    MAX_SOLVER_TIME_BUDGET = 5.0
+    MAX_SOLVER_ITERATIONS = 1000000
     
     def __init__(self):
         super().__init__("Game Theory Framework")
@@ -28,6 +48,13 @@ class GameTheoryFramework(Framework):
         }
     
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
+        if 'payoff_matrix' in inputs:
+            try:
+                self._build_game(inputs)
+            except (ValueError, TypeError, KeyError):
+                return False
+            return True
+        
         required_text = ['our_action_1', 'our_action_2', 'competitor_action_1', 'competitor_action_2']
         required_numeric = ['payoff_11', 'payoff_12', 'payoff_21', 'payoff_22',
                            'competitor_payoff_11', 'competitor_payoff_12', 
@@ -44,81 +71,101 @@ class GameTheoryFramework(Framework):
         return True
     
     def calculate(self, inputs: Dict[str, Any]) -> FrameworkResult:
-        # Build payoff matrix
-        our_payoffs = [
-            [inputs['payoff_11'], inputs['payoff_12']],
-            [inputs['payoff_21'], inputs['payoff_22']]
-        ]
-        
-        competitor_payoffs = [
-            [inputs['competitor_payoff_11'], inputs['competitor_payoff_12']],
-            [inputs['competitor_payoff_21'], inputs['competitor_payoff_22']]
-        ]
-        
-        # Find Nash equilibrium
-        nash_equilibria = []
-        
-        for i in range(2):
-            for j in range(2):
-                # Check if (i,j) is Nash equilibrium
-                our_best_response = True
-                competitor_best_response = True
-                
-                # Check if we have incentive to deviate
-                for alt_i in range(2):
-                    if alt_i != i and our_payoffs[alt_i][j] > our_payoffs[i][j]:
-                        our_best_response = False
-                        break
-                
-                # Check if competitor has incentive to deviate
-                for alt_j in range(2):
-                    if alt_j != j and competitor_payoffs[i][alt_j] > competitor_payoffs[i][j]:
-                        competitor_best_response = False
-                        break
-                
-                if our_best_response and competitor_best_response:
-                    nash_equilibria.append((i, j))
+        our_actions, competitor_actions, our_payoffs, competitor_payoffs = self._build_game(inputs)
+        n_rows, n_cols = our_payoffs.shape
+        
+        # Find Nash equilibria from best-response masks
+        equilibria = game_solver.pure_nash_equilibria(our_payoffs, competitor_payoffs)
+        nash_equilibria = equilibria[:self.MAX_STORED_EQUILIBRIA].tolist()
         
         # Generate recommendations
         recommendations = []
         
-        if nash_equilibria:
-            for i, j in nash_equilibria:
-                our_action = inputs[f'our_action_{i+1}']
-                competitor_action = inputs[f'competitor_action_{j+1}']
-                our_payoff = our_payoffs[i][j]
-                recommendations.append(f"Nash equilibrium: {our_action} vs {competitor_action} (payoff: {our_payoff})")
+        if len(equilibria):
+            for i, j in nash_equilibria[:self.MAX_LISTED_EQUILIBRIA]:
+                our_payoff = self._format_payoff(our_payoffs[i, j])
+                recommendations.append(
+                    f"Nash equilibrium: {our_actions[i]} vs {competitor_actions[j]} (payoff: {our_payoff})"
+                )
+            if len(equilibria) > self.MAX_LISTED_EQUILIBRIA:
+                recommendations.append(f"... and {len(equilibria) - self.MAX_LISTED_EQUILIBRIA} more pure equilibria")
         else:
             recommendations.append("No pure strategy Nash equilibrium found")
         
+        mixed = None
+        enumerate_all = str(inputs.get('enumerate_equilibria', '')).lower() in ('1', 'true', 'yes')
+        if not len(equilibria) or enumerate_all:
+            mixed = game_solver.solve_mixed(
+                our_payoffs, competitor_payoffs,
+                enumerate_all=enumerate_all,
+                time_budget=min(float(inputs.get('solver_time_budget', self.DEFAULT_SOLVER_TIME_BUDGET)),
+                                self.MAX_SOLVER_TIME_BUDGET),
+                max_iterations=min(int(inputs.get('solver_max_iterations', self.DEFAULT_SOLVER_ITERATIONS)),
+                                   self.MAX_SOLVER_ITERATIONS)
+            )
+            recommendations.extend(self._mixed_recommendations(mixed, our_actions))
+        
         # Find dominant strategies
-        dominant_strategy = self._find_dominant_strategy(our_payoffs)
+        dominant_strategy = game_solver.dominant_strategy(our_payoffs)
         if dominant_strategy is not None:
-            action_name = inputs[f'our_action_{dominant_strategy+1}']
-            recommendations.append(f"Dominant strategy: {action_name}")
+            recommendations.append(f"Dominant strategy: {our_actions[dominant_strategy]}")
+        
+        elimination = game_solver.iterated_elimination(our_payoffs, competitor_payoffs)
+        reduced_shape = [len(elimination['rows']), len(elimination['cols'])]
+        if reduced_shape != [n_rows, n_cols]:
+            recommendations.append(
+                f"Eliminating dominated strategies reduces the game from {n_rows}x{n_cols} "
+                f"to {reduced_shape[0]}x{reduced_shape[1]}"
+            )
+        
+        maximin_row, maximin_payoff = game_solver.security_level(our_payoffs)
+        recommendations.append(
+            f"Safest action: {our_actions[maximin_row]} guarantees at least {self._format_payoff(maximin_payoff)}"
+        )
         
         scores = {
-            'payoff_scenario_11': our_payoffs[0][0],
-            'payoff_scenario_12': our_payoffs[0][1],
-            'payoff_scenario_21': our_payoffs[1][0],
-            'payoff_scenario_22': our_payoffs[1][1]
+            'pure_equilibria': len(equilibria),
+            'security_level': maximin_payoff
         }
+        if (n_rows, n_cols) == (2, 2):
+            scores.update({
+                'payoff_scenario_11': our_payoffs[0, 0].item(),
+                'payoff_scenario_12': our_payoffs[0, 1].item(),
+                'payoff_scenario_21': our_payoffs[1, 0].item(),
+                'payoff_scenario_22': our_payoffs[1, 1].item()
+            })
         
         visualizations = {
-            'payoff_matrix': {
-                'our_actions': [inputs['our_action_1'], inputs['our_action_2']],
-                'competitor_actions': [inputs['competitor_action_1'], inputs['competitor_action_2']],
-                'our_payoffs': our_payoffs,
-                'competitor_payoffs': competitor_payoffs
-            },
+            'game_shape': [n_rows, n_cols],
             'nash_equilibria': nash_equilibria
         }
+        # Payoff tables already live in the inputs, so only small games repeat them for charts
+        if n_rows * n_cols <= self.VISUALIZATION_CELL_LIMIT:
+            visualizations['payoff_matrix'] = {
+                'our_actions': our_actions,
+                'competitor_actions': competitor_actions,
+                'our_payoffs': our_payoffs.tolist(),
+                'competitor_payoffs': competitor_payoffs.tolist()
+            }
         
         additional_data = {
             'nash_equilibria': nash_equilibria,
+            'nash_equilibria_count': len(equilibria),
             'dominant_strategy': dominant_strategy,
+            'maximin_strategy': maximin_row,
+            'eliminated_strategies': elimination['rounds'],
+            'reduced_game_shape': reduced_shape,
             'notes': inputs.get('additional_notes', '')
         }
+        if mixed is not None:
+            additional_data['mixed_equilibria'] = mixed['equilibria'][:self.MAX_STORED_EQUILIBRIA]
+            additional_data['mixed_solver'] = {
+                'method': mixed['method'],
+                'complete': mixed['complete'],
+                'iterations': mixed['iterations']
+            }
+            if mixed['equilibria']:
+                scores['mixed_equilibrium_payoff'] = mixed['equilibria'][0]['our_payoff']
         
         return FrameworkResult(
             framework_name=self.name,
@@ -128,21 +175,77 @@ class GameTheoryFramework(Framework):
             additional_data=additional_data
         )
     
-    def _find_dominant_strategy(self, payoff_matrix: List[List[float]]) -> int:
-        """Find if there's a dominant strategy"""
-        for i in range(2):
-            dominates = True
-            for alt_i in range(2):
-                if alt_i != i:
-                    for j in range(2):
-                        if payoff_matrix[i][j] <= payoff_matrix[alt_i][j]:
-                            dominates = False
-                            break
-                    if not dominates:
-                        break
-            if dominates:
-                return i
-        return None
+    def _mixed_recommendations(self, mixed: Dict[str, Any], our_actions: List[str]) -> List[str]:
+        """Describe the mixed equilibria found, listing our most likely actions first"""
+        recommendations = []
+        for equilibrium in mixed['equilibria'][:self.MAX_LISTED_EQUILIBRIA]:
+            if len(equilibrium['our_support']) < 2:
+                continue
+            mix = sorted(zip(equilibrium['our_probabilities'], equilibrium['our_support']), key=lambda item: (-item[0], item[1]))
+            shares = ', '.join(f"{our_actions[i]} {p:.0%}" for p, i in mix[:self.MAX_LISTED_EQUILIBRIA])
+            if len(mix) > self.MAX_LISTED_EQUILIBRIA:
+                shares += f", and {len(mix) - self.MAX_LISTED_EQUILIBRIA} more"
+            recommendations.append(
+                f"Mixed equilibrium: {shares} (expected payoff: {equilibrium['our_payoff']:.2f})"
+            )
+        if mixed['stopped'] == 'degenerate':
+            recommendations.append("Lemke-Howson found no equilibrium because the game is degenerate; "
+                                   "set enumerate_equilibria to search all supports")
+        elif not mixed['complete']:
+            recommendations.append("Equilibrium search stopped at its time budget; results may be incomplete")
+        elif not mixed['equilibria']:
+            recommendations.append("No mixed strategy equilibrium found")
+        return recommendations
+    
+    def _build_game(self, inputs: Dict[str, Any]) -> Tuple[List[str], List[str], np.ndarray, np.ndarray]:
+        """Return action labels and payoff matrices from matrix or 2x2 inputs"""
+        if 'payoff_matrix' not in inputs:
+            our_payoffs = np.array([
+                [inputs['payoff_11'], inputs['payoff_12']],
+                [inputs['payoff_21'], inputs['payoff_22']]
+            ], dtype=np.float64)
+            competitor_payoffs = np.array([
+                [inputs['competitor_payoff_11'], inputs['competitor_payoff_12']],
+                [inputs['competitor_payoff_21'], inputs['competitor_payoff_22']]
+            ], dtype=np.float64)
+            our_actions = [inputs['our_action_1'], inputs['our_action_2']]
+            competitor_actions = [inputs['competitor_action_1'], inputs['competitor_action_2']]
+            return our_actions, competitor_actions, our_payoffs, competitor_payoffs
+        
+        our_labels, competitor_labels, our_payoffs = self._read_matrix(inputs['payoff_matrix'])
+        _, _, competitor_payoffs = self._read_matrix(inputs['competitor_payoff_matrix'])
+        if our_payoffs.shape != competitor_payoffs.shape:
+            raise ValueError("Payoff matrices must have the same shape")
+        if not (np.isfinite(our_payoffs).all() and np.isfinite(competitor_payoffs).all()):
+            raise ValueError("Payoffs must be finite numbers")
+        
+        n_rows, n_cols = our_payoffs.shape
+        our_actions = self._read_labels(inputs.get('our_actions'), our_labels, n_rows, 'Our action')
+        competitor_actions = self._read_labels(inputs.get('competitor_actions'), competitor_labels,
+                                               n_cols, 'Competitor action')
+        return our_actions, competitor_actions, our_payoffs, competitor_payoffs
+    
+    def _read_matrix(self, value: Any) -> Tuple[List[str], List[str], np.ndarray]:
+        if isinstance(value, str):
+            return game_solver.parse_payoff_csv(value)
+        return None, None, game_solver.as_payoff_matrix(value)
+    
+    def _read_labels(self, value: Any, parsed: List[str], size: int, prefix: str) -> List[str]:
+        if isinstance(value, str):
+            value = [label.strip() for label in value.split(',')]
+        labels = list(value or parsed or [f"{prefix} {i + 1}" for i in range(size)])
+        if len(labels) != size:
+            raise ValueError(f"Expected {size} labels for {prefix.lower()}s, got {len(labels)}")
+        return labels
+    
+    @staticmethod
+    def _format_payoff(value: float) -> Any:
+        """Show integral payoffs without a trailing .0, as entered"""
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        return {'nash_equilibria': result['additional_data']['nash_equilibria']}
     
     def get_visualization_data(self) -> Dict[str, Any]:
         return self.result.visualizations if self.result else {}
\ No newline at end of file
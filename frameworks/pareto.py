@@ -0,0 +1,196 @@
+"""Pareto frontier layers over Risk-Reward options"""
+
+import bisect
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .risk_reward_framework import RiskRewardFramework
+
+# Default trade-off: lower risk is better, higher reward is better
+DEFAULT_CRITERIA = ['-risk_level', 'reward_potential']
+
+
+def parse_criteria(criteria: Sequence[str]) -> List[Tuple[str, bool]]:
+    """Turn names such as '-risk_level' into (column, maximize) pairs; a leading '-' means minimize"""
+    parsed = []
+    for criterion in criteria:
+        criterion = criterion.strip()
+        if criterion.startswith('-'):
+            parsed.append((criterion[1:], False))
+        else:
+            parsed.append((criterion.lstrip('+'), True))
+    if not 2 <= len(parsed) <= 4:
+        raise ValueError("Pareto analysis needs between 2 and 4 criteria")
+    return parsed
+
+
+def pareto_ranks(points: np.ndarray) -> np.ndarray:
+    """Non-domination rank (1 = frontier) of each row, with every column maximized
+
+    Two criteria use an O(n log n) sweep, three keep a 2D staircase per layer, and four
+    use non-dominated sorting with a binary search over layers. Identical points always share a rank.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] < 2:
+        raise ValueError("Points must be a 2D array with at least two criteria")
+    if not len(points):
+        return np.zeros(0, dtype=np.int64)
+
+    # Deduplicate so any earlier point in sorted order that is >= on all criteria strictly dominates
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    order = np.lexsort(tuple(-unique[:, i] for i in range(unique.shape[1] - 1, -1, -1)))
+    ranked = unique[order]
+
+    if ranked.shape[1] == 2:
+        layers = _sweep_2d(ranked)
+    elif ranked.shape[1] == 3:
+        layers = _staircase_3d(ranked)
+    else:
+        layers = _binary_search_sort(ranked)
+
+    unique_ranks = np.empty(len(unique), dtype=np.int64)
+    unique_ranks[order] = layers + 1
+    return unique_ranks[inverse.ravel()]
+
+
+def _sweep_2d(ranked: np.ndarray) -> np.ndarray:
+    """Assign layers to points sorted by x then y descending
+
+    Every earlier point has x >= the current one, so a layer dominates the point exactly
+    when its best y so far is >= the point's y. Those best values decrease layer by
+    layer, which allows a binary search per point.
+    """
+    negated_tails = []  # -max(y) per layer, increasing
+    layers = np.empty(len(ranked), dtype=np.int64)
+    for i, y in enumerate(ranked[:, 1].tolist()):
+        layer = bisect.bisect_right(negated_tails, -y)
+        if layer == len(negated_tails):
+            negated_tails.append(-y)
+        else:
+            negated_tails[layer] = -y
+        layers[i] = layer
+    return layers
+
+
+def _staircase_3d(ranked: np.ndarray) -> np.ndarray:
+    """Assign layers to points sorted by the first criterion descending
+
+    Earlier points already win on the first criterion, so each layer only needs its
+    maximal (y, z) staircase: ys ascending with zs descending. A layer dominates a point
+    when the first member with y >= the point's y also has z >= its z.
+    """
+    ys_by_layer = []
+    negated_zs_by_layer = []  # -z per staircase step, increasing
+    layers = np.empty(len(ranked), dtype=np.int64)
+    for i, (y, z) in enumerate(ranked[:, 1:].tolist()):
+        lo, hi = 0, len(ys_by_layer)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ys, negated_zs = ys_by_layer[mid], negated_zs_by_layer[mid]
+            step = bisect.bisect_left(ys, y)
+            if step < len(ys) and -negated_zs[step] >= z:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(ys_by_layer):
+            ys_by_layer.append([])
+            negated_zs_by_layer.append([])
+
+        # Drop the steps the new point covers, then insert it in their place
+        ys, negated_zs = ys_by_layer[lo], negated_zs_by_layer[lo]
+        end = bisect.bisect_left(ys, y)
+        if end < len(ys) and ys[end] == y:
+            end += 1
+        start = bisect.bisect_left(negated_zs, -z, 0, end)
+        ys[start:end] = [y]
+        negated_zs[start:end] = [-z]
+        layers[i] = lo
+    return layers
+
+
+def _binary_search_sort(ranked: np.ndarray) -> np.ndarray:
+    """Efficient non-dominated sort with binary search over layers
+
+    If a point is dominated by a member of layer k it is also dominated by some member
+    of every earlier layer, so the first non-dominating layer can be bisected. Earlier
+    points already win on the first criterion, which is therefore not compared.
+    """
+    n, dims = ranked.shape
+    members = []
+    counts = []
+    layers = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        point = ranked[i, 1:]
+        lo, hi = 0, len(members)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (members[mid][:counts[mid]] >= point).all(axis=1).any():
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(members):
+            members.append(np.empty((16, dims - 1)))
+            counts.append(0)
+        # Members the new point covers on the compared criteria can no longer decide anything
+        layer = members[lo]
+        kept = ~(layer[:counts[lo]] <= point).all(axis=1)
+        if not kept.all():
+            counts[lo] = int(kept.sum())
+            layer[:counts[lo]] = layer[:len(kept)][kept]
+        if counts[lo] == len(layer):
+            layer = members[lo] = np.concatenate([layer, np.empty_like(layer)])
+        layer[counts[lo]] = point
+        counts[lo] += 1
+        layers[i] = lo
+    return layers
+
+
+def frontier_layers(options: Any, criteria: Optional[Sequence[str]] = None,
+                    max_layers: Optional[int] = None) -> Dict[str, Any]:
+    """Score options with RiskRewardFramework and group them into Pareto layers
+
+    ``options`` is a list of option dicts or a mapping of column -> array. Criteria may be
+    any numeric Risk-Reward score, e.g. ``['-risk_level', 'risk_adjusted_return']``.
+    The layers are shaped for plotting next to the ``risk_reward_matrix`` visualization.
+    """
+    framework = RiskRewardFramework()
+    parsed = parse_criteria(criteria or DEFAULT_CRITERIA)
+    columns = framework._to_columns(options)
+    valid = framework.validate_batch(columns)
+    scores = framework.calculate_batch({name: column[valid] for name, column in columns.items()})
+
+    for name, _ in parsed:
+        if name not in scores or scores[name].dtype.kind != 'f':
+            raise ValueError(f"Unknown numeric criterion '{name}'")
+    values = np.column_stack([scores[name] for name, _ in parsed])
+    signs = np.array([1.0 if maximize else -1.0 for _, maximize in parsed])
+    ranks = pareto_ranks(values * signs)
+
+    indices = np.flatnonzero(valid)
+    layer_count = int(ranks.max()) if len(ranks) else 0
+    if max_layers is not None:
+        layer_count = min(layer_count, max_layers)
+
+    # Group by rank once, ordering each layer along the first criterion for line plots
+    order = np.lexsort((values[:, 0], ranks))
+    boundaries = np.searchsorted(ranks[order], np.arange(1, layer_count + 2))
+    layers = []
+    for rank in range(1, layer_count + 1):
+        members = order[boundaries[rank - 1]:boundaries[rank]]
+        layers.append({
+            'rank': rank,
+            'indices': indices[members].tolist(),
+            'points': values[members].tolist()
+        })
+
+    full_ranks = np.zeros(len(valid), dtype=np.int64)
+    full_ranks[indices] = ranks
+    return {
+        'criteria': [name if maximize else f"-{name}" for name, maximize in parsed],
+        'axes': [name for name, _ in parsed],
+        'ranks': full_ranks.tolist(),
+        'layers': layers,
+        'layer_count': int(ranks.max()) if len(ranks) else 0,
+        'invalid_options': np.flatnonzero(~valid).tolist()
+    }
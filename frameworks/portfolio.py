@@ -0,0 +1,344 @@
+"""Budget-constrained portfolio selection over many Risk-Reward options"""
+
+import csv
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from .risk_reward_framework import RiskRewardFramework
+
+# Largest DP table (options x budget steps) solved exactly before falling back
+DP_CELL_LIMIT = 50_000_000
+# Branch and bound is used for small inputs and for the two-constraint problem
+BNB_OPTION_LIMIT = 60
+BNB_NODE_LIMIT = 200_000
+# Candidate budget resolutions, coarsest first
+RESOLUTIONS = (1.0, 0.1, 0.01)
+# Weightings of the resource and risk constraints tried for the surrogate bound, plus refinements
+SURROGATE_STEPS = 17
+SURROGATE_REFINEMENTS = 8
+# Options around the marginal density that are re-solved by branch and bound after a greedy fill
+CORE_SIZE = 40
+CORE_NODE_LIMIT = 20_000
+
+
+@dataclass
+class PortfolioResult:
+    """Selected options and diagnostics from a portfolio optimization"""
+    selected: List[int]
+    total_value: float
+    total_resources: float
+    total_risk: float
+    upper_bound: float
+    method: str
+    optimal: bool
+    runtime_seconds: float
+    objective: str
+    budget: float
+    shadow_price: float
+    marginal_values: Dict[int, float] = field(default_factory=dict)
+    candidates: int = 0
+    invalid_options: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'selected': self.selected,
+            'total_value': self.total_value,
+            'total_resources': self.total_resources,
+            'total_risk': self.total_risk,
+            'upper_bound': self.upper_bound,
+            'gap': self.upper_bound - self.total_value,
+            'method': self.method,
+            'optimal': self.optimal,
+            'runtime_seconds': self.runtime_seconds,
+            'objective': self.objective,
+            'budget': self.budget,
+            'shadow_price': self.shadow_price,
+            'marginal_values': {str(k): v for k, v in self.marginal_values.items()},
+            'candidates': self.candidates,
+            'invalid_options': self.invalid_options
+        }
+
+
+def load_options(path: str) -> List[Dict[str, Any]]:
+    """Read options from a CSV, JSON array or JSON Lines file"""
+    with open(path, 'r', newline='') as f:
+        if path.endswith('.csv'):
+            return [{key: _number(value) for key, value in row.items()} for row in csv.DictReader(f)]
+        text = f.read().strip()
+    if text.startswith('['):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def _number(value: str) -> Any:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class PortfolioOptimizer:
+    """Chooses the subset of options maximizing total value under resource and risk caps
+
+    Uses an exact dynamic program over the resource budget when the table is small
+    enough, branch and bound for small inputs or when a total risk cap adds a second
+    constraint, and otherwise a greedy fill whose options around the marginal density
+    are re-solved by branch and bound, reported against its LP-relaxation bound.
+
+    With a total risk cap, both constraints are combined into one surrogate constraint
+    whose weighting is chosen to give the tightest bound; the greedy order uses it too.
+    """
+
+    def __init__(self, objective: str = 'expected_value'):
+        self.framework = RiskRewardFramework()
+        self.objective = objective
+
+    def optimize(self, options: Any, budget: float, max_risk_level: Optional[float] = None,
+                 max_total_risk: Optional[float] = None) -> PortfolioResult:
+        start = time.perf_counter()
+        framework_columns = self.framework._to_columns(options)
+        valid = self.framework.validate_batch(framework_columns)
+        scores = self.framework.calculate_batch({k: v[valid] for k, v in framework_columns.items()})
+        if self.objective not in scores or scores[self.objective].dtype.kind != 'f':
+            raise ValueError(f"Unknown numeric objective '{self.objective}'")
+
+        indices = np.flatnonzero(valid)
+        values = scores[self.objective]
+        weights = scores['resource_requirements']
+        risks = scores['risk_level']
+
+        # Options that cannot improve the portfolio or break a hard cap are never chosen
+        eligible = (values > 0) & (weights <= budget)
+        if max_risk_level is not None:
+            eligible &= risks <= max_risk_level
+        if max_total_risk is not None:
+            eligible &= risks <= max_total_risk
+        indices, values, weights, risks = indices[eligible], values[eligible], weights[eligible], risks[eligible]
+
+        theta = self._surrogate_weighting(values, weights, risks, budget, max_total_risk)
+        shadow_price, upper_bound = self._lp_relaxation(values, weights, risks, budget, max_total_risk, theta)
+        chosen, method, optimal = self._solve(values, weights, risks, budget, max_total_risk, upper_bound, theta)
+
+        selected = sorted(indices[chosen].tolist())
+        usage, _ = self._usage(weights, risks, budget, max_total_risk, theta)
+        marginal = values - shadow_price * usage
+        return PortfolioResult(
+            selected=selected,
+            total_value=float(values[chosen].sum()),
+            total_resources=float(weights[chosen].sum()),
+            total_risk=float(risks[chosen].sum()),
+            upper_bound=float(upper_bound),
+            method=method,
+            optimal=optimal,
+            runtime_seconds=time.perf_counter() - start,
+            objective=self.objective,
+            budget=budget,
+            shadow_price=float(shadow_price),
+            marginal_values={int(i): float(m) for i, m in zip(indices[chosen], marginal[chosen])},
+            candidates=len(indices),
+            invalid_options=np.flatnonzero(~valid).tolist()
+        )
+
+    def _solve(self, values, weights, risks, budget, max_total_risk, upper_bound, theta):
+        n = len(values)
+        if n == 0:
+            return np.zeros(0, dtype=bool), 'empty', True
+        if max_total_risk is None:
+            resolution = self._resolution(weights, budget)
+            if resolution is not None and n * (math.floor(budget / resolution) + 1) <= DP_CELL_LIMIT:
+                return self._dynamic_programming(values, weights, budget, resolution), 'dynamic_programming', True
+        if n <= BNB_OPTION_LIMIT:
+            chosen, complete = self._branch_and_bound(values, weights, risks, budget, max_total_risk, theta)
+            return chosen, 'branch_and_bound', complete
+        chosen = self._greedy(values, weights, risks, budget, max_total_risk, theta)
+        chosen = self._improve(chosen, values, weights, risks, budget, max_total_risk, theta)
+        return chosen, 'greedy', bool(np.isclose(values[chosen].sum(), upper_bound))
+
+    @staticmethod
+    def _resolution(weights: np.ndarray, budget: float) -> Optional[float]:
+        """Coarsest resolution at which every weight is an exact integer multiple"""
+        for resolution in RESOLUTIONS:
+            scaled = weights / resolution
+            if np.allclose(scaled, np.round(scaled)):
+                return resolution
+        return None
+
+    @staticmethod
+    def _dynamic_programming(values, weights, budget, resolution) -> np.ndarray:
+        """Exact 0/1 knapsack, vectorized over budget steps"""
+        capacity = int(math.floor(budget / resolution + 1e-9))
+        steps = np.round(weights / resolution).astype(np.int64)
+        best = np.zeros(capacity + 1)
+        keep = np.zeros((len(values), capacity + 1), dtype=bool)
+        for i, (w, v) in enumerate(zip(steps, values)):
+            candidate = best[:capacity + 1 - w] + v
+            improved = candidate > best[w:]
+            keep[i, w:] = improved
+            best[w:] = np.where(improved, candidate, best[w:])
+
+        chosen = np.zeros(len(values), dtype=bool)
+        remaining = capacity
+        for i in range(len(values) - 1, -1, -1):
+            if keep[i, remaining]:
+                chosen[i] = True
+                remaining -= steps[i]
+        return chosen
+
+    @staticmethod
+    def _usage(weights, risks, budget, max_total_risk, theta=0.5):
+        """Capacity used per option and the total capacity
+
+        With a total risk cap both constraints are normalized and combined, with weight
+        ``theta`` on resources, into one surrogate constraint; any weighting keeps the
+        fractional bound valid.
+        """
+        if max_total_risk is None:
+            return weights, budget
+        return theta * weights / budget + (1 - theta) * risks / max_total_risk, 1.0
+
+    def _surrogate_weighting(self, values, weights, risks, budget, max_total_risk) -> float:
+        """Weighting of the resource constraint that gives the tightest fractional bound"""
+        if max_total_risk is None or not len(values):
+            return 0.5
+        bound = lambda theta: self._lp_relaxation(values, weights, risks, budget, max_total_risk, theta)[1]
+        grid = np.linspace(0.0, 1.0, SURROGATE_STEPS)
+        bounds = [bound(theta) for theta in grid]
+        best = int(np.argmin(bounds))
+        # The bound is convex in theta, so refine between the neighbours of the best grid point
+        low, high = grid[max(best - 1, 0)], grid[min(best + 1, len(grid) - 1)]
+        for theta in np.linspace(low, high, SURROGATE_REFINEMENTS):
+            value = bound(theta)
+            if value < bounds[best]:
+                grid, bounds, best = np.append(grid, theta), bounds + [value], len(bounds)
+        return float(grid[best])
+
+    def _lp_relaxation(self, values, weights, risks, budget, max_total_risk, theta=0.5):
+        """Fractional-knapsack upper bound and the value per capacity unit of the marginal option"""
+        if not len(values):
+            return 0.0, 0.0
+        usage, capacity = self._usage(weights, risks, budget, max_total_risk, theta)
+        order = np.argsort(-(values / usage), kind='stable')
+        cumulative = np.cumsum(usage[order])
+        full = int(np.searchsorted(cumulative, capacity, side='right'))
+        bound = float(values[order[:full]].sum())
+        if full == len(order):
+            return 0.0, bound
+        item = order[full]
+        used = cumulative[full - 1] if full else 0.0
+        bound += (capacity - used) / usage[item] * values[item]
+        return values[item] / usage[item], bound
+
+    def _greedy(self, values, weights, risks, budget, max_total_risk, theta=0.5) -> np.ndarray:
+        """Take options by density, skipping those that no longer fit"""
+        usage, _ = self._usage(weights, risks, budget, max_total_risk, theta)
+        order = np.argsort(-(values / usage), kind='stable')
+        chosen = self._fill(np.zeros(len(values), dtype=bool), order, weights, risks, budget, max_total_risk)
+
+        # The best single option bounds the greedy loss on adversarial inputs
+        fits = weights <= budget + 1e-9
+        if max_total_risk is not None:
+            fits &= risks <= max_total_risk + 1e-9
+        if fits.any():
+            best = int(np.where(fits, values, -np.inf).argmax())
+            if values[best] > values[chosen].sum():
+                chosen[:] = False
+                chosen[best] = True
+        return chosen
+
+    @staticmethod
+    def _fill(chosen, order, weights, risks, budget, max_total_risk) -> np.ndarray:
+        """Add options in ``order`` to ``chosen`` while they fit the remaining capacity"""
+        chosen = chosen.copy()
+        used = float(weights[chosen].sum())
+        risk_used = float(risks[chosen].sum())
+        risk_cap = max_total_risk if max_total_risk is not None else math.inf
+        for i in order:
+            if chosen[i] or used + weights[i] > budget + 1e-9 or risk_used + risks[i] > risk_cap + 1e-9:
+                continue
+            chosen[i] = True
+            used += weights[i]
+            risk_used += risks[i]
+        return chosen
+
+    def _improve(self, chosen, values, weights, risks, budget, max_total_risk, theta) -> np.ndarray:
+        """Re-solve the options around the marginal density exactly, then fill leftover capacity
+
+        Options ranked well above the first one that no longer fits are kept, those well
+        below it are only used to fill what capacity remains, and the CORE_SIZE options in
+        between go to branch and bound. Returns the better of this and ``chosen``.
+        """
+        usage, _ = self._usage(weights, risks, budget, max_total_risk, theta)
+        order = np.argsort(-(values / usage), kind='stable')
+        risk_cap = max_total_risk if max_total_risk is not None else math.inf
+        fits = (np.cumsum(weights[order]) <= budget + 1e-9) & (np.cumsum(risks[order]) <= risk_cap + 1e-9)
+        marginal = len(order) if fits.all() else int(np.argmin(fits))
+        start = max(marginal - CORE_SIZE // 2, 0)
+        fixed, core = order[:start], order[start:start + CORE_SIZE]
+
+        improved = np.zeros(len(values), dtype=bool)
+        improved[fixed] = True
+        core_chosen, _ = self._branch_and_bound(
+            values[core], weights[core], risks[core], budget - float(weights[fixed].sum()),
+            risk_cap - float(risks[fixed].sum()) if max_total_risk is not None else None, theta, CORE_NODE_LIMIT)
+        improved[core[core_chosen]] = True
+        improved = self._fill(improved, order, weights, risks, budget, max_total_risk)
+        return improved if values[improved].sum() > values[chosen].sum() else chosen
+
+    def _branch_and_bound(self, values, weights, risks, budget, max_total_risk, theta=0.5,
+                          node_limit=BNB_NODE_LIMIT):
+        """Depth-first branch and bound with a fractional-knapsack bound on the (surrogate) capacity"""
+        if budget < 0 or (max_total_risk is not None and max_total_risk < 0):
+            return np.zeros(len(values), dtype=bool), True
+        usage, capacity = self._usage(weights, risks, budget, max_total_risk, theta)
+        order = np.argsort(-(values / usage), kind='stable')
+        v, w, r, u = values[order].tolist(), weights[order].tolist(), risks[order].tolist(), usage[order].tolist()
+        n = len(v)
+        risk_cap = max_total_risk if max_total_risk is not None else math.inf
+
+        incumbent = self._greedy(values, weights, risks, budget, max_total_risk, theta)
+        best_value = float(values[incumbent].sum())
+        best_choice = [bool(incumbent[order[i]]) for i in range(n)]
+
+        def bound(level, value, used):
+            remaining = capacity - used
+            for i in range(level, n):
+                if u[i] <= remaining:
+                    remaining -= u[i]
+                    value += v[i]
+                else:
+                    return value + v[i] * remaining / u[i]
+            return value
+
+        nodes = 0
+        stack = [(0, 0.0, 0.0, 0.0, 0.0, [])]
+        while stack:
+            nodes += 1
+            if nodes > node_limit:
+                break
+            level, value, used, resources_used, risk_used, taken = stack.pop()
+            if value > best_value:
+                best_value = value
+                best_choice = [i in taken for i in range(n)]
+            if level == n or bound(level, value, used) <= best_value + 1e-12:
+                continue
+            # Explore the branch without the option first so the "take" branch is popped next
+            stack.append((level + 1, value, used, resources_used, risk_used, taken))
+            if resources_used + w[level] <= budget + 1e-9 and risk_used + r[level] <= risk_cap + 1e-9:
+                stack.append((level + 1, value + v[level], used + u[level], resources_used + w[level],
+                              risk_used + r[level], taken + [level]))
+
+        chosen = np.zeros(n, dtype=bool)
+        chosen[order[np.flatnonzero(best_choice)]] = True
+        return chosen, nodes <= node_limit
+
+
+def optimize_portfolio(options: Any, budget: float, objective: str = 'expected_value',
+                       max_risk_level: Optional[float] = None,
+                       max_total_risk: Optional[float] = None) -> PortfolioResult:
+    """Convenience wrapper around PortfolioOptimizer.optimize"""
+    return PortfolioOptimizer(objective).optimize(options, budget, max_risk_level, max_total_risk)
@@ -0,0 +1,239 @@
+"""Lazy registry of decision frameworks
+
+Framework metadata (key, display name and input schema) is declared here so that
+listing frameworks never imports an implementation or NumPy; a framework module is
+only imported when its instance is first requested. Third-party packages register
+frameworks under the ``decision_toolkit.frameworks`` entry point group, naming either
+a Framework subclass or a FrameworkSpec:
+
+    [project.entry-points."decision_toolkit.frameworks"]
+    pestle = "my_package.pestle:PestleFramework"
+
+This module must stay cheap to import; keep heavy imports inside functions.
+"""
+
+import importlib
+import os
+import sys
+from collections.abc import Mapping
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+
+ENTRY_POINT_GROUP = 'decision_toolkit.frameworks'
+
+
+class FrameworkSpec:
+    """Metadata for a framework and the ``module:attribute`` path of its implementation"""
+
+    __slots__ = ('key', 'name', 'target', 'inputs', 'batch_fields')
+
+    def __init__(self, key: str, name: str, target: str, inputs: Optional[Dict[str, str]] = None,
+                 batch_fields: Tuple[str, ...] = ()):
+        self.key = key
+        self.name = name
+        self.target = target
+        self.inputs = dict(inputs or {})
+        self.batch_fields = tuple(batch_fields)
+
+    def load(self):
+        """Import and return the framework class (or factory) named by ``target``"""
+        module_name, _, attribute = self.target.partition(':')
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'key': self.key, 'name': self.name, 'inputs': dict(self.inputs),
+                'batch_fields': list(self.batch_fields)}
+
+    def __repr__(self) -> str:
+        return f"FrameworkSpec({self.key!r}, {self.name!r}, {self.target!r})"
+
+
+# Kept in step with each framework's get_required_inputs() and batch_fields;
+# benchmarks/startup.py --check verifies they match
+BUILTIN_FRAMEWORKS = (
+    FrameworkSpec('7s', 'McKinsey 7S Framework', 'frameworks.seven_s_framework:SevenSFramework', {
+        'strategy': 'Current strategic approach and focus (1-10 scale)',
+        'structure': 'Organizational hierarchy and reporting effectiveness (1-10 scale)',
+        'systems': 'Processes, procedures, and IT infrastructure quality (1-10 scale)',
+        'shared_values': 'Company culture and core beliefs alignment (1-10 scale)',
+        'style': 'Leadership approach and management effectiveness (1-10 scale)',
+        'staff': 'Human resources and organizational capabilities (1-10 scale)',
+        'skills': 'Core competencies and capabilities strength (1-10 scale)',
+        'additional_notes': 'Any additional context or observations (optional)'
+    }, ('strategy', 'structure', 'systems', 'shared_values', 'style', 'staff', 'skills')),
+    FrameworkSpec('vpc', 'VPC Framework', 'frameworks.vpc_framework:VPCFramework', {
+        'cost': 'Total cost to create the offering (numeric)',
+        'price': 'Market price point (numeric)',
+        'value': 'Consumer perceived value (numeric)',
+        'additional_notes': 'Any additional context (optional)'
+    }, ('cost', 'price', 'value')),
+    FrameworkSpec('strategic', 'Strategic Inflection Points Framework',
+                  'frameworks.strategic_inflection_framework:StrategicInflectionFramework', {
+        'market_signals': 'Market dynamics and early warning signs (1-10 scale)',
+        'competitive_shifts': 'Changes in competitive landscape (1-10 scale)',
+        'technology_impact': 'New technology adoption impact (1-10 scale)',
+        'business_model_threat': 'Business model disruption threat (1-10 scale)',
+        'internal_performance': 'Internal performance metrics (1-10 scale)',
+        'frontline_feedback': 'Frontline employee insights (1-10 scale)',
+        'signal_description': 'Description of key signals observed',
+        'additional_notes': 'Additional context (optional)'
+    }, ('market_signals', 'competitive_shifts', 'technology_impact', 'business_model_threat',
+        'internal_performance', 'frontline_feedback')),
+    FrameworkSpec('game', 'Game Theory Framework', 'frameworks.game_theory_framework:GameTheoryFramework', {
+        'our_action_1': 'Our first possible action',
+        'our_action_2': 'Our second possible action',
+        'competitor_action_1': 'Competitor first possible action',
+        'competitor_action_2': 'Competitor second possible action',
+        'payoff_11': 'Our payoff when both choose action 1 (numeric)',
+        'payoff_12': 'Our payoff when we choose 1, competitor chooses 2 (numeric)',
+        'payoff_21': 'Our payoff when we choose 2, competitor chooses 1 (numeric)',
+        'payoff_22': 'Our payoff when both choose action 2 (numeric)',
+        'competitor_payoff_11': 'Competitor payoff when both choose action 1 (numeric)',
+        'competitor_payoff_12': 'Competitor payoff when we choose 1, they choose 2 (numeric)',
+        'competitor_payoff_21': 'Competitor payoff when we choose 2, they choose 1 (numeric)',
+        'competitor_payoff_22': 'Competitor payoff when both choose action 2 (numeric)',
+        'additional_notes': 'Additional context (optional)'
+    }),
+    FrameworkSpec('risk', 'Risk-Reward Framework', 'frameworks.risk_reward_framework:RiskRewardFramework', {
+        'risk_level': 'Risk assessment level (1-10 scale, 1=low risk, 10=high risk)',
+        'reward_potential': 'Reward potential (1-10 scale, 1=low reward, 10=high reward)',
+        'resource_requirements': 'Resource requirements (1-10 scale)',
+        'success_probability': 'Success probability (0-100%)',
+        'roi_projection': 'ROI projection percentage',
+        'time_horizon': 'Time horizon in months',
+        'option_description': 'Description of the strategic option',
+        'additional_notes': 'Additional context (optional)'
+    }, ('risk_level', 'reward_potential', 'resource_requirements', 'success_probability', 'roi_projection')),
+    FrameworkSpec('cynefin', 'Cynefin Framework', 'frameworks.cynefin_framework:CynefinFramework', {
+        'clarity_level': 'Clarity of the problem definition (1-10 scale)',
+        'cause_effect_visibility': 'Visibility of cause and effect relationships (1-10 scale)',
+        'stakeholder_alignment': 'Stakeholder alignment on the issue (1-10 scale)',
+        'time_pressure': 'Urgency or time pressure (1-10 scale)',
+        'failure_impact': 'Potential impact of failure (1-10 scale)',
+        'additional_notes': 'Additional context (optional)'
+    }, ('clarity_level', 'cause_effect_visibility', 'stakeholder_alignment', 'time_pressure', 'failure_impact')),
+)
+
+
+def _declares_entry_points(group: str) -> bool:
+    """Cheap scan of installed distribution metadata for an entry point group
+
+    Importing importlib.metadata costs tens of milliseconds, so it is skipped entirely
+    unless some distribution on sys.path actually declares the group.
+    """
+    marker = f'[{group}]'
+    for directory in sys.path:
+        try:
+            entries = os.scandir(directory or '.')
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(('.dist-info', '.egg-info')):
+                    continue
+                try:
+                    with open(os.path.join(entry.path, 'entry_points.txt')) as f:
+                        if marker in f.read():
+                            return True
+                except OSError:
+                    continue
+    return False
+
+
+class FrameworkRegistry(Mapping):
+    """Mapping of framework key to framework instance, created on first access
+
+    Metadata lookups (``spec``, ``specs``, ``in``, iteration) never import framework
+    implementations. Indexing instantiates the framework once and reuses the instance.
+    """
+
+    def __init__(self, specs: Tuple[FrameworkSpec, ...] = BUILTIN_FRAMEWORKS,
+                 entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        self._specs = {spec.key: spec for spec in specs}
+        self._instances = {}
+        self._plugins = None  # key -> entry point, discovered on demand
+        self._entry_point_group = entry_point_group
+        self._on_load: List[Callable[[Any], None]] = []
+
+    def register(self, spec: FrameworkSpec) -> None:
+        """Add or replace a framework; replacing drops any instance already created"""
+        self._specs[spec.key] = spec
+        self._instances.pop(spec.key, None)
+
+    def on_load(self, callback: Callable[[Any], None]) -> None:
+        """Run ``callback`` on every framework instance, including ones already created"""
+        self._on_load.append(callback)
+        for framework in self._instances.values():
+            callback(framework)
+
+    def spec(self, key: str) -> FrameworkSpec:
+        """Metadata for a framework, raising KeyError for unknown keys"""
+        if key not in self._specs and key in self._discover():
+            self._load_plugin(key)
+        return self._specs[key]
+
+    def specs(self) -> Dict[str, FrameworkSpec]:
+        """Metadata for every framework, built-ins first"""
+        for key in self._discover():
+            if key not in self._specs:
+                self._load_plugin(key)
+        return dict(self._specs)
+
+    def key_for(self, name: str) -> Optional[str]:
+        """Key of the framework with this display name (as stored with its results), or None"""
+        for key, spec in self.specs().items():
+            if spec.name == name:
+                return key
+        return None
+    
+    def loaded(self) -> Dict[str, Any]:
+        """Instances created so far"""
+        return dict(self._instances)
+
+    def __getitem__(self, key: str):
+        framework = self._instances.get(key)
+        if framework is None:
+            framework = self._create(self.spec(key))
+        return framework
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._specs or key in self._discover()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.specs())
+
+    def __len__(self) -> int:
+        return len(self.specs())
+
+    def _create(self, spec: FrameworkSpec):
+        framework = spec.load()()
+        framework.key = spec.key
+        self._instances[spec.key] = framework
+        for callback in self._on_load:
+            callback(framework)
+        return framework
+
+    def _discover(self) -> Dict[str, Any]:
+        if self._plugins is None:
+            self._plugins = {}
+            if self._entry_point_group and _declares_entry_points(self._entry_point_group):
+                from importlib.metadata import entry_points
+                for entry_point in entry_points(group=self._entry_point_group):
+                    # Built-in keys cannot be shadowed by plugins
+                    if entry_point.name not in self._specs:
+                        self._plugins[entry_point.name] = entry_point
+        return self._plugins
+
+    def _load_plugin(self, key: str) -> None:
+        """Resolve a plugin entry point to a spec; a plain class is instantiated to read its metadata"""
+        entry_point = self._plugins[key]
+        loaded = entry_point.load()
+        if isinstance(loaded, FrameworkSpec):
+            self._specs[key] = FrameworkSpec(key, loaded.name, loaded.target, loaded.inputs, loaded.batch_fields)
+            return
+        framework = loaded()
+        framework.key = key
+        self._specs[key] = FrameworkSpec(key, framework.name, entry_point.value,
+                                         framework.get_required_inputs(), getattr(framework, 'batch_fields', ()))
+        self._instances[key] = framework
+        for callback in self._on_load:
+            callback(framework)
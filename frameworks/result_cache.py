@@ -0,0 +1,231 @@
+"""Memoization of framework results keyed by a canonical hash of their inputs"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from numbers import Number
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+# Numeric arrays of at least this many elements are hashed from their bytes, not element by element
+ARRAY_DIGEST_MIN_SIZE = 256
+
+
+def normalize_inputs(value: Any) -> Any:
+    """Normalize inputs so equivalent submissions hash identically
+
+    Numbers (including NumPy scalars) become floats, empty strings and None values
+    are dropped from mappings, and tuples and arrays become lists. Strings are kept
+    verbatim because frameworks echo them back in their results. Large numeric arrays
+    (nested lists such as payoff matrices) are replaced by their shape and a SHA-256
+    of their float64 values, which costs a fraction of walking every element.
+    """
+    if isinstance(value, dict):
+        return {str(key): normalize_inputs(item) for key, item in value.items()
+                if item is not None and not (isinstance(item, str) and item == '')}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        digest = _array_digest(value)
+        if digest is not None:
+            return digest
+    if isinstance(value, (list, tuple)):
+        return [normalize_inputs(item) for item in value]
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, Number):
+        return float(value)
+    if hasattr(value, 'tolist'):
+        return normalize_inputs(value.tolist())
+    return value
+
+
+def _array_digest(value: Any) -> Optional[Dict[str, Any]]:
+    """Shape and hash of a large numeric array, or None for anything else"""
+    # Short flat lists are common and cheaper to walk than to convert
+    nested = len(value) > 0 and isinstance(value[0], (list, tuple))
+    if not isinstance(value, np.ndarray) and not nested and len(value) < ARRAY_DIGEST_MIN_SIZE:
+        return None
+    try:
+        array = np.asarray(value)
+    except ValueError:  # ragged nesting
+        return None
+    if array.dtype.kind not in 'iuf' or array.size < ARRAY_DIGEST_MIN_SIZE:
+        return None
+    data = np.ascontiguousarray(array, dtype=np.float64)
+    return {'__array__': list(data.shape), 'sha256': hashlib.sha256(data.tobytes()).hexdigest()}
+
+
+def canonical_hash(inputs: Dict[str, Any]) -> str:
+    """SHA-256 of the normalized inputs serialized with sorted keys"""
+    canonical = json.dumps(normalize_inputs(inputs), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Bounded LRU of pickled framework results with TTL expiry and an optional SQLite tier
+
+    The in-memory tier is limited both by entry count and by total pickled size. The
+    on-disk tier lives in ``disk_dir`` and is shared by every process pointing at it;
+    memory misses fall through to it and hits are promoted back into memory. Every
+    ``PRUNE_EVERY`` writes, expired disk rows are deleted and the oldest written rows
+    beyond ``max_disk_entries`` are evicted.
+    """
+
+    FILENAME = 'result_cache.sqlite3'
+    # Writes between two prunes of the disk tier
+    PRUNE_EVERY = 1000
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: Optional[float] = 3600.0, disk_dir: Optional[str] = None,
+                 max_disk_entries: int = 100000):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()  # key -> (expires_at, pickled result)
+        self._bytes = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'evictions': 0, 'expirations': 0,
+                          'disk_evictions': 0}
+
+        self._conn = None
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(disk_dir, self.FILENAME),
+                                         check_same_thread=False, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA busy_timeout=5000')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, expires_at REAL, value BLOB NOT NULL)'
+            )
+
+    def get(self, key: str) -> Any:
+        """Return a fresh copy of the cached result, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] is not None and entry[0] <= now:
+                    self._discard(key)
+                    self._counters['expirations'] += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._counters['hits'] += 1
+                    return pickle.loads(entry[1])
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    'SELECT expires_at, value FROM results WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+                    (key, now)
+                ).fetchone()
+                if row is not None:
+                    self._store(key, row[0], row[1])
+                    self._counters['hits'] += 1
+                    self._counters['disk_hits'] += 1
+                    return pickle.loads(row[1])
+
+            self._counters['misses'] += 1
+        return None
+
+    def set(self, key: str, result: Any) -> None:
+        """Cache a result under the key, evicting least recently used entries as needed"""
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._store(key, expires_at, payload)
+            if self._conn is not None:
+                self._conn.execute('INSERT OR REPLACE INTO results (key, expires_at, value) VALUES (?, ?, ?)',
+                                   (key, expires_at, payload))
+                self._writes += 1
+                if self._writes % self.PRUNE_EVERY == 0:
+                    self._prune_disk(time.time())
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM results')
+
+    def prune(self) -> int:
+        """Remove expired entries from both tiers, returning how many were removed"""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items()
+                       if expires_at is not None and expires_at <= now]
+            for key in expired:
+                self._discard(key)
+            self._counters['expirations'] += len(expired)
+            removed = len(expired)
+            if self._conn is not None:
+                removed += self._prune_disk(now)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current memory usage"""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': self._counters['hits'] / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'disk': self._conn is not None,
+                'max_disk_entries': self.max_disk_entries
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _store(self, key: str, expires_at: Optional[float], payload: bytes) -> None:
+        """Insert into the memory tier; caller holds the lock"""
+        if len(payload) > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (expires_at, payload)
+        self._bytes += len(payload)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._counters['evictions'] += 1
+
+    def _prune_disk(self, now: float) -> int:
+        """Delete expired rows, then the oldest written rows over the cap; caller holds the lock"""
+        removed = self._conn.execute('DELETE FROM results WHERE expires_at <= ?', (now,)).rowcount
+        excess = self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0] - self.max_disk_entries
+        if excess > 0:
+            # INSERT OR REPLACE gives a rewritten key a new rowid, so rowid order is write order
+            evicted = self._conn.execute(
+                'DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY rowid LIMIT ?)', (excess,)
+            ).rowcount
+            self._counters['disk_evictions'] += evicted
+            removed += evicted
+        return removed
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def __getstate__(self):
+        # Worker processes start with an empty memory tier and open their own disk connection
+        return {'max_entries': self.max_entries, 'max_bytes': self.max_bytes, 'ttl': self.ttl,
+                'disk_dir': self.disk_dir, 'max_disk_entries': self.max_disk_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
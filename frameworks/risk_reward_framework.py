@@ -1,12 +1,17 @@
 """Risk-Reward Framework Implementation"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+import numpy as np
 from .framework_base import Framework, FrameworkResult
 
 
 class RiskRewardFramework(Framework):
     """Risk-Reward Matrix Framework for portfolio analysis"""
     
+    batch_fields = ['risk_level', 'reward_potential', 'resource_requirements',
+                    'success_probability', 'roi_projection']
+    derived_visualizations = ('risk_reward_matrix', 'metrics_chart')
+    
     def __init__(self):
         super().__init__("Risk-Reward Framework")
     
@@ -99,19 +104,6 @@ class RiskRewardFramework(Framework):
         else:
             recommendations.append("Low priority: Limited upside potential")
         
-        visualizations = {
-            'risk_reward_matrix': {
-                'risk': risk,
-                'reward': reward,
-                'quadrant': quadrant
-            },
-            'metrics_chart': {
-                'risk_adjusted_return': risk_adjusted_return,
-                'efficiency_ratio': efficiency_ratio,
-                'expected_value': expected_value
-            }
-        }
-        
         additional_data = {
             'quadrant': quadrant,
             'priority': priority,
@@ -125,10 +117,62 @@ class RiskRewardFramework(Framework):
             framework_name=self.name,
             scores=scores,
             recommendations=recommendations,
-            visualizations=visualizations,
+            visualizations=self.build_visualizations({'scores': scores, 'additional_data': additional_data}),
             overall_score=overall_score,
             additional_data=additional_data
         )
     
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Range-check numeric columns; descriptions and time horizon are not needed in batch mode"""
+        return (self._in_range(columns, ['risk_level', 'reward_potential', 'resource_requirements'], 1, 10) &
+                self._in_range(columns, ['success_probability'], 0, 100) &
+                ~np.isnan(columns['roi_projection']))
+    
+    def calculate_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        risk = columns['risk_level']
+        reward = columns['reward_potential']
+        resources = columns['resource_requirements']
+        success_prob = columns['success_probability'] / 100
+        roi = columns['roi_projection']
+        
+        risk_adjusted_return = reward * success_prob
+        positive_resources = resources > 0
+        efficiency_ratio = np.where(positive_resources,
+                                    risk_adjusted_return / np.where(positive_resources, resources, 1.0), 0.0)
+        expected_value = roi * success_prob
+        
+        low_risk = risk <= 5
+        low_reward = reward <= 5
+        conditions = [low_risk & low_reward, low_risk, low_reward]
+        
+        return {
+            'risk_level': risk,
+            'reward_potential': reward,
+            'risk_adjusted_return': risk_adjusted_return,
+            'efficiency_ratio': efficiency_ratio,
+            'expected_value': expected_value,
+            'resource_requirements': resources,
+            'success_probability': success_prob,
+            'overall_score': (risk_adjusted_return + efficiency_ratio) / 2,
+            'quadrant': np.select(conditions, ['Low Risk, Low Reward', 'Low Risk, High Reward',
+                                               'High Risk, Low Reward'], 'High Risk, High Reward'),
+            'priority': np.select(conditions, ['Low', 'High', 'Very Low'], 'Medium')
+        }
+    
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        scores = result['scores']
+        return {
+            'risk_reward_matrix': {
+                'risk': scores['risk_level'],
+                'reward': scores['reward_potential'],
+                'quadrant': result['additional_data']['quadrant']
+            },
+            'metrics_chart': {
+                'risk_adjusted_return': scores['risk_adjusted_return'],
+                'efficiency_ratio': scores['efficiency_ratio'],
+                'expected_value': scores['expected_value']
+            }
+        }
+    
     def get_visualization_data(self) -> Dict[str, Any]:
         return self.result.visualizations if self.result else {}
\ No newline at end of file
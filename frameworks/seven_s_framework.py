@@ -1,12 +1,16 @@
 """McKinsey 7S Framework Implementation"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+import numpy as np
 from .framework_base import Framework, FrameworkResult
 
 
 class SevenSFramework(Framework):
     """McKinsey 7S Framework for organizational alignment analysis"""
     
+    batch_fields = ['strategy', 'structure', 'systems', 'shared_values', 'style', 'staff', 'skills']
+    derived_visualizations = ('radar_chart', 'bar_chart', 'alignment_gauge')
+    
     def __init__(self):
         super().__init__("McKinsey 7S Framework")
         self.s_elements = [
@@ -48,24 +52,6 @@ class SevenSFramework(Framework):
         # Generate recommendations based on scores
         recommendations = self._generate_recommendations(scores, overall_score)
         
-        # Prepare visualization data
-        visualizations = {
-            'radar_chart': {
-                'labels': [s.replace('_', ' ').title() for s in self.s_elements],
-                'values': list(scores.values()),
-                'max_value': 10
-            },
-            'bar_chart': {
-                'categories': list(scores.keys()),
-                'values': list(scores.values())
-            },
-            'alignment_gauge': {
-                'score': overall_score,
-                'max_score': 10,
-                'threshold': 7.5
-            }
-        }
-        
         additional_data = {
             'weak_areas': [k for k, v in scores.items() if v < 6],
             'strong_areas': [k for k, v in scores.items() if v >= 8],
@@ -77,11 +63,33 @@ class SevenSFramework(Framework):
             framework_name=self.name,
             scores=scores,
             recommendations=recommendations,
-            visualizations=visualizations,
+            visualizations=self.build_visualizations({'scores': scores, 'overall_score': overall_score}),
             overall_score=overall_score,
             additional_data=additional_data
         )
     
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        return self._in_range(columns, self.s_elements, 1, 10)
+    
+    def calculate_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Vectorized 7S scoring; weak/strong masks have one column per element in s_elements order"""
+        scores = np.column_stack([columns[element] for element in self.s_elements])
+        
+        # Accumulate left to right so the mean matches sum() in calculate bit for bit
+        total = np.zeros(len(scores))
+        for i in range(len(self.s_elements)):
+            total = total + scores[:, i]
+        overall_score = total / len(self.s_elements)
+        
+        result = {element: columns[element] for element in self.s_elements}
+        result.update({
+            'overall_score': overall_score,
+            'weak_mask': scores < 6,
+            'strong_mask': scores >= 8,
+            'alignment_status': np.where(overall_score >= 7.5, 'Strong', 'Weak')
+        })
+        return result
+    
     def _generate_recommendations(self, scores: Dict[str, float], overall_score: float) -> List[str]:
         """Generate recommendations based on 7S scores"""
         recommendations = []
@@ -120,6 +128,26 @@ class SevenSFramework(Framework):
         
         return recommendations
     
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        """Radar, bar and gauge chart data, all drawn from the element scores"""
+        values = [result['scores'][element] for element in self.s_elements]
+        return {
+            'radar_chart': {
+                'labels': [s.replace('_', ' ').title() for s in self.s_elements],
+                'values': values,
+                'max_value': 10
+            },
+            'bar_chart': {
+                'categories': list(self.s_elements),
+                'values': list(values)
+            },
+            'alignment_gauge': {
+                'score': result['overall_score'],
+                'max_score': 10,
+                'threshold': 7.5
+            }
+        }
+    
     def get_visualization_data(self) -> Dict[str, Any]:
         """Return visualization data for the 7S framework"""
         if not self.result:
@@ -0,0 +1,242 @@
+"""Monte Carlo simulation of framework results under uncertain inputs"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Union
+
+import numpy as np
+
+from .framework_base import Framework
+
+
+@dataclass
+class Distribution:
+    """Probability distribution for a single framework input"""
+    kind: str
+    params: Dict[str, float]
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+    KINDS = ('uniform', 'triangular', 'normal', 'beta')
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Draw samples, clipped to [low, high] when bounds are given"""
+        p = self.params
+        if self.kind == 'uniform':
+            values = rng.uniform(p['low'], p['high'], size)
+        elif self.kind == 'triangular':
+            values = rng.triangular(p['low'], p['mode'], p['high'], size)
+        elif self.kind == 'normal':
+            values = rng.normal(p['mean'], p['std'], size)
+        elif self.kind == 'beta':
+            # Beta samples live in [0, 1] and are rescaled onto [scale_low, scale_high]
+            scale_low = p.get('scale_low', 0.0)
+            scale_high = p.get('scale_high', 1.0)
+            values = scale_low + rng.beta(p['a'], p['b'], size) * (scale_high - scale_low)
+        else:
+            raise ValueError(f"Unknown distribution '{self.kind}'. Available: {', '.join(self.KINDS)}")
+
+        if self.low is not None or self.high is not None:
+            values = np.clip(values, self.low, self.high)
+        return values
+
+
+def uniform(low: float, high: float) -> Distribution:
+    return Distribution('uniform', {'low': low, 'high': high})
+
+
+def triangular(low: float, mode: float, high: float) -> Distribution:
+    return Distribution('triangular', {'low': low, 'mode': mode, 'high': high})
+
+
+def normal(mean: float, std: float, low: float = None, high: float = None) -> Distribution:
+    return Distribution('normal', {'mean': mean, 'std': std}, low, high)
+
+
+def beta(a: float, b: float, low: float = 0.0, high: float = 1.0) -> Distribution:
+    return Distribution('beta', {'a': a, 'b': b, 'scale_low': low, 'scale_high': high})
+
+
+InputSpec = Union[Distribution, float, int, Dict[str, Any]]
+
+
+def parse_distribution(spec: InputSpec) -> Union[Distribution, float]:
+    """Build a Distribution from a JSON-style spec such as {'dist': 'triangular', 'low': 1, 'mode': 4, 'high': 6}
+
+    Plain numbers are treated as fixed values.
+    """
+    if isinstance(spec, (Distribution, int, float)):
+        return spec
+    spec = dict(spec)
+    kind = spec.pop('dist', spec.pop('kind', None))
+    bounds = {key: spec.pop(key) for key in ('clip_low', 'clip_high') if key in spec}
+    builders = {'uniform': uniform, 'triangular': triangular, 'normal': normal, 'beta': beta}
+    if kind not in builders:
+        raise ValueError(f"Unknown distribution '{kind}'. Available: {', '.join(builders)}")
+    distribution = builders[kind](**spec)
+    distribution.low = bounds.get('clip_low', distribution.low)
+    distribution.high = bounds.get('clip_high', distribution.high)
+    return distribution
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated outcome of a Monte Carlo run"""
+    framework_name: str
+    n_samples: int
+    valid_samples: int
+    seed: Optional[int]
+    metrics: Dict[str, Dict[str, Any]]
+    category_probabilities: Dict[str, Dict[str, float]]
+    mask_probabilities: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    samples: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation without raw samples"""
+        return {
+            'framework_name': self.framework_name,
+            'n_samples': self.n_samples,
+            'valid_samples': self.valid_samples,
+            'seed': self.seed,
+            'metrics': self.metrics,
+            'category_probabilities': self.category_probabilities,
+            'mask_probabilities': self.mask_probabilities
+        }
+
+
+def _count_labels(values: np.ndarray) -> Dict[str, int]:
+    """Count occurrences of each label; faster than np.unique for the handful of classes frameworks emit"""
+    counts = {}
+    remaining = values
+    while len(remaining):
+        label = remaining[0]
+        matches = remaining == label
+        counts[str(label)] = int(matches.sum())
+        remaining = remaining[~matches]
+    return counts
+
+
+def _simulate_chunk(framework: Framework, inputs: Dict[str, Union[Distribution, float]],
+                    size: int, seed_sequence: np.random.SeedSequence) -> Dict[str, Any]:
+    """Sample one chunk of inputs, evaluate it and return raw numeric columns and category counts"""
+    rng = np.random.default_rng(seed_sequence)
+    columns = {}
+    for name in framework.batch_fields:
+        spec = inputs[name]
+        columns[name] = spec.sample(rng, size) if isinstance(spec, Distribution) else np.full(size, float(spec))
+
+    # Samples outside the framework's valid input ranges are rejected rather than clipped silently
+    valid = framework.validate_batch(columns)
+    if not valid.all():
+        columns = {name: column[valid] for name, column in columns.items()}
+    output = framework.calculate_batch(columns)
+
+    chunk = {'valid': int(valid.sum()), 'numeric': {}, 'categories': {}, 'masks': {}}
+    for name, values in output.items():
+        if values.dtype.kind == 'U':
+            chunk['categories'][name] = _count_labels(values)
+        elif values.dtype == bool and values.ndim == 2:
+            chunk['masks'][name] = values.sum(axis=0)
+        elif values.dtype.kind == 'f' and values.ndim == 1:
+            chunk['numeric'][name] = values
+    return chunk
+
+
+class MonteCarloSimulator:
+    """Propagates input uncertainty through a framework's vectorized calculation
+
+    Samples are drawn in fixed-size chunks, each with its own child of a single
+    ``SeedSequence``, so results are reproducible for a given seed regardless of
+    how many worker processes evaluate the chunks.
+    """
+
+    DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(self, framework: Framework, n_samples: int = 10000, seed: Optional[int] = None,
+                 chunk_size: int = 100000, workers: int = 1,
+                 percentiles: List[float] = DEFAULT_PERCENTILES, keep_samples: bool = False):
+        if not framework.batch_fields:
+            raise ValueError(f"{framework.name} does not support batch evaluation")
+        if n_samples < 1 or chunk_size < 1:
+            raise ValueError("n_samples and chunk_size must be at least 1")
+        self.framework = framework
+        self.n_samples = n_samples
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.percentiles = list(percentiles)
+        self.keep_samples = keep_samples
+
+    def run(self, inputs: Dict[str, InputSpec]) -> SimulationResult:
+        """Simulate the framework for inputs given as distributions or fixed values"""
+        parsed = {name: parse_distribution(spec) for name, spec in inputs.items()}
+        missing = [name for name in self.framework.batch_fields if name not in parsed]
+        if missing:
+            raise ValueError(f"Missing inputs: {', '.join(missing)}")
+
+        sizes = [self.chunk_size] * (self.n_samples // self.chunk_size)
+        if self.n_samples % self.chunk_size:
+            sizes.append(self.n_samples % self.chunk_size)
+        seed_sequences = np.random.SeedSequence(self.seed).spawn(len(sizes))
+
+        args = ([self.framework] * len(sizes), [parsed] * len(sizes), sizes, seed_sequences)
+        if self.workers > 1 and len(sizes) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                chunks = list(executor.map(_simulate_chunk, *args))
+        else:
+            chunks = list(map(_simulate_chunk, *args))
+
+        return self._aggregate(chunks)
+
+    def _aggregate(self, chunks: List[Dict[str, Any]]) -> SimulationResult:
+        valid = sum(chunk['valid'] for chunk in chunks)
+
+        metrics = {}
+        samples = {}
+        for name in chunks[0]['numeric']:
+            values = np.concatenate([chunk['numeric'][name] for chunk in chunks])
+            if not len(values):
+                continue
+            bands = np.percentile(values, self.percentiles)
+            metrics[name] = {
+                'mean': float(values.mean()),
+                'std': float(values.std()),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                'percentiles': {f"p{p:g}": float(v) for p, v in zip(self.percentiles, bands)}
+            }
+            if self.keep_samples:
+                samples[name] = values
+
+        category_probabilities = {}
+        for name in chunks[0]['categories']:
+            counts = {}
+            for chunk in chunks:
+                for label, count in chunk['categories'][name].items():
+                    counts[label] = counts.get(label, 0) + count
+            category_probabilities[name] = {label: count / valid for label, count in sorted(counts.items())}
+
+        mask_probabilities = {}
+        for name in chunks[0]['masks']:
+            totals = sum(chunk['masks'][name] for chunk in chunks)
+            mask_probabilities[name] = {
+                element: float(total) / valid
+                for element, total in zip(self.framework.batch_fields, totals)
+            } if valid else {}
+
+        return SimulationResult(
+            framework_name=self.framework.name,
+            n_samples=self.n_samples,
+            valid_samples=valid,
+            seed=self.seed,
+            metrics=metrics,
+            category_probabilities=category_probabilities,
+            mask_probabilities=mask_probabilities,
+            samples=samples
+        )
+
+
+def simulate(framework: Framework, inputs: Dict[str, InputSpec], n_samples: int = 10000,
+             seed: Optional[int] = None, **kwargs) -> SimulationResult:
+    """Convenience wrapper around MonteCarloSimulator.run"""
+    return MonteCarloSimulator(framework, n_samples=n_samples, seed=seed, **kwargs).run(inputs)
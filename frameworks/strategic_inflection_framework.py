@@ -1,12 +1,17 @@
 """Strategic Inflection Points Framework Implementation"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+import numpy as np
 from .framework_base import Framework, FrameworkResult
 
 
 class StrategicInflectionFramework(Framework):
     """Andy Grove's Strategic Inflection Points Framework"""
     
+    batch_fields = ['market_signals', 'competitive_shifts', 'technology_impact',
+                    'business_model_threat', 'internal_performance', 'frontline_feedback']
+    derived_visualizations = ('risk_matrix', 'radar_chart')
+    
     def __init__(self):
         super().__init__("Strategic Inflection Points Framework")
     
@@ -74,18 +79,6 @@ class StrategicInflectionFramework(Framework):
         else:
             recommendations.append("Continue current strategy with monitoring")
         
-        visualizations = {
-            'risk_matrix': {
-                'threat_score': threat_score,
-                'readiness_score': readiness_score,
-                'overall_risk': overall_risk
-            },
-            'radar_chart': {
-                'labels': [field.replace('_', ' ').title() for field in score_fields],
-                'values': list(scores.values())
-            }
-        }
-        
         additional_data = {
             'decision': decision,
             'risk_level': risk_level,
@@ -99,10 +92,49 @@ class StrategicInflectionFramework(Framework):
             framework_name=self.name,
             scores=scores,
             recommendations=recommendations,
-            visualizations=visualizations,
+            visualizations=self.build_visualizations({'scores': scores, 'overall_score': overall_risk,
+                                                      'additional_data': additional_data}),
             overall_score=overall_risk,
             additional_data=additional_data
         )
     
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Range-check the score columns; the free-text signal description is not needed in batch mode"""
+        return self._in_range(columns, self.batch_fields, 1, 10)
+    
+    def calculate_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        threat_score = (columns['market_signals'] + columns['competitive_shifts'] +
+                        columns['technology_impact'] + columns['business_model_threat']) / 4
+        
+        readiness_score = (columns['internal_performance'] + columns['frontline_feedback']) / 2
+        
+        overall_risk = np.clip(threat_score - readiness_score + 5, 1, 10)
+        
+        conditions = [overall_risk >= 7, overall_risk >= 5]
+        
+        result = {field: columns[field] for field in self.batch_fields}
+        result.update({
+            'threat_score': threat_score,
+            'readiness_score': readiness_score,
+            'overall_score': overall_risk,
+            'decision': np.select(conditions, ['Transform', 'Prepare'], 'Defend'),
+            'risk_level': np.select(conditions, ['High', 'Medium'], 'Low')
+        })
+        return result
+    
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        additional_data = result['additional_data']
+        return {
+            'risk_matrix': {
+                'threat_score': additional_data['threat_score'],
+                'readiness_score': additional_data['readiness_score'],
+                'overall_risk': result['overall_score']
+            },
+            'radar_chart': {
+                'labels': [field.replace('_', ' ').title() for field in self.batch_fields],
+                'values': [result['scores'][field] for field in self.batch_fields]
+            }
+        }
+    
     def get_visualization_data(self) -> Dict[str, Any]:
         return self.result.visualizations if self.result else {}
\ No newline at end of file
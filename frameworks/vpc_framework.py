@@ -1,12 +1,16 @@
 """VPC (Value-Price-Cost) Framework Implementation"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+import numpy as np
 from .framework_base import Framework, FrameworkResult
 
 
 class VPCFramework(Framework):
     """Value-Price-Cost Framework for business model analysis"""
     
+    batch_fields = ['cost', 'price', 'value']
+    derived_visualizations = ('triangle', 'metrics')
+    
     def __init__(self):
         super().__init__("VPC Framework")
     
@@ -62,22 +66,54 @@ class VPCFramework(Framework):
             f"Value premium: {value_premium:.1f}%"
         ]
         
-        visualizations = {
-            'triangle': {
-                'cost': cost,
-                'price': price,
-                'value': value
-            },
-            'metrics': scores
-        }
-        
         return FrameworkResult(
             framework_name=self.name,
             scores=scores,
             recommendations=recommendations,
-            visualizations=visualizations,
+            visualizations=self.build_visualizations({'scores': scores}),
             additional_data={'strategy': strategy}
         )
     
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        return (columns['cost'] > 0) & (columns['price'] > 0) & (columns['value'] > 0)
+    
+    def calculate_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        cost = columns['cost']
+        price = columns['price']
+        value = columns['value']
+        
+        margin = price - cost
+        positive_price = price > 0
+        safe_price = np.where(positive_price, price, 1.0)
+        margin_percent = np.where(positive_price, (margin / safe_price) * 100, 0.0)
+        value_premium = np.where(positive_price, (value - price) / safe_price * 100, 0.0)
+        
+        strategy = np.select(
+            [(value > price) & (margin > 0), price <= cost, margin_percent < 10],
+            ['Differentiation', 'Loss Leader', 'Cost Leadership'],
+            'Balanced'
+        )
+        
+        return {
+            'cost': cost,
+            'price': price,
+            'value': value,
+            'margin': margin,
+            'margin_percent': margin_percent,
+            'value_premium': value_premium,
+            'strategy': strategy
+        }
+    
+    def build_visualizations(self, result: Mapping[str, Any]) -> Dict[str, Any]:
+        scores = result['scores']
+        return {
+            'triangle': {
+                'cost': scores['cost'],
+                'price': scores['price'],
+                'value': scores['value']
+            },
+            'metrics': dict(scores)
+        }
+    
     def get_visualization_data(self) -> Dict[str, Any]:
         return self.result.visualizations if self.result else {}
\ No newline at end of file